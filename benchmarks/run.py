@@ -0,0 +1,421 @@
+"""
+오프라인 벤치마크 (answer_question → save_to_notion 전체 경로)
+
+가짜 LLM과 로컬 Notion/imgbb 대역 서버를 사용하므로 네트워크와 API Key 없이
+같은 조건으로 반복 측정할 수 있습니다. 실제 설정/캐시를 건드리지 않도록 임시 HOME에서 실행합니다.
+
+    uv run python -m benchmarks.run
+    uv run python -m benchmarks.run -s images -s batch -n 10 --llm-latency 1.0
+    uv run python -m benchmarks.run -o results.json --baseline baseline.json
+"""
+
+import os
+import tempfile
+
+# gonagi_saa가 설정 디렉토리를 정하기 전에 임시 HOME과 가짜 API Key 지정
+_HOME = tempfile.mkdtemp(prefix="gonagi-saa-bench-")
+os.environ["HOME"] = _HOME
+os.environ.update(
+    {
+        "GONAGI_SAA_NOTION_API_KEY": "secret_benchmark",
+        "GONAGI_SAA_NOTION_DATABASE_ID": "00000000000000000000000000000000",
+        "GONAGI_SAA_IMGBB_API_KEY": "benchmark",
+        "GONAGI_SAA_OPENAI_API_KEY": "sk-benchmark",
+        "GONAGI_SAA_SYNC_ON_STARTUP": "false",
+    }
+)
+
+import json
+import math
+import resource
+import shutil
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from notion_client import Client as NotionClient
+from PIL import Image
+
+from benchmarks.stubs import SAMPLE_ANSWER, FakeChatModel, ImgbbStub, NotionStub
+from gonagi_saa import batch, services, utils
+from gonagi_saa.batch import BatchItem, run_batch
+from gonagi_saa.models import QnAModel
+from gonagi_saa.services import answer_question, save_to_notion
+from gonagi_saa.settings import settings
+
+SCENARIOS = ("text", "images", "history", "batch", "upload")
+
+app = typer.Typer(add_completion=False)
+
+
+@dataclass
+class ScenarioResult:
+    """시나리오 측정 결과 (시간 단위: 초)"""
+
+    name: str
+    iterations: int
+    operations: int
+    elapsed: float
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    peak_memory_mb: float = 0.0
+    notion_requests: int = 0
+    imgbb_requests: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리한 질문 수"""
+        return self.operations / self.elapsed if self.elapsed > 0 else 0.0
+
+    def percentile(self, stage: str, q: float) -> float:
+        """지연 시간 백분위수 (nearest-rank)"""
+        ordered = sorted(self.latencies.get(stage, []))
+        if not ordered:
+            return 0.0
+        rank = max(math.ceil(q / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["throughput"] = self.throughput
+        data["percentiles"] = {
+            stage: {f"p{q}": self.percentile(stage, q) for q in (50, 95, 99)}
+            for stage in self.latencies
+        }
+        return data
+
+
+@dataclass
+class Environment:
+    """벤치마크 실행 환경 (대역 서버와 Notion 클라이언트)"""
+
+    notion: NotionStub
+    imgbb: ImgbbStub
+    notion_client: NotionClient
+    work_dir: Path
+    stream: bool
+    model: str = "gpt-4o"
+
+
+def _install(
+    env: Environment, first_token_latency: float, token_delay: float
+) -> None:
+    """LLM, imgbb, Notion 호출이 대역을 향하도록 교체"""
+    fake = FakeChatModel(first_token_latency=first_token_latency, token_delay=token_delay)
+    services.llm_model_factory = lambda name: fake
+    utils.IMGBB_UPLOAD_URL = f"{env.imgbb.url}/1/upload"
+    batch.get_notion_client = lambda: env.notion_client
+
+
+def _make_image(path: Path, width: int, height: int, quality: int = 92) -> Path:
+    """압축이 잘 되지 않는 큰 JPEG 생성 (스마트폰 사진 크기)"""
+    noise = Image.effect_noise((width // 4, height // 4), 64).convert("RGB")
+    noise.resize((width, height), Image.Resampling.BICUBIC).save(path, quality=quality)
+    return path
+
+
+def _fresh_copy(source: Path, target: Path, salt: int) -> str:
+    """
+    내용 해시가 다른 이미지 사본 생성
+
+    JPEG 끝에 바이트를 덧붙이면 이미지는 그대로지만 해시가 달라지므로
+    매 반복마다 인코딩/업로드 캐시를 거치지 않는 경로를 측정할 수 있습니다.
+    """
+    shutil.copyfile(source, target)
+    with open(target, "ab") as f:
+        f.write(salt.to_bytes(8, "big"))
+    return str(target)
+
+
+def _long_history(turns: int) -> list[QnAModel]:
+    return [
+        QnAModel(question=f"이전 질문 {turn}: " + "NAT Gateway와 인터넷 게이트웨이 " * 20, **SAMPLE_ANSWER)
+        for turn in range(turns)
+    ]
+
+
+def _run_iterations(
+    name: str,
+    iterations: int,
+    run_once: Callable[[int, dict[str, list[float]]], None],
+    env: Environment,
+    questions_per_iteration: int = 1,
+) -> ScenarioResult:
+    """시나리오를 반복 실행하고 지연 시간, 처리량, 메모리 측정"""
+    # 첫 실행(모듈 초기화, 연결 수립)은 측정에서 제외
+    run_once(-1, {})
+
+    notion_before, imgbb_before = env.notion.requests, env.imgbb.requests
+    latencies: dict[str, list[float]] = {}
+    started_at = time.perf_counter()
+    for index in range(iterations):
+        run_once(index, latencies)
+    elapsed = time.perf_counter() - started_at
+    notion_requests = env.notion.requests - notion_before
+    imgbb_requests = env.imgbb.requests - imgbb_before
+
+    # 메모리는 tracemalloc 오버헤드가 지연 시간에 섞이지 않도록 따로 한 번 측정
+    tracemalloc.start()
+    run_once(iterations, {})
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return ScenarioResult(
+        name=name,
+        iterations=iterations,
+        operations=iterations * questions_per_iteration,
+        elapsed=elapsed,
+        latencies=latencies,
+        peak_memory_mb=peak / 1024 / 1024,
+        notion_requests=notion_requests,
+        imgbb_requests=imgbb_requests,
+    )
+
+
+def _timed(latencies: dict[str, list[float]], stage: str, func: Callable, *args, **kwargs):
+    started_at = time.perf_counter()
+    result = func(*args, **kwargs)
+    latencies.setdefault(stage, []).append(time.perf_counter() - started_at)
+    return result
+
+
+def _ask_and_save(
+    env: Environment,
+    question: str,
+    image_paths: list[str] | None,
+    history: list[QnAModel] | None,
+    latencies: dict[str, list[float]],
+) -> None:
+    started_at = time.perf_counter()
+    qna = _timed(
+        latencies,
+        "answer",
+        answer_question,
+        env.model,
+        question,
+        image_paths,
+        history,
+        on_partial=(lambda partial: None) if env.stream else None,
+        use_cache=False,
+        verbose=False,
+        hedge=False,
+    )
+    _timed(
+        latencies,
+        "save",
+        save_to_notion,
+        env.notion_client,
+        qna,
+        "benchmark",
+        image_paths,
+        verbose=False,
+    )
+    latencies.setdefault("total", []).append(time.perf_counter() - started_at)
+
+
+def scenario_text(env: Environment, iterations: int) -> ScenarioResult:
+    """텍스트 질문 1건 → 답변 → Notion 저장"""
+
+    def run_once(index: int, latencies: dict[str, list[float]]) -> None:
+        _ask_and_save(env, f"VPC와 Subnet의 차이점은? ({index})", None, None, latencies)
+
+    return _run_iterations("text", iterations, run_once, env)
+
+
+def scenario_images(env: Environment, iterations: int) -> ScenarioResult:
+    """큰 이미지 3장(4032x3024)을 첨부한 질문 (매 반복마다 새 이미지로 캐시 없이)"""
+    sources = [
+        _make_image(env.work_dir / f"source-{i}.jpg", 4032, 3024) for i in range(3)
+    ]
+
+    def run_once(index: int, latencies: dict[str, list[float]]) -> None:
+        paths = [
+            _fresh_copy(source, env.work_dir / f"image-{index}-{i}.jpg", index + 1)
+            for i, source in enumerate(sources)
+        ]
+        _ask_and_save(env, f"이 아키텍처의 문제점은? ({index})", paths, None, latencies)
+        for path in paths:
+            Path(path).unlink()
+
+    return _run_iterations("images", iterations, run_once, env)
+
+
+def scenario_history(env: Environment, iterations: int) -> ScenarioResult:
+    """이전 대화 20턴이 쌓인 상태에서의 후속 질문"""
+    history = _long_history(20)
+
+    def run_once(index: int, latencies: dict[str, list[float]]) -> None:
+        _ask_and_save(
+            env, f"그럼 Private Subnet의 인터넷 접근은? ({index})", None, history, latencies
+        )
+
+    return _run_iterations("history", iterations, run_once, env)
+
+
+def scenario_batch(env: Environment, iterations: int, size: int = 20, workers: int = 4) -> ScenarioResult:
+    """질문 size건을 workers개 작업으로 배치 처리하고 Notion에 저장 (반복 1회 = 배치 1회)"""
+
+    def run_once(index: int, latencies: dict[str, list[float]]) -> None:
+        items = [
+            BatchItem(id=f"{index}-{i}", question=f"배치 질문 {index}-{i}") for i in range(size)
+        ]
+        summary = _timed(
+            latencies,
+            "batch",
+            run_batch,
+            items,
+            env.work_dir / f"batch-{index}.jsonl",
+            env.model,
+            workers=workers,
+            requests_per_minute=60_000,
+            session_id="benchmark",
+            use_cache=False,
+            resume=False,
+            hedge=False,
+        )
+        latencies.setdefault("item", []).extend(summary.latencies)
+
+    return _run_iterations("batch", iterations, run_once, env, questions_per_iteration=size)
+
+
+def scenario_upload(env: Environment, iterations: int) -> ScenarioResult:
+    """
+    전처리 없이 원본 그대로 올리는 큰 이미지(8000x6000, 약 23MB) imgbb 업로드
+
+    최대 메모리가 이미지 크기보다 훨씬 작으면 파일을 통째로 읽거나 base64로
+    복사하지 않고 스트리밍으로 보내고 있다는 뜻입니다.
+    """
+    source = _make_image(env.work_dir / "upload-source.jpg", 8000, 6000, quality=95)
+
+    def run_once(index: int, latencies: dict[str, list[float]]) -> None:
+        path = _fresh_copy(source, env.work_dir / f"upload-{index}.jpg", index + 1)
+        _timed(latencies, "upload", utils.upload_image_to_imgbb, path, "benchmark")
+        Path(path).unlink()
+
+    optimize_images = settings.optimize_images
+    settings.optimize_images = False
+    try:
+        return _run_iterations("upload", iterations, run_once, env)
+    finally:
+        settings.optimize_images = optimize_images
+
+
+def _report(result: ScenarioResult) -> None:
+    typer.secho(f"\n📊 {result.name}", bold=True)
+    for stage in result.latencies:
+        typer.echo(
+            f"  - {stage}: p50 {result.percentile(stage, 50) * 1000:,.1f}ms · "
+            f"p95 {result.percentile(stage, 95) * 1000:,.1f}ms · "
+            f"p99 {result.percentile(stage, 99) * 1000:,.1f}ms"
+        )
+    typer.echo(
+        f"  - 처리량 {result.throughput:.2f}건/초 · 최대 메모리(Python) {result.peak_memory_mb:,.1f}MB · "
+        f"Notion 요청 {result.notion_requests}건 · imgbb 요청 {result.imgbb_requests}건"
+    )
+
+
+def _regressions(
+    results: list[ScenarioResult], baseline: dict, tolerance: float
+) -> list[str]:
+    """기준 결과보다 p50/p95가 tolerance 이상 느려진 단계"""
+    found = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        for stage, percentiles in base["percentiles"].items():
+            for key in ("p50", "p95"):
+                before = percentiles[key]
+                after = result.percentile(stage, int(key[1:]))
+                if before > 0 and after > before * (1 + tolerance):
+                    found.append(
+                        f"{result.name}.{stage} {key}: {before * 1000:,.1f}ms → {after * 1000:,.1f}ms "
+                        f"(+{after / before - 1:.0%})"
+                    )
+    return found
+
+
+@app.command()
+def main(
+    scenarios: Annotated[
+        list[str] | None,
+        typer.Option("--scenario", "-s", help=f"실행할 시나리오 ({', '.join(SCENARIOS)})"),
+    ] = None,
+    iterations: Annotated[int, typer.Option("--iterations", "-n", help="시나리오별 반복 횟수")] = 20,
+    llm_latency: Annotated[float, typer.Option(help="가짜 LLM의 첫 토큰까지 지연(초)")] = 0.3,
+    token_delay: Annotated[float, typer.Option(help="가짜 LLM의 청크 간 지연(초)")] = 0.001,
+    notion_latency: Annotated[float, typer.Option(help="Notion 대역의 요청당 지연(초)")] = 0.05,
+    imgbb_latency: Annotated[float, typer.Option(help="imgbb 대역의 요청당 지연(초)")] = 0.1,
+    stream: Annotated[bool, typer.Option("--stream/--no-stream", help="스트리밍으로 답변 생성")] = True,
+    output: Annotated[Path | None, typer.Option("--output", "-o", help="결과 JSON 저장 경로")] = None,
+    baseline: Annotated[Path | None, typer.Option(help="비교할 이전 결과 JSON")] = None,
+    tolerance: Annotated[float, typer.Option(help="회귀로 판단할 지연 증가 비율")] = 0.2,
+):
+    """가짜 LLM과 로컬 대역 서버로 질문→답변→저장 경로를 측정합니다."""
+    selected = scenarios or list(SCENARIOS)
+    unknown = [name for name in selected if name not in SCENARIOS]
+    if unknown:
+        typer.secho(f"❌ 알 수 없는 시나리오: {', '.join(unknown)}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+
+    notion = NotionStub("notion", latency=notion_latency).start()
+    imgbb = ImgbbStub("imgbb", latency=imgbb_latency).start()
+    env = Environment(
+        notion=notion,
+        imgbb=imgbb,
+        notion_client=NotionClient(auth="secret_benchmark", base_url=notion.url),
+        work_dir=Path(_HOME) / "work",
+        stream=stream,
+    )
+    env.work_dir.mkdir()
+    _install(env, llm_latency, token_delay)
+
+    typer.echo(
+        f"🧪 시나리오 {', '.join(selected)} · {iterations}회 · LLM 첫 토큰 {llm_latency}s · "
+        f"Notion {notion_latency}s · imgbb {imgbb_latency}s · {'스트리밍' if stream else '일괄'}"
+    )
+
+    runners = {
+        "text": scenario_text,
+        "images": scenario_images,
+        "history": scenario_history,
+        "batch": scenario_batch,
+        "upload": scenario_upload,
+    }
+    results = []
+    try:
+        for name in selected:
+            result = runners[name](env, iterations)
+            results.append(result)
+            _report(result)
+    finally:
+        notion.stop()
+        imgbb.stop()
+        shutil.rmtree(_HOME, ignore_errors=True)
+
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    if sys.platform == "darwin":
+        max_rss_mb /= 1024
+    typer.echo(f"\n💾 프로세스 최대 RSS: {max_rss_mb:,.1f}MB")
+
+    if output is not None:
+        data = {result.name: result.to_dict() for result in results}
+        output.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        typer.echo(f"📝 결과를 저장했습니다: {output}")
+
+    if baseline is not None:
+        found = _regressions(results, json.loads(baseline.read_text(encoding="utf-8")), tolerance)
+        if found:
+            typer.secho("⚠️  성능 회귀:", fg=typer.colors.YELLOW)
+            for line in found:
+                typer.echo(f"  - {line}")
+            raise typer.Exit(code=1)
+        typer.echo("✅ 기준 결과 대비 회귀 없음")
+
+
+if __name__ == "__main__":
+    app()
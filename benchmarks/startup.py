@@ -0,0 +1,101 @@
+"""
+서브커맨드별 시작 시간 측정
+
+각 명령을 새 프로세스로 여러 번 실행해 벽시계 시간을 재고, `-X importtime`으로
+import 비용이 큰 모듈을 함께 보여 줍니다. 네트워크를 쓰지 않는 명령만 실행하며
+실제 설정/캐시를 건드리지 않도록 임시 HOME에서 실행합니다.
+
+    uv run python -m benchmarks.startup
+    uv run python -m benchmarks.startup -n 20 --top 5
+"""
+
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Annotated
+
+import typer
+
+# (이름, CLI 인자) — 모두 네트워크 없이 끝나는 명령
+COMMANDS: list[tuple[str, list[str]]] = [
+    ("--help", ["--help"]),
+    ("config path", ["config", "path"]),
+    ("cache stats", ["cache", "stats"]),
+    ("stats", ["stats"]),
+    ("sync (빈 아웃박스)", ["sync"]),
+    ("ask --help", ["ask", "--help"]),
+    ("batch --help", ["batch", "--help"]),
+]
+
+_IMPORTTIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+app = typer.Typer(add_completion=False)
+
+
+def _run(args: list[str], env: dict[str, str], importtime: bool = False) -> subprocess.CompletedProcess:
+    flags = ["-X", "importtime"] if importtime else []
+    return subprocess.run(
+        [sys.executable, *flags, "-m", "gonagi_saa.cli", *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+
+def _top_imports(stderr: str, top: int) -> list[tuple[str, float]]:
+    """CLI가 직접 불러온 모듈 중 누적 import 시간이 큰 순서"""
+    imports = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match is None:
+            continue
+        _, cumulative, indent, module = match.groups()
+        # 들여쓰기 1칸 = 최상위 import (하위 모듈은 누적 시간에 포함됨)
+        if len(indent) == 1:
+            imports.append((module, int(cumulative) / 1000))
+    return sorted(imports, key=lambda item: -item[1])[:top]
+
+
+@app.command()
+def main(
+    repeat: Annotated[int, typer.Option("--repeat", "-n", help="명령별 실행 횟수")] = 10,
+    top: Annotated[int, typer.Option(help="명령별로 보여 줄 import 비용 상위 모듈 수 (0이면 생략)")] = 3,
+):
+    """서브커맨드별 시작 시간(중앙값/최솟값)과 import 비용이 큰 모듈을 출력합니다."""
+    home = tempfile.mkdtemp(prefix="gonagi-saa-startup-")
+    env = {**os.environ, "HOME": home, "GONAGI_SAA_SYNC_ON_STARTUP": "false"}
+
+    try:
+        # 바이트코드 캐시를 만들어 두고 측정 (첫 실행의 컴파일 시간 제외)
+        _run(["--help"], env)
+
+        typer.echo(f"🚀 명령별 시작 시간 ({repeat}회, {sys.executable})")
+        for name, args in COMMANDS:
+            durations = []
+            for _ in range(repeat):
+                started_at = time.perf_counter()
+                result = _run(args, env)
+                durations.append(time.perf_counter() - started_at)
+
+            status = "" if result.returncode == 0 else f" (종료 코드 {result.returncode})"
+            typer.echo(
+                f"  - {name}: 중앙값 {statistics.median(durations) * 1000:,.0f}ms · "
+                f"최소 {min(durations) * 1000:,.0f}ms{status}"
+            )
+
+            if top:
+                profile = _run(args, env, importtime=True)
+                for module, ms in _top_imports(profile.stderr, top):
+                    typer.secho(f"      {module}: {ms:,.1f}ms", fg=typer.colors.BRIGHT_BLACK)
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    app()
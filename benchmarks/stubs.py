@@ -0,0 +1,265 @@
+"""벤치마크용 로컬 대역 (가짜 LLM, Notion API 서버, imgbb 서버)"""
+
+import asyncio
+import base64
+import json
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, BinaryIO
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import Field
+
+# 가짜 모델이 돌려주는 답변 (실제 답변과 비슷한 길이)
+SAMPLE_ANSWER: dict[str, Any] = {
+    "title": "AWS VPC와 Subnet의 핵심 차이점",
+    "answer": (
+        "## 개념\n\n"
+        + "VPC는 AWS 계정 전용의 논리적으로 격리된 가상 네트워크이며, "
+        "Subnet은 VPC의 IP 주소 범위를 가용 영역 단위로 나눈 구간입니다.\n\n" * 8
+        + "| 구분 | VPC | Subnet |\n|---|---|---|\n| 범위 | 리전 | 가용 영역 |\n"
+    ),
+    "exam_tips": ["Public/Private 구분은 라우팅 테이블의 IGW 경로로 결정됩니다."] * 3,
+    "common_traps": ["Subnet은 여러 가용 영역에 걸칠 수 없습니다."] * 3,
+    "tags": ["VPC", "Subnet", "Networking"],
+}
+
+TOOL_NAME = "QnAAnswerModel"
+
+
+def _estimate_tokens(messages: list[BaseMessage]) -> int:
+    """입력 메시지 크기로 대략적인 토큰 수 추정 (이미지는 1장당 1,000토큰으로 계산)"""
+    tokens = 0
+    for message in messages:
+        if isinstance(message.content, str):
+            tokens += len(message.content) // 4
+            continue
+        for part in message.content:
+            if isinstance(part, dict) and part.get("type") == "image_url":
+                tokens += 1000
+            elif isinstance(part, dict):
+                tokens += len(str(part.get("text", ""))) // 4
+    return tokens
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    지연 시간을 흉내 내는 가짜 채팅 모델
+
+    첫 토큰까지 first_token_latency초, 이후 chunk_size 글자마다 token_delay초가 걸립니다.
+    bind_tools로 도구가 바인딩되면 네이티브 구조화 출력처럼 도구 호출로 답합니다.
+    """
+
+    first_token_latency: float = 0.5
+    token_delay: float = 0.002
+    chunk_size: int = 16
+    answer: dict[str, Any] = Field(default_factory=lambda: dict(SAMPLE_ANSWER))
+    tools_bound: bool = False
+
+    @property
+    def _llm_type(self) -> str:
+        return "gonagi-saa-benchmark"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "FakeChatModel":  # type: ignore[override]
+        return self.model_copy(update={"tools_bound": True})
+
+    def _payload(self) -> str:
+        # 파서 경로에서도 question은 answer_question이 원본 질문으로 덮어씀
+        if self.tools_bound:
+            return json.dumps(self.answer, ensure_ascii=False)
+        return json.dumps({**self.answer, "question": ""}, ensure_ascii=False)
+
+    def _chunks(self, payload: str) -> list[str]:
+        return [
+            payload[start : start + self.chunk_size]
+            for start in range(0, len(payload), self.chunk_size)
+        ]
+
+    def _message(self, messages: list[BaseMessage], payload: str) -> AIMessage:
+        usage = {
+            "input_tokens": _estimate_tokens(messages),
+            "output_tokens": len(payload) // 4,
+            "total_tokens": _estimate_tokens(messages) + len(payload) // 4,
+        }
+        if self.tools_bound:
+            return AIMessage(
+                content="",
+                tool_calls=[{"name": TOOL_NAME, "args": json.loads(payload), "id": "call_0"}],
+                usage_metadata=usage,  # type: ignore[arg-type]
+            )
+        return AIMessage(content=payload, usage_metadata=usage)  # type: ignore[arg-type]
+
+    def _chunk(self, index: int, text: str) -> ChatGenerationChunk:
+        if self.tools_bound:
+            return ChatGenerationChunk(
+                message=AIMessageChunk(
+                    content="",
+                    tool_call_chunks=[
+                        {
+                            "name": TOOL_NAME if index == 0 else None,
+                            "args": text,
+                            "id": "call_0" if index == 0 else None,
+                            "index": 0,
+                        }
+                    ],
+                )
+            )
+        return ChatGenerationChunk(message=AIMessageChunk(content=text))
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        payload = self._payload()
+        time.sleep(self.first_token_latency + self.token_delay * len(self._chunks(payload)))
+        return ChatResult(generations=[ChatGeneration(message=self._message(messages, payload))])
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        payload = self._payload()
+        await asyncio.sleep(
+            self.first_token_latency + self.token_delay * len(self._chunks(payload))
+        )
+        return ChatResult(generations=[ChatGeneration(message=self._message(messages, payload))])
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        payload = self._payload()
+        time.sleep(self.first_token_latency)
+        for index, text in enumerate(self._chunks(payload)):
+            if index:
+                time.sleep(self.token_delay)
+            yield self._chunk(index, text)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        payload = self._payload()
+        await asyncio.sleep(self.first_token_latency)
+        for index, text in enumerate(self._chunks(payload)):
+            if index:
+                await asyncio.sleep(self.token_delay)
+            yield self._chunk(index, text)
+
+
+@dataclass
+class StubServer:
+    """로컬 HTTP 대역 서버 (요청마다 latency초 지연 후 응답)"""
+
+    name: str
+    latency: float = 0.0
+    requests: int = 0
+    bytes_received: int = 0
+    _server: ThreadingHTTPServer | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None, "서버가 시작되지 않았습니다."
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = stub.read_body(self.rfile, length)
+                with stub._lock:
+                    stub.requests += 1
+                    stub.bytes_received += length
+                if stub.latency:
+                    time.sleep(stub.latency)
+                status, payload = stub.respond(self.command, self.path, body)
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PATCH = _handle
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def read_body(self, rfile: BinaryIO, length: int) -> bytes:
+        return rfile.read(length) if length else b""
+
+    def respond(self, method: str, path: str, body: bytes) -> tuple[int, dict]:
+        raise NotImplementedError
+
+
+class NotionStub(StubServer):
+    """Notion API 대역 (pages.create, blocks.children.append, databases.query/retrieve/update, pages.update)"""
+
+    def respond(self, method: str, path: str, body: bytes) -> tuple[int, dict]:
+        if method == "POST" and path == "/v1/pages":
+            return 200, {"object": "page", "id": str(uuid.uuid4())}
+        if method == "PATCH" and path.startswith("/v1/blocks/"):
+            return 200, {"object": "list", "results": []}
+        if method == "PATCH" and path.startswith("/v1/pages/"):
+            return 200, {"object": "page", "id": path.rsplit("/", 1)[-1]}
+        if method in ("GET", "PATCH") and path.startswith("/v1/databases/"):
+            return 200, {"object": "database", "properties": {"Entry": {"type": "rich_text"}}}
+        if method == "POST" and path.startswith("/v1/databases/"):
+            return 200, {"object": "list", "results": [], "has_more": False, "next_cursor": None}
+        return 404, {"object": "error", "status": 404, "code": "object_not_found", "message": path}
+
+
+class ImgbbStub(StubServer):
+    """imgbb 업로드 API 대역"""
+
+    def read_body(self, rfile: BinaryIO, length: int) -> bytes:
+        # 대역 서버도 같은 프로세스에서 돌므로 본문을 버리며 읽어 클라이언트 메모리 측정에 섞이지 않게 함
+        while length > 0:
+            chunk = rfile.read(min(length, 64 * 1024))
+            if not chunk:
+                break
+            length -= len(chunk)
+        return b""
+
+    def respond(self, method: str, path: str, body: bytes) -> tuple[int, dict]:
+        image_id = base64.urlsafe_b64encode(uuid.uuid4().bytes[:6]).decode()
+        return 200, {"data": {"url": f"https://i.ibb.co/{image_id}/image.jpg"}, "success": True}
@@ -1,3 +1,8 @@
 """gonagi-saa: AWS SAA 시험 대비를 위한 멀티모달 Q&A CLI 도구"""
 
+import time
+
 __version__ = "0.1.0"
+
+# 패키지를 처음 import한 시각 (`--profile`에서 시작 시간 측정용)
+STARTED_NS = time.perf_counter_ns()
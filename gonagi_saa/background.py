@@ -0,0 +1,93 @@
+"""백그라운드 저장 작업 큐"""
+
+import queue
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class SaveFailure:
+    """실패한 저장 작업"""
+
+    label: str
+    error: Exception
+
+
+class BackgroundSaver:
+    """저장 작업을 백그라운드 스레드 하나에서 제출 순서대로 처리"""
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[tuple[str, Callable[[], Any]]] = queue.Queue()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._failures: list[SaveFailure] = []
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return self.submitted - self.completed - self.failed
+
+    def submit(self, label: str, job: Callable[[], Any]) -> None:
+        """저장 작업 추가 (워커 스레드는 처음 제출할 때 시작)"""
+        with self._condition:
+            self.submitted += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name="gonagi-saa-saver", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((label, job))
+
+    def status_line(self) -> str | None:
+        """진행 상황 한 줄 요약 (제출된 작업이 없으면 None)"""
+        with self._condition:
+            if self.submitted == 0:
+                return None
+            pending = self.submitted - self.completed - self.failed
+            return f"💾 Notion 저장: 대기 {pending} · 완료 {self.completed} · 실패 {self.failed}"
+
+    def pop_failures(self) -> list[SaveFailure]:
+        """아직 알리지 않은 실패 목록을 반환하고 비움"""
+        with self._condition:
+            failures, self._failures = self._failures, []
+            return failures
+
+    def drain(self, on_progress: Callable[[int, int], None] | None = None) -> None:
+        """
+        대기 중인 작업이 모두 끝날 때까지 대기
+
+        작업이 하나 끝날 때마다 on_progress(끝난 작업 수, 전체 작업 수)를 호출합니다.
+        """
+        with self._condition:
+            total = self.submitted - self.completed - self.failed
+            finished_before = self.completed + self.failed
+            reported = 0
+            while self.completed + self.failed < self.submitted:
+                # 타임아웃을 두어 Ctrl+C가 바로 전달되도록 함
+                self._condition.wait(timeout=0.2)
+                finished = self.completed + self.failed - finished_before
+                if on_progress is not None and finished > reported:
+                    reported = finished
+                    on_progress(finished, total)
+
+    def _worker(self) -> None:
+        while True:
+            label, job = self._queue.get()
+            try:
+                job()
+            except Exception as e:
+                with self._condition:
+                    self.failed += 1
+                    self._failures.append(SaveFailure(label, e))
+                    self._condition.notify_all()
+            else:
+                with self._condition:
+                    self.completed += 1
+                    self._condition.notify_all()
+            finally:
+                self._queue.task_done()
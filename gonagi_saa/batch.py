@@ -0,0 +1,280 @@
+"""배치 처리 (JSONL/CSV로 읽은 질문을 동시에 답변 생성)"""
+
+import csv
+import json
+import math
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from gonagi_saa.constants import DEFAULT_REQUESTS_PER_MINUTE
+from gonagi_saa.models import QnAModel
+from gonagi_saa.outbox import Outbox
+from gonagi_saa.ratelimit import get_rate_limiter
+from gonagi_saa.search import index_answer
+from gonagi_saa.settings import settings
+from gonagi_saa.utils import get_model_provider, get_notion_client
+
+
+@dataclass
+class BatchItem:
+    """배치 입력 항목"""
+
+    id: str
+    question: str
+    image_paths: list[str] = field(default_factory=list)
+
+
+@dataclass
+class BatchResult:
+    """배치 항목 처리 결과"""
+
+    item: BatchItem
+    qna: QnAModel | None
+    error: str | None
+    latency: float
+    page_id: str | None = None
+    save_error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.qna is not None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BatchResult":
+        """to_json으로 기록한 결과 복원 (데몬이 보낸 결과를 CLI에서 출력할 때 사용)"""
+        return cls(
+            item=BatchItem(data["id"], data["question"], data["images"]),
+            qna=QnAModel.model_validate(data["result"]) if data["result"] is not None else None,
+            error=data["error"],
+            latency=data["latency"],
+            page_id=data["page_id"],
+            save_error=data["save_error"],
+        )
+
+    def to_json(self, model_name: str) -> str:
+        return json.dumps(
+            {
+                "id": self.item.id,
+                "status": "ok" if self.ok else "error",
+                "model": model_name,
+                "question": self.item.question,
+                "images": self.item.image_paths,
+                "result": self.qna.model_dump() if self.qna is not None else None,
+                "error": self.error,
+                "latency": round(self.latency, 3),
+                "page_id": self.page_id,
+                "save_error": self.save_error,
+            },
+            ensure_ascii=False,
+        )
+
+
+@dataclass
+class BatchSummary:
+    """배치 실행 요약"""
+
+    total: int
+    skipped: int
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        processed = self.succeeded + self.failed
+        return processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def percentile(self, q: float) -> float:
+        """지연 시간 백분위수 (nearest-rank)"""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(math.ceil(q / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+
+def _parse_images(value: object, base_dir: Path) -> list[str]:
+    """이미지 경로 목록 파싱 (리스트 또는 ';'로 구분된 문자열, 상대 경로는 입력 파일 기준)"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(";")
+    paths = []
+    for raw in value if isinstance(value, list) else []:
+        raw = str(raw).strip()
+        if not raw:
+            continue
+        path = Path(raw).expanduser()
+        if not path.is_absolute():
+            path = base_dir / path
+        paths.append(str(path))
+    return paths
+
+
+def load_batch_items(path: Path) -> list[BatchItem]:
+    """
+    JSONL 또는 CSV 파일에서 질문 목록 읽기
+
+    각 항목은 question(필수), id, images(경로 리스트 또는 ';'로 구분된 문자열)를 가집니다.
+    id가 없으면 입력 순서(1부터)를 id로 사용합니다.
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 question이 없는 항목이 있는 경우
+    """
+    base_dir = path.resolve().parent
+    if path.suffix.lower() == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            records: list[dict] = list(csv.DictReader(f))
+    else:
+        records = []
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{line_number}번째 줄이 올바른 JSON이 아닙니다: {e}")
+
+    items = []
+    for index, record in enumerate(records, start=1):
+        question = str(record.get("question") or "").strip()
+        if not question:
+            raise ValueError(f"{index}번째 항목에 question이 없습니다.")
+        items.append(
+            BatchItem(
+                id=str(record.get("id") or index),
+                question=question,
+                image_paths=_parse_images(record.get("images"), base_dir),
+            )
+        )
+    return items
+
+
+def completed_item_ids(output_path: Path) -> set[str]:
+    """출력 파일에서 이미 성공한 항목 id (이어서 실행할 때 건너뜀)"""
+    if not output_path.exists():
+        return set()
+
+    completed = set()
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # 중단되며 잘린 마지막 줄은 무시
+                continue
+            if record.get("status") == "ok":
+                completed.add(str(record["id"]))
+    return completed
+
+
+def run_batch(
+    items: list[BatchItem],
+    output_path: Path,
+    model_name: str,
+    workers: int = 4,
+    requests_per_minute: float | None = None,
+    session_id: str | None = None,
+    use_cache: bool = True,
+    resume: bool = True,
+    hedge: bool = True,
+    on_result: Callable[[BatchResult], None] | None = None,
+) -> BatchSummary:
+    """
+    질문들을 동시에 답변 생성하고 끝나는 대로 출력 JSONL에 기록
+
+    - 모델 제공자별 분당 요청 수로 속도 제한 (requests_per_minute로 덮어쓰기)
+    - resume=True이면 출력 파일에서 이미 성공한 항목은 건너뜀
+    - session_id가 주어지면 답변을 아웃박스에 기록하고 Notion에 저장
+    """
+    # services는 LLM 관련 모듈까지 불러오므로 실제로 처리할 때만 import
+    from gonagi_saa.services import answer_question
+
+    provider = get_model_provider(model_name)
+    rpm = requests_per_minute or settings.requests_per_minute.get(
+        provider, DEFAULT_REQUESTS_PER_MINUTE[provider]
+    )
+    limiter = get_rate_limiter(f"llm:{provider}", rpm / 60)
+
+    done = completed_item_ids(output_path) if resume else set()
+    pending = [item for item in items if item.id not in done]
+    summary = BatchSummary(total=len(items), skipped=len(items) - len(pending))
+
+    outbox = Outbox() if session_id is not None else None
+    notion_client = get_notion_client() if session_id is not None else None
+
+    def process(item: BatchItem) -> BatchResult:
+        limiter.acquire()
+        started_at = time.perf_counter()
+        try:
+            qna = answer_question(
+                model_name,
+                item.question,
+                item.image_paths or None,
+                use_cache=use_cache,
+                verbose=False,
+                hedge=hedge,
+            )
+        except Exception as e:
+            return BatchResult(item, None, str(e), time.perf_counter() - started_at)
+
+        result = BatchResult(item, qna, None, time.perf_counter() - started_at)
+        index_answer(qna, session_id or f"batch-{output_path.stem}", model_name)
+        if outbox is not None and notion_client is not None and session_id is not None:
+            entry_id = outbox.enqueue(qna, session_id, item.image_paths or None)
+            try:
+                result.page_id = outbox.send(notion_client, entry_id, verbose=False)
+            except Exception as e:
+                # 답변은 아웃박스에 남아 있으므로 `gonagi-saa sync`로 재시도 가능
+                result.save_error = str(e)
+        return result
+
+    write_lock = threading.Lock()
+    started_at = time.perf_counter()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "a" if resume else "w", encoding="utf-8") as output:
+
+        def record(result: BatchResult) -> None:
+            with write_lock:
+                output.write(result.to_json(model_name) + "\n")
+                output.flush()
+
+            if result.ok:
+                summary.succeeded += 1
+                summary.latencies.append(result.latency)
+            else:
+                summary.failed += 1
+
+        executor = ThreadPoolExecutor(max_workers=max(workers, 1))
+        futures = [executor.submit(process, item) for item in pending]
+        recorded: set[Future[BatchResult]] = set()
+        try:
+            for future in as_completed(futures):
+                result = future.result()
+                record(result)
+                recorded.add(future)
+                if on_result is not None:
+                    on_result(result)
+        except BaseException:
+            # 중단(Ctrl+C, 클라이언트 연결 끊김 등)되면 아직 시작하지 않은 항목은 취소하고,
+            # 이미 실행 중인 항목은 비용을 치렀으므로 끝나는 대로 결과를 기록한 뒤 다시 던짐
+            executor.shutdown(wait=False, cancel_futures=True)
+            for future in futures:
+                if future in recorded or future.cancelled():
+                    continue
+                try:
+                    record(future.result())
+                except Exception:
+                    pass
+            raise
+        finally:
+            executor.shutdown(wait=False)
+
+    summary.elapsed = time.perf_counter() - started_at
+    return summary
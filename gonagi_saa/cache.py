@@ -0,0 +1,203 @@
+"""답변 디스크 캐시 (SQLite, LRU 제거)"""
+
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from gonagi_saa.image_store import image_store
+from gonagi_saa.models import QnAModel
+from gonagi_saa.settings import settings
+from gonagi_saa.storage import connect
+
+# history는 LangChain 메시지를 불러오므로 타입 확인에만 사용 (`cache stats` 시작 시간 단축)
+if TYPE_CHECKING:
+    from gonagi_saa.history import HistoryWindow
+
+CACHE_DB = "cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS answers_accessed_at ON answers (accessed_at);
+"""
+
+
+@dataclass
+class CacheStats:
+    """캐시 통계"""
+
+    entries: int
+    total_bytes: int
+    hits: int
+    oldest: float | None
+    newest: float | None
+    models: dict[str, int]
+
+
+def _settings_fingerprint() -> dict[str, bool]:
+    """답변 내용(출력 방식, 태그, 이미지 입력)을 바꾸는 설정 (바꾸면 이전 답변을 쓰지 않도록)"""
+    return {
+        "native_structured_output": settings.native_structured_output,
+        "local_tags": settings.local_tags,
+        "optimize_images": settings.optimize_images,
+    }
+
+
+def make_cache_key(
+    model_name: str,
+    question: str,
+    image_paths: list[str] | None = None,
+    history: "HistoryWindow | None" = None,
+    hedge_model: str | None = None,
+) -> str:
+    """
+    모델명, 정규화된 질문, 프롬프트에 들어간 히스토리의 다이제스트, 이미지 해시와
+    답변에 영향을 주는 설정으로 캐시 키 생성
+
+    hedge_model은 실제로 헤지 요청에 쓰는 모델로, 헤지 모델이 답한 결과가
+    헤지 없이(또는 다른 헤지 모델로) 요청한 질문의 답변으로 재사용되지 않도록 키에 포함합니다.
+    """
+    history_messages = history.to_messages() if history is not None else []
+    history_digest = hashlib.sha256(
+        json.dumps(
+            [[message.type, message.content] for message in history_messages],
+            ensure_ascii=False,
+        ).encode("utf-8")
+    ).hexdigest()
+
+    key_material = {
+        "model": model_name,
+        "hedge_model": hedge_model,
+        "question": " ".join(question.split()),
+        "history": history_digest,
+        "images": [image_store.digest(path) for path in image_paths or []],
+        "settings": _settings_fingerprint(),
+    }
+    return hashlib.sha256(
+        json.dumps(key_material, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+class AnswerCache:
+    """CONFIG_DIR 아래 SQLite에 답변을 저장하는 캐시 (크기/기간 기반 LRU 제거)"""
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        max_age_seconds: float | None = None,
+    ) -> None:
+        self.max_bytes = (
+            max_bytes if max_bytes is not None else settings.cache_max_mb * 1024 * 1024
+        )
+        self.max_age_seconds = (
+            max_age_seconds
+            if max_age_seconds is not None
+            else settings.cache_max_age_days * 24 * 60 * 60
+        )
+        self._conn = connect(CACHE_DB)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get(self, key: str) -> QnAModel | None:
+        """캐시된 답변 조회 (만료된 항목은 없는 것으로 취급)"""
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT payload, created_at FROM answers WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        if now - row["created_at"] > self.max_age_seconds:
+            with self._conn:
+                self._conn.execute("DELETE FROM answers WHERE key = ?", (key,))
+            return None
+
+        with self._conn:
+            self._conn.execute(
+                "UPDATE answers SET accessed_at = ?, hits = hits + 1 WHERE key = ?",
+                (now, key),
+            )
+        return QnAModel.model_validate_json(row["payload"])
+
+    def put(self, key: str, model_name: str, qna: QnAModel) -> None:
+        """답변 저장 후 한도를 넘는 항목 제거"""
+        now = time.time()
+        payload = qna.model_dump_json()
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO answers
+                    (key, model, payload, size, created_at, accessed_at, hits)
+                VALUES (?, ?, ?, ?, ?, ?, 0)
+                """,
+                (key, model_name, payload, len(payload.encode("utf-8")), now, now),
+            )
+        self.evict()
+
+    def evict(self) -> int:
+        """기간이 지난 항목과, 크기 한도를 넘는 만큼 오래 사용되지 않은 항목 제거"""
+        with self._conn:
+            removed = self._conn.execute(
+                "DELETE FROM answers WHERE created_at < ?",
+                (time.time() - self.max_age_seconds,),
+            ).rowcount
+
+            total = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM answers"
+            ).fetchone()[0]
+            if total <= self.max_bytes:
+                return removed
+
+            stale_keys = []
+            for row in self._conn.execute(
+                "SELECT key, size FROM answers ORDER BY accessed_at"
+            ):
+                if total <= self.max_bytes:
+                    break
+                stale_keys.append((row["key"],))
+                total -= row["size"]
+
+            self._conn.executemany("DELETE FROM answers WHERE key = ?", stale_keys)
+            return removed + len(stale_keys)
+
+    def stats(self) -> CacheStats:
+        """캐시 통계 조회"""
+        row = self._conn.execute(
+            """
+            SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0),
+                   MIN(created_at), MAX(created_at)
+            FROM answers
+            """
+        ).fetchone()
+        models = {
+            model: count
+            for model, count in self._conn.execute(
+                "SELECT model, COUNT(*) FROM answers GROUP BY model ORDER BY 2 DESC"
+            )
+        }
+        return CacheStats(
+            entries=row[0],
+            total_bytes=row[1],
+            hits=row[2],
+            oldest=row[3],
+            newest=row[4],
+            models=models,
+        )
+
+    def clear(self) -> int:
+        """캐시 전체 삭제 후 삭제된 항목 수 반환"""
+        with self._conn:
+            removed = self._conn.execute("DELETE FROM answers").rowcount
+        self._conn.execute("VACUUM")
+        return removed
@@ -2,19 +2,37 @@ import json
 import os
 import sys
 import time
+from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, Annotated, cast
 
-import filetype
 import typer
-from notion_client import Client as NotionClient
-from prompt_toolkit import prompt
-from prompt_toolkit.completion import PathCompleter
 
-from gonagi_saa.settings import CONFIG_DIR, CONFIG_FILE, settings
-from gonagi_saa.services import answer_question, save_to_notion
-from gonagi_saa.utils import is_vision_model, generate_session_id
-from gonagi_saa.constants import MAX_IMAGES
+from gonagi_saa.background import BackgroundSaver
+from gonagi_saa.constants import CONFIG_DIR, CONFIG_FILE, DAEMON_START_TIMEOUT, MAX_IMAGES
+from gonagi_saa.metrics import load_events
+from gonagi_saa.tracing import Tracer, span, start_tracing, stop_tracing
+from gonagi_saa import STARTED_NS
+
+# 설정(pydantic-settings)과 LLM/Notion 관련 모듈은 import 비용이 커서 필요한 명령 안에서
+# 불러옴 (`config path` 같은 명령이 모델 SDK를 불러오느라 느려지지 않도록)
+if TYPE_CHECKING:
+    from gonagi_saa.batch import BatchResult
+    from gonagi_saa.models import QnAModel
+    from gonagi_saa.outbox import Outbox, OutboxEntry
+    from gonagi_saa.sessions import SessionInfo
+
+
+class TraceFormat(str, Enum):
+    """`--trace-format` 선택지"""
+
+    chrome = "chrome"
+    otlp = "otlp"
+
+
+# CLI 모듈 import가 끝난 시각 (`--profile`의 startup.import 구간)
+_IMPORTED_NS = time.perf_counter_ns()
 
 app = typer.Typer()
 config_app = typer.Typer(
@@ -22,6 +40,16 @@ config_app = typer.Typer(
     no_args_is_help=True,
 )
 app.add_typer(config_app, name="config")
+cache_app = typer.Typer(
+    help="답변 캐시를 관리합니다.",
+    no_args_is_help=True,
+)
+app.add_typer(cache_app, name="cache")
+daemon_app = typer.Typer(
+    help="모델과 연결을 미리 띄워 두는 상주 데몬을 관리합니다.",
+    no_args_is_help=True,
+)
+app.add_typer(daemon_app, name="daemon")
 
 
 @config_app.command("path")
@@ -102,156 +130,1045 @@ def config_clean():
         raise typer.Exit(code=1)
 
 
-@app.command()
-def ask():
-    """질문을 입력받아 답변을 생성하고, Notion에 저장할 수 있습니다."""
-    model = settings.default_model
+@cache_app.command("stats")
+def cache_stats():
+    """답변 캐시 통계를 출력합니다."""
+    from gonagi_saa.cache import AnswerCache
+    from gonagi_saa.settings import settings
 
-    # Session ID 생성 및 표시
-    session_id = generate_session_id()
-    typer.secho(f"🔗 Session: {session_id}", fg=typer.colors.CYAN)
+    cache = AnswerCache()
+    try:
+        stats = cache.stats()
+    finally:
+        cache.close()
 
-    # 대화 히스토리
-    history: list = []
+    typer.echo(f"📦 저장된 답변: {stats.entries}개 ({stats.total_bytes / 1024:.1f} KB)")
+    typer.echo(f"⚡ 누적 캐시 적중: {stats.hits}회")
+    if stats.oldest is not None and stats.newest is not None:
+        oldest = time.strftime("%Y-%m-%d %H:%M", time.localtime(stats.oldest))
+        newest = time.strftime("%Y-%m-%d %H:%M", time.localtime(stats.newest))
+        typer.echo(f"🕒 기간: {oldest} ~ {newest}")
+    for model_name, count in stats.models.items():
+        typer.echo(f"  - {model_name}: {count}개")
+    typer.echo(
+        f"⚙️  한도: {settings.cache_max_mb} MB / {settings.cache_max_age_days}일"
+    )
 
-    while True:
-        # 1. 텍스트 질문 입력
-        print("💡 질문을 입력하고 저장하세요!")
-        time.sleep(0.5)
-        question = cast(str | None, typer.edit())
 
-        if question is None or question.strip() == "":
-            typer.echo("❌ 질문이 입력되지 않았습니다.")
-            raise typer.Exit()
+@cache_app.command("clear")
+def cache_clear():
+    """답변 캐시를 모두 삭제합니다."""
+    confirm = typer.confirm("정말로 캐시를 비우시겠습니까? [Y/N]", show_default=False)
+    if not confirm:
+        typer.echo("삭제가 취소되었습니다.")
+        raise typer.Exit()
 
-        # 2. 이미지 추가 여부 확인
-        image_paths: list[str] = []
-        add_images = typer.confirm("📸 이미지를 추가하시겠습니까? [Y/N]", default=False, show_default=False)
+    from gonagi_saa.cache import AnswerCache
 
-        if add_images:
-            if not is_vision_model(model):
-                typer.secho(
-                    f"⚠️  현재 설정된 모델({model})은 이미지를 지원하지 않습니다.",
-                    fg=typer.colors.YELLOW,
-                )
-                typer.echo("텍스트만으로 진행합니다.")
-            else:
-                # PathCompleter로 파일 경로 자동완성 지원
-                path_completer = PathCompleter(expanduser=True)
+    cache = AnswerCache()
+    try:
+        removed = cache.clear()
+    finally:
+        cache.close()
+    typer.secho(f"✅ 캐시된 답변 {removed}개를 삭제했습니다.", fg=typer.colors.GREEN)
 
-                typer.echo("💡 이미지를 추가하세요 (최대 3개, Enter=종료, q=취소)\n")
 
-                for i in range(MAX_IMAGES):
-                    try:
-                        # prompt_toolkit의 prompt 사용 (Tab 자동완성 지원)
-                        image_path = prompt(
-                            f"이미지 경로 ({i + 1}/{MAX_IMAGES}): ",
-                            completer=path_completer,
-                        ).strip()
-                    except (KeyboardInterrupt, EOFError):
-                        # Ctrl+C 또는 Ctrl+D 입력 시 전체 프로세스 중단
-                        typer.echo("\n👋 질문이 취소되었습니다.")
-                        raise typer.Exit()
-
-                    if image_path == "":
-                        break
-
-                    # 취소 명령어 처리
-                    if image_path.lower() in ["q", "quit", "cancel", "exit"]:
-                        typer.echo("👋 질문이 취소되었습니다.")
-                        raise typer.Exit()
-
-                    path = Path(image_path)
-                    if not path.exists():
-                        typer.secho(
-                            f"❌ 이미지 파일을 찾을 수 없습니다: {image_path}",
-                            fg=typer.colors.RED,
-                        )
-                        continue
-
-                    if not path.is_file():
-                        typer.secho(
-                            f"❌ 디렉토리가 아닌 파일을 입력해주세요: {image_path}",
-                            fg=typer.colors.RED,
-                        )
-                        continue
-
-                    # 이미지 파일 타입 확인
-                    kind = filetype.guess(str(path))
-                    if kind is None or not kind.mime.startswith("image/"):
-                        typer.secho(
-                            f"❌ 이미지 파일이 아닙니다: {image_path}",
-                            fg=typer.colors.RED,
-                        )
-                        continue
-
-                    image_paths.append(str(path.absolute()))
-                    typer.secho(f"✅ 이미지 추가됨: {path.name}", fg=typer.colors.GREEN)
-
-        # 3. AI 답변 생성
+@daemon_app.command("start")
+def daemon_start(
+    foreground: Annotated[
+        bool,
+        typer.Option("--foreground", help="백그라운드로 분리하지 않고 현재 터미널에서 실행합니다."),
+    ] = False,
+):
+    """상주 데몬을 시작합니다 (이후 ask/batch는 데몬에 요청만 전달)."""
+    import subprocess
+
+    from gonagi_saa.daemon import LOG_FILE, ping, serve
+
+    status = ping()
+    if status is not None:
+        typer.echo(f"✅ 데몬이 이미 실행 중입니다. (pid {status['pid']})")
+        return
+
+    if foreground:
+        serve()
+        return
+
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOG_FILE, "a", encoding="utf-8") as log:
+        process = subprocess.Popen(
+            [sys.executable, "-u", "-m", "gonagi_saa.daemon"],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+    typer.echo("⏳ 데몬을 시작합니다 (모듈과 모델을 미리 불러오는 중)...")
+    started_at = time.perf_counter()
+    while time.perf_counter() - started_at < DAEMON_START_TIMEOUT:
+        status = ping()
+        if status is not None:
+            typer.secho(
+                f"✅ 데몬이 시작되었습니다. (pid {status['pid']}, "
+                f"{time.perf_counter() - started_at:.1f}초)",
+                fg=typer.colors.GREEN,
+            )
+            return
+        if process.poll() is not None:
+            break
+        time.sleep(0.1)
+
+    typer.secho(f"❌ 데몬을 시작하지 못했습니다. 로그: {LOG_FILE}", fg=typer.colors.RED, err=True)
+    raise typer.Exit(code=1)
+
+
+@daemon_app.command("stop")
+def daemon_stop():
+    """상주 데몬을 종료합니다."""
+    from gonagi_saa.daemon import SOCKET_FILE, DaemonError, DaemonUnavailable, request
+
+    try:
+        status = request("shutdown")
+    except (DaemonUnavailable, DaemonError):
+        typer.echo("💤 실행 중인 데몬이 없습니다.")
+        return
+
+    # 소켓 파일이 지워질 때까지 잠시 대기
+    deadline = time.perf_counter() + 5
+    while SOCKET_FILE.exists() and time.perf_counter() < deadline:
+        time.sleep(0.05)
+    typer.secho(f"✅ 데몬을 종료했습니다. (pid {status['pid']})", fg=typer.colors.GREEN)
+
+
+@daemon_app.command("status")
+def daemon_status():
+    """상주 데몬 실행 상태를 출력합니다."""
+    from gonagi_saa.daemon import SOCKET_FILE, ping
+
+    status = ping()
+    if status is None:
+        typer.echo("💤 실행 중인 데몬이 없습니다. (`gonagi-saa daemon start`로 시작)")
+        raise typer.Exit(code=1)
+
+    typer.echo(f"🟢 데몬 실행 중 (pid {status['pid']}, {SOCKET_FILE})")
+    typer.echo(
+        f"  - 실행 시간 {status['uptime'] / 60:,.1f}분 · 처리한 요청 {status['requests']}건 · "
+        f"모델 {status['model']}"
+    )
+
+
+@app.command()
+def ask(
+    question: Annotated[
+        str | None,
+        typer.Argument(
+            help="질문 (주면 편집기를 열지 않고 한 번만 답변합니다. `-`이면 표준 입력에서 읽음)",
+            show_default=False,
+        ),
+    ] = None,
+    read_stdin: Annotated[
+        bool,
+        typer.Option("--stdin", help="표준 입력에서 질문을 읽어 한 번만 답변합니다."),
+    ] = False,
+    images: Annotated[
+        list[Path] | None,
+        typer.Option(
+            "--image",
+            "-i",
+            exists=True,
+            dir_okay=False,
+            help=f"질문에 첨부할 이미지 (여러 번 지정, 최대 {MAX_IMAGES}개, 비대화형 모드)",
+        ),
+    ] = None,
+    json_output: Annotated[
+        bool,
+        typer.Option("--json", help="답변을 QnAModel JSON으로 표준 출력에 씁니다 (비대화형 모드)."),
+    ] = False,
+    save: Annotated[
+        bool,
+        typer.Option(
+            "--save",
+            help="답변을 바로 Notion에 저장합니다 (대화형 모드에서는 저장 여부를 묻지 않음).",
+        ),
+    ] = False,
+    stream: Annotated[
+        bool,
+        typer.Option("--stream/--no-stream", help="답변을 생성되는 대로 출력합니다."),
+    ] = True,
+    use_cache: Annotated[
+        bool,
+        typer.Option("--cache/--no-cache", help="캐시된 답변을 사용합니다."),
+    ] = True,
+    hedge: Annotated[
+        bool,
+        typer.Option("--hedge/--no-hedge", help="hedge_model이 설정되어 있으면 헤지 요청을 사용합니다."),
+    ] = True,
+    profile: Annotated[
+        bool,
+        typer.Option("--profile", help="종료 시 단계별 소요 시간을 출력합니다."),
+    ] = False,
+    trace_path: Annotated[
+        Path | None,
+        typer.Option("--trace", help="단계별 span을 JSON trace 파일로 저장합니다."),
+    ] = None,
+    trace_format: Annotated[
+        TraceFormat,
+        typer.Option("--trace-format", help="trace 파일 형식"),
+    ] = TraceFormat.chrome,
+    resume: Annotated[
+        str | None,
+        typer.Option(
+            "--resume",
+            "-r",
+            help="저장된 세션을 이어서 질문합니다 (세션 ID 또는 앞부분, `gonagi-saa sessions`로 확인).",
+        ),
+    ] = None,
+):
+    """
+    질문을 입력받아 답변을 생성하고, Notion에 저장할 수 있습니다.
+
+    질문 인자, --stdin, --image, --json 중 하나라도 주면 편집기와 확인 질문 없이
+    한 번만 답변하는 비대화형 모드로 실행됩니다 (스크립트/편집기 연동용).
+    """
+    from gonagi_saa.settings import settings
+
+    model = settings.default_model
+    interactive = question is None and not read_stdin and not images and not json_output
+
+    if profile or trace_path is not None:
+        tracer = start_tracing()
+        tracer.add_span("startup.import", STARTED_NS, _IMPORTED_NS)
+
+    if not interactive:
         try:
-            result = answer_question(
+            _ask_once(
                 model,
                 question,
-                image_paths if image_paths else None,
-                history if history else None,
+                read_stdin,
+                [str(path.absolute()) for path in images or []],
+                resume,
+                json_output,
+                save,
+                stream=stream and not json_output,
+                use_cache=use_cache,
+                hedge=hedge,
             )
-        except Exception as e:
-            typer.secho(
-                f"❌ 답변 생성 중 오류가 발생했습니다: {e}",
-                fg=typer.colors.RED,
-                err=True,
+        finally:
+            tracer = stop_tracing()
+            if tracer is not None:
+                _finish_trace(tracer, profile, trace_path, trace_format.value, err=True)
+        return
+
+    with span("startup.import_services"):
+        from prompt_toolkit import prompt
+        from prompt_toolkit.completion import PathCompleter
+
+        from gonagi_saa.daemon import SOCKET_FILE
+        from gonagi_saa.outbox import Outbox
+        from gonagi_saa.render import StreamingAnswerPrinter
+        from gonagi_saa.search import index_answer
+        from gonagi_saa.sessions import SessionStore, record_turn
+        from gonagi_saa.utils import generate_session_id, is_vision_model
+        from gonagi_saa.warmup import ConnectionWarmer
+
+    # 대화 히스토리 (이어서 질문하는 세션은 첫 답변을 생성할 때 불러옴)
+    history: list = []
+    resumed_session: str | None = None
+
+    # Session ID 생성(또는 이어서 질문할 세션 확인) 및 표시
+    if resume is not None:
+        found = _find_session(resume)
+        session_id = resumed_session = found.id
+        typer.secho(f"🔗 Session: {session_id} (이어서 질문)", fg=typer.colors.CYAN)
+        typer.echo(f"📚 이전 대화 {found.turns}턴 · 마지막 질문: {found.last_title}")
+    else:
+        session_id = generate_session_id()
+        typer.secho(f"🔗 Session: {session_id}", fg=typer.colors.CYAN)
+
+    # Notion 저장은 아웃박스에 먼저 기록한 뒤 백그라운드에서 처리
+    outbox = Outbox()
+    saver = BackgroundSaver()
+
+    # 이전 세션에서 저장하지 못한 답변 동기화
+    if settings.sync_on_startup:
+        backlog = outbox.count_pending()
+        if backlog:
+            typer.echo(f"📮 저장되지 않은 답변 {backlog}건을 백그라운드에서 Notion에 동기화합니다.")
+            saver.submit("아웃박스 동기화", partial(_sync_job, outbox))
+
+    try:
+        while True:
+            # 백그라운드 저장 상태 표시
+            _report_saves(saver)
+
+            # 질문을 입력하는 동안 모델을 만들고 제공자/Notion 연결을 미리 열어 둠
+            # (데몬이 실행 중이면 데몬이 연결을 가지고 있으므로 생략)
+            warmer = (
+                None if SOCKET_FILE.exists() else ConnectionWarmer(model, hedge=hedge).start()
             )
-            raise typer.Exit(code=1)
 
-        # 4. 답변 출력
-        print(f"\n{'='*60}")
-        print(f"📌 제목: {result.title}")
-        print(f"{'='*60}\n")
-        print(f"💡 답변:\n\n{result.answer}\n")
-        print(f"\n📝 시험 팁:")
-        for tip in result.exam_tips:
-            print(f"  {tip}")
-        print(f"\n⚠️  주의사항:")
-        for trap in result.common_traps:
-            print(f"  {trap}")
-        print(f"\n🏷️  태그: {', '.join(result.tags)}\n")
-        print(f"{'='*60}\n")
-
-        # 5. Notion 저장 여부 확인
-        save_to_notion_confirm = typer.confirm(
-            "💾 Notion에 저장하시겠습니까? [Y/N]",
-            default=True,
-            show_default=False,
-        )
+            # 1. 텍스트 질문 입력
+            print("💡 질문을 입력하고 저장하세요!")
+            time.sleep(0.5)
+            with span("ask.editor"):
+                question = cast(str | None, typer.edit())
+
+            if question is None or question.strip() == "":
+                typer.echo("❌ 질문이 입력되지 않았습니다.")
+                raise typer.Exit()
+            if warmer is not None:
+                warmer.rewarm()
+
+            # 2. 이미지 추가 여부 확인
+            image_paths: list[str] = []
+            add_images = typer.confirm("📸 이미지를 추가하시겠습니까? [Y/N]", default=False, show_default=False)
+
+            if add_images:
+                if not is_vision_model(model):
+                    typer.secho(
+                        f"⚠️  현재 설정된 모델({model})은 이미지를 지원하지 않습니다.",
+                        fg=typer.colors.YELLOW,
+                    )
+                    typer.echo("텍스트만으로 진행합니다.")
+                else:
+                    # PathCompleter로 파일 경로 자동완성 지원
+                    path_completer = PathCompleter(expanduser=True)
+
+                    typer.echo("💡 이미지를 추가하세요 (최대 3개, Enter=종료, q=취소)\n")
+
+                    for i in range(MAX_IMAGES):
+                        try:
+                            # prompt_toolkit의 prompt 사용 (Tab 자동완성 지원)
+                            image_path = prompt(
+                                f"이미지 경로 ({i + 1}/{MAX_IMAGES}): ",
+                                completer=path_completer,
+                            ).strip()
+                        except (KeyboardInterrupt, EOFError):
+                            # Ctrl+C 또는 Ctrl+D 입력 시 전체 프로세스 중단
+                            typer.echo("\n👋 질문이 취소되었습니다.")
+                            raise typer.Exit()
+
+                        if image_path == "":
+                            break
 
-        if save_to_notion_confirm:
+                        # 취소 명령어 처리
+                        if image_path.lower() in ["q", "quit", "cancel", "exit"]:
+                            typer.echo("👋 질문이 취소되었습니다.")
+                            raise typer.Exit()
+
+                        path = Path(image_path)
+                        error = _image_error(path)
+                        if error is not None:
+                            typer.secho(f"❌ {error}: {image_path}", fg=typer.colors.RED)
+                            continue
+
+                        image_paths.append(str(path.absolute()))
+                        typer.secho(f"✅ 이미지 추가됨: {path.name}", fg=typer.colors.GREEN)
+                        if warmer is not None:
+                            warmer.rewarm()
+
+            # 이어서 질문하는 세션의 이전 턴 불러오기 (질문을 입력한 뒤에만 읽음)
+            if resumed_session is not None:
+                with span("session.load"):
+                    store = SessionStore()
+                    try:
+                        history = store.load(resumed_session)
+                    finally:
+                        store.close()
+                resumed_session = None
+
+            # 3. AI 답변 생성 (스트리밍 시 도착하는 대로 출력)
+            if warmer is not None:
+                warmer.stop()
+            printer = StreamingAnswerPrinter()
             try:
-                notion_client = NotionClient(
-                    auth=settings.notion_api_key.get_secret_value()
+                result = _answer(
+                    model,
+                    question,
+                    image_paths if image_paths else None,
+                    history if history else None,
+                    on_partial=printer.update if stream else None,
+                    use_cache=use_cache,
+                    hedge=hedge,
                 )
-                save_to_notion(notion_client, result, session_id, image_paths if image_paths else None)
             except Exception as e:
                 typer.secho(
-                    f"❌ Notion 저장 중 오류가 발생했습니다: {e}",
+                    f"❌ 답변 생성 중 오류가 발생했습니다: {e}",
                     fg=typer.colors.RED,
                     err=True,
                 )
                 raise typer.Exit(code=1)
 
-        # 히스토리에 추가
-        history.append(result)
+            # 4. 답변 출력 (스트리밍 중 출력되지 않은 나머지)
+            printer.finish(result)
 
-        # 6. 이어서 질문 여부 확인
-        continue_asking = typer.confirm(
-            "🔄 이어서 질문하시겠습니까? [Y/N]",
-            default=False,
-            show_default=False,
+            # 세션에 기록 (`gonagi-saa ask --resume`) 및 로컬 검색 색인에 추가 (`gonagi-saa search`)
+            with span("session.record"):
+                record_turn(session_id, model, result)
+            with span("search.index"):
+                index_answer(result, session_id, model)
+
+            # 5. Notion 저장 여부 확인
+            save_to_notion_confirm = save or typer.confirm(
+                "💾 Notion에 저장하시겠습니까? [Y/N]",
+                default=True,
+                show_default=False,
+            )
+
+            if save_to_notion_confirm:
+                # 아웃박스에 기록하고, 다음 질문을 입력하는 동안 백그라운드에서 저장
+                with span("outbox.enqueue"):
+                    entry_id = outbox.enqueue(
+                        result, session_id, image_paths if image_paths else None
+                    )
+                saver.submit(result.title, partial(_save_job, outbox, entry_id))
+                typer.echo("💾 백그라운드에서 Notion에 저장합니다.")
+
+            # 히스토리에 추가
+            history.append(result)
+
+            # 6. 이어서 질문 여부 확인
+            continue_asking = typer.confirm(
+                "🔄 이어서 질문하시겠습니까? [Y/N]",
+                default=False,
+                show_default=False,
+            )
+
+            if not continue_asking:
+                print("👋 종료합니다.")
+                break
+    except KeyboardInterrupt:
+        typer.echo("\n👋 종료합니다.")
+    finally:
+        with span("ask.drain"):
+            _drain_saves(saver)
+        tracer = stop_tracing()
+        if tracer is not None:
+            _finish_trace(tracer, profile, trace_path, trace_format.value)
+
+
+def _ask_once(
+    model: str,
+    question: str | None,
+    read_stdin: bool,
+    image_paths: list[str],
+    resume: str | None,
+    json_output: bool,
+    save: bool,
+    stream: bool,
+    use_cache: bool,
+    hedge: bool,
+) -> None:
+    """
+    비대화형 모드: 질문 하나에 답변하고 종료 (편집기, 확인 질문, 대기 없음)
+
+    표준 출력에는 답변만 쓰고(--json이면 QnAModel JSON), 진행/오류 메시지는 표준 오류로
+    보냅니다. 답변 생성에 실패하거나 --save 저장에 실패하면 종료 코드 1로 끝납니다.
+    """
+    with span("startup.import_services"):
+        from gonagi_saa.render import StreamingAnswerPrinter
+        from gonagi_saa.search import index_answer
+        from gonagi_saa.sessions import SessionStore, record_turn
+        from gonagi_saa.utils import generate_session_id, is_vision_model
+
+    if question == "-" or (question is None and read_stdin):
+        question = sys.stdin.read()
+    if question is None or question.strip() == "":
+        typer.secho("❌ 질문이 입력되지 않았습니다.", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+
+    if image_paths:
+        if not is_vision_model(model):
+            typer.secho(
+                f"❌ 현재 설정된 모델({model})은 이미지를 지원하지 않습니다.",
+                fg=typer.colors.RED,
+                err=True,
+            )
+            raise typer.Exit(code=1)
+        if len(image_paths) > MAX_IMAGES:
+            typer.secho(
+                f"❌ 이미지는 최대 {MAX_IMAGES}개까지 첨부할 수 있습니다.",
+                fg=typer.colors.RED,
+                err=True,
+            )
+            raise typer.Exit(code=1)
+        for image_path in image_paths:
+            error = _image_error(Path(image_path))
+            if error is not None:
+                typer.secho(f"❌ {error}: {image_path}", fg=typer.colors.RED, err=True)
+                raise typer.Exit(code=1)
+
+    history: list = []
+    if resume is not None:
+        session_id = _find_session(resume).id
+        with span("session.load"):
+            store = SessionStore()
+            try:
+                history = store.load(session_id)
+            finally:
+                store.close()
+    else:
+        session_id = generate_session_id()
+
+    printer = StreamingAnswerPrinter()
+    try:
+        result = _answer(
+            model,
+            question,
+            image_paths or None,
+            history or None,
+            on_partial=printer.update if stream else None,
+            use_cache=use_cache,
+            verbose=False,
+            hedge=hedge,
         )
+    except Exception as e:
+        typer.secho(f"❌ 답변 생성 중 오류가 발생했습니다: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
 
-        if not continue_asking:
-            print("👋 종료합니다.")
-            break
+    if json_output:
+        typer.echo(result.model_dump_json())
+    else:
+        printer.finish(result)
+
+    with span("session.record"):
+        record_turn(session_id, model, result)
+    with span("search.index"):
+        index_answer(result, session_id, model)
+    # --resume으로 이어서 질문할 수 있도록 항상 stderr에 출력 (stdout은 답변 전용)
+    typer.secho(f"🔗 Session: {session_id}", err=True)
+
+    if save:
+        from gonagi_saa.outbox import Outbox
+
+        # 실패해도 아웃박스에 남아 `gonagi-saa sync`로 재전송할 수 있음
+        outbox = Outbox()
+        with span("outbox.enqueue"):
+            entry_id = outbox.enqueue(result, session_id, image_paths or None)
+        try:
+            _save_job(outbox, entry_id)
+        except Exception as e:
+            typer.secho(
+                f"❌ Notion 저장 실패: {e} (`gonagi-saa sync`로 재시도)",
+                fg=typer.colors.RED,
+                err=True,
+            )
+            raise typer.Exit(code=1)
+        typer.secho("💾 Notion에 저장했습니다.", err=True)
+
+
+def _image_error(path: Path) -> str | None:
+    """첨부할 수 없는 이미지면 오류 메시지, 문제가 없으면 None"""
+    import filetype
+
+    if not path.exists():
+        return "이미지 파일을 찾을 수 없습니다"
+    if not path.is_file():
+        return "디렉토리가 아닌 파일을 입력해주세요"
+
+    # 이미지 파일 타입 확인
+    kind = filetype.guess(str(path))
+    if kind is None or not kind.mime.startswith("image/"):
+        return "이미지 파일이 아닙니다"
+    return None
+
+
+def _find_session(session_id: str) -> "SessionInfo":
+    """이어서 질문할 세션 찾기 (없으면 종료)"""
+    from gonagi_saa.sessions import SessionStore
+
+    with span("session.find"):
+        store = SessionStore()
+        try:
+            found = store.find(session_id)
+        finally:
+            store.close()
+    if found is None:
+        typer.secho(f"❌ 저장된 세션을 찾을 수 없습니다: {session_id}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+    return found
+
+
+def _finish_trace(
+    tracer: Tracer,
+    profile: bool,
+    trace_path: Path | None,
+    trace_format: str,
+    err: bool = False,
+) -> None:
+    """단계별 소요 시간 출력 및 trace 파일 저장 (err=True이면 표준 오류로 출력)"""
+    if profile:
+        typer.echo("\n⏱️  단계별 소요 시간:", err=err)
+        for stage in tracer.summary():
+            typer.echo(
+                f"  - {stage.name}: {stage.count}회, 합계 {stage.total_ms:,.1f}ms, "
+                f"최대 {stage.max_ms:,.1f}ms",
+                err=err,
+            )
+
+    if trace_path is not None:
+        try:
+            tracer.export(trace_path, trace_format)
+        except OSError as e:
+            typer.secho(f"❌ trace 파일 저장 실패: {e}", fg=typer.colors.RED, err=True)
+        else:
+            typer.echo(f"🧭 trace를 저장했습니다: {trace_path} ({trace_format})", err=err)
+
+
+def _answer(*args, **kwargs) -> "QnAModel":
+    """답변 생성 (데몬이 실행 중이면 데몬에 맡기고, 아니면 직접 생성)"""
+    from gonagi_saa.daemon import DaemonUnavailable, answer
+
+    try:
+        with span("daemon.answer"):
+            return answer(*args, **kwargs)
+    except DaemonUnavailable:
+        pass
+
+    from gonagi_saa.services import answer_question
+
+    return answer_question(*args, **kwargs)
+
+
+def _save_job(outbox: "Outbox", entry_id: str) -> None:
+    """백그라운드 저장 작업 (실패한 항목은 아웃박스에 남아 `gonagi-saa sync`로 재시도)"""
+    from gonagi_saa.daemon import DaemonUnavailable, request
+
+    try:
+        request("save", {"entry_id": entry_id})
+        return
+    except DaemonUnavailable:
+        pass
+
+    from gonagi_saa.utils import get_notion_client
+
+    outbox.send(get_notion_client(), entry_id, verbose=False)
+
+
+def _sync_job(outbox: "Outbox") -> None:
+    """백그라운드 아웃박스 동기화 작업"""
+    from gonagi_saa.utils import get_notion_client
+
+    report = outbox.flush(get_notion_client())
+    if report.failed:
+        raise RuntimeError(
+            f"{report.failed}건 실패, 남은 답변 {report.remaining}건 (`gonagi-saa sync`로 재시도)"
+        )
+
+
+def _report_saves(saver: BackgroundSaver) -> None:
+    """백그라운드 저장 상태와 새로 발생한 실패를 출력"""
+    for failure in saver.pop_failures():
+        typer.secho(
+            f"❌ Notion 저장 실패 ({failure.label}): {failure.error}",
+            fg=typer.colors.RED,
+            err=True,
+        )
+
+    status = saver.status_line()
+    if status is not None:
+        typer.secho(status, fg=typer.colors.BRIGHT_BLACK)
+
+
+def _drain_saves(saver: BackgroundSaver) -> None:
+    """종료 전에 남은 저장 작업을 마무리하고 결과 보고"""
+    pending = saver.pending
+    if pending:
+        typer.echo(f"⏳ 남은 Notion 저장 {pending}건을 마무리합니다... (Ctrl+C로 중단)")
+        try:
+            saver.drain(
+                on_progress=lambda done, total: typer.echo(f"  💾 {done}/{total} 완료")
+            )
+        except KeyboardInterrupt:
+            typer.secho(
+                f"⚠️  저장되지 않은 답변 {saver.pending}건이 있습니다.",
+                fg=typer.colors.YELLOW,
+                err=True,
+            )
+
+    _report_saves(saver)
+
+
+@app.command()
+def sync():
+    """저장되지 않은 답변(아웃박스)을 Notion에 동기화합니다."""
+    from gonagi_saa.outbox import Outbox
+    from gonagi_saa.utils import get_notion_client
+
+    outbox = Outbox()
+    backlog = outbox.count_pending()
+    if backlog == 0:
+        typer.echo("✅ 동기화할 답변이 없습니다.")
+        return
+
+    typer.echo(f"📮 저장되지 않은 답변 {backlog}건을 Notion에 동기화합니다...")
+
+    def on_progress(entry: "OutboxEntry", error: Exception | None) -> None:
+        if error is None:
+            typer.secho(f"  ✅ {entry.qna.title}", fg=typer.colors.GREEN)
+        else:
+            typer.secho(f"  ❌ {entry.qna.title}: {error}", fg=typer.colors.RED, err=True)
+
+    report = outbox.flush(get_notion_client(), on_progress=on_progress)
+
+    typer.echo(
+        f"📊 저장 {report.sent}건, 실패 {report.failed}건, 남은 답변 {report.remaining}건 "
+        f"({report.elapsed:.1f}초, {report.throughput:.2f}건/초)"
+    )
+    if report.failed:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def pull(
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-w", min=1, help="페이지 본문을 동시에 받을 작업 수"),
+    ] = 3,
+    full: Annotated[
+        bool,
+        typer.Option("--full", help="커서를 무시하고 데이터베이스 전체를 다시 확인합니다."),
+    ] = False,
+):
+    """Notion 데이터베이스에서 지난 pull 이후 수정된 페이지만 로컬 미러로 가져옵니다."""
+    from gonagi_saa.mirror import NotionMirror
+    from gonagi_saa.settings import settings
+    from gonagi_saa.utils import get_notion_client
+
+    database_id = settings.notion_database_id
+    if not database_id:
+        typer.secho("❌ notion_database_id가 설정되지 않았습니다.", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+
+    def on_page(page: dict, error: Exception | None) -> None:
+        if error is not None:
+            typer.secho(f"  ❌ {page['id']}: {error}", fg=typer.colors.RED, err=True)
+
+    mirror = NotionMirror()
+    try:
+        if full:
+            mirror.reset(database_id)
+        cursor = mirror.cursor(database_id)
+        typer.echo(
+            f"📥 {cursor} 이후 수정된 페이지를 가져옵니다..."
+            if cursor
+            else "📥 데이터베이스 전체를 가져옵니다..."
+        )
+
+        report = mirror.pull(get_notion_client(), database_id, workers=workers, on_page=on_page)
+    except KeyboardInterrupt:
+        typer.echo("\n👋 중단되었습니다. 다시 실행하면 마지막으로 반영된 지점부터 이어서 가져옵니다.")
+        raise typer.Exit(code=130)
+    finally:
+        mirror.close()
+
+    typer.echo(
+        f"📊 확인 {report.scanned}건 · 갱신 {report.updated}건 · 변경 없음 {report.unchanged}건 · "
+        f"실패 {report.failed}건 ({report.elapsed:.1f}초)"
+    )
+    typer.echo(f"🗄️  로컬 미러: 페이지 {report.total}건, {report.stored_bytes / 1024:,.1f} KB")
+    if report.failed:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def batch(
+    input_path: Annotated[
+        Path,
+        typer.Argument(help="질문 목록 파일 (JSONL 또는 CSV)", exists=True, dir_okay=False),
+    ],
+    output: Annotated[
+        Path | None,
+        typer.Option("--output", "-o", help="결과 JSONL 경로 (기본: <입력 파일>.results.jsonl)"),
+    ] = None,
+    model: Annotated[
+        str | None,
+        typer.Option("--model", "-m", help="사용할 모델 (기본: 설정의 default_model)"),
+    ] = None,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-w", min=1, help="동시에 답변을 생성할 작업 수"),
+    ] = 4,
+    rpm: Annotated[
+        float | None,
+        typer.Option("--rpm", min=0.1, help="분당 최대 요청 수 (기본: 제공자별 설정값)"),
+    ] = None,
+    save: Annotated[
+        bool,
+        typer.Option("--save/--no-save", help="답변을 Notion에도 저장합니다."),
+    ] = False,
+    use_cache: Annotated[
+        bool,
+        typer.Option("--cache/--no-cache", help="캐시된 답변을 사용합니다."),
+    ] = True,
+    resume: Annotated[
+        bool,
+        typer.Option("--resume/--no-resume", help="결과 파일에서 이미 성공한 질문은 건너뜁니다."),
+    ] = True,
+    hedge: Annotated[
+        bool,
+        typer.Option("--hedge/--no-hedge", help="hedge_model이 설정되어 있으면 헤지 요청을 사용합니다."),
+    ] = True,
+):
+    """JSONL/CSV 파일의 질문들에 대한 답변을 한꺼번에 생성합니다."""
+    from gonagi_saa.batch import completed_item_ids, load_batch_items, run_batch
+    from gonagi_saa.daemon import DaemonUnavailable, run_batch_remote
+    from gonagi_saa.settings import settings
+    from gonagi_saa.utils import generate_session_id, is_vision_model
+
+    model = model or settings.default_model
+    output = output or input_path.with_suffix(".results.jsonl")
+
+    try:
+        items = load_batch_items(input_path)
+    except (ValueError, OSError) as e:
+        typer.secho(f"❌ 질문 목록을 읽을 수 없습니다: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
+
+    if not is_vision_model(model) and any(item.image_paths for item in items):
+        typer.secho(
+            f"⚠️  현재 설정된 모델({model})은 이미지를 지원하지 않습니다. 텍스트만으로 진행합니다.",
+            fg=typer.colors.YELLOW,
+        )
+        for item in items:
+            item.image_paths = []
+
+    session_id = f"batch-{generate_session_id()}" if save else None
+    typer.echo(f"📋 질문 {len(items)}건 · 모델 {model} · 작업 {workers}개 → {output}")
+    if session_id is not None:
+        typer.secho(f"🔗 Session: {session_id}", fg=typer.colors.CYAN)
+
+    skipped = len(completed_item_ids(output) & {item.id for item in items}) if resume else 0
+    if skipped:
+        typer.echo(f"⏭️  이미 완료된 질문 {skipped}건을 건너뜁니다.")
+    total = len(items) - skipped
+    finished = 0
+
+    def on_result(result: "BatchResult") -> None:
+        nonlocal finished
+        finished += 1
+        progress = f"[{finished}/{total}]"
+        if not result.ok:
+            # 전체 오류 메시지는 결과 파일에 남기고 화면에는 첫 줄만 출력
+            message = (result.error or "알 수 없는 오류").splitlines()[0]
+            typer.secho(
+                f"  {progress} ❌ {result.item.id}: {message}",
+                fg=typer.colors.RED,
+                err=True,
+            )
+            return
+
+        assert result.qna is not None
+        typer.secho(
+            f"  {progress} ✅ {result.item.id}: {result.qna.title} ({result.latency:.1f}초)",
+            fg=typer.colors.GREEN,
+        )
+        if result.save_error is not None:
+            typer.secho(
+                f"      ⚠️  Notion 저장 실패 (`gonagi-saa sync`로 재시도): {result.save_error}",
+                fg=typer.colors.YELLOW,
+                err=True,
+            )
+
+    options = dict(
+        workers=workers,
+        requests_per_minute=rpm,
+        session_id=session_id,
+        use_cache=use_cache,
+        resume=resume,
+        hedge=hedge,
+        on_result=on_result,
+    )
+    try:
+        try:
+            # 데몬이 실행 중이면 데몬이 처리하고 결과 파일도 기록
+            summary = run_batch_remote(items, output, model, **options)
+        except DaemonUnavailable:
+            summary = run_batch(items, output, model, **options)
+    except KeyboardInterrupt:
+        typer.echo("\n👋 중단되었습니다. 같은 명령으로 다시 실행하면 이어서 진행합니다.")
+        raise typer.Exit(code=130)
+
+    typer.echo(
+        f"📊 성공 {summary.succeeded}건, 실패 {summary.failed}건 "
+        f"({summary.elapsed:.1f}초, {summary.throughput:.2f}건/초)"
+    )
+    if summary.latencies:
+        typer.echo(
+            f"⏱️  지연 시간 p50 {summary.percentile(50):.1f}초 · "
+            f"p95 {summary.percentile(95):.1f}초 · 최대 {max(summary.latencies):.1f}초"
+        )
+    if summary.failed:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def search(
+    query: Annotated[
+        list[str] | None,
+        typer.Argument(help="검색어 (여러 단어는 모두 포함하는 답변을 찾음)"),
+    ] = None,
+    tags: Annotated[
+        list[str] | None,
+        typer.Option("--tag", "-t", help="태그로 필터링 (여러 번 지정하면 모두 포함)"),
+    ] = None,
+    session: Annotated[
+        str | None,
+        typer.Option("--session", "-s", help="세션 ID로 필터링 (앞부분만 입력 가능)"),
+    ] = None,
+    limit: Annotated[
+        int,
+        typer.Option("--limit", "-n", min=1, help="최대 결과 수"),
+    ] = 10,
+    full: Annotated[
+        bool,
+        typer.Option("--full", help="답변 전체를 출력합니다."),
+    ] = False,
+    reindex: Annotated[
+        bool,
+        typer.Option("--reindex", help="아웃박스에 기록된 이전 답변을 색인에 추가합니다."),
+    ] = False,
+):
+    """로컬에 색인된 답변을 검색합니다 (Notion 없이 오프라인으로)."""
+    from gonagi_saa.render import StreamingAnswerPrinter
+    from gonagi_saa.search import SearchIndex
+
+    index = SearchIndex()
+    try:
+        if reindex:
+            from gonagi_saa.outbox import Outbox
+
+            added = sum(
+                index.add(entry.qna, entry.session_id, created_at=entry.created_at)
+                for entry in Outbox().all_entries()
+            )
+            typer.echo(f"🗂️  아웃박스에서 답변 {added}건을 색인에 추가했습니다.")
+
+        started_at = time.perf_counter()
+        hits = index.search(" ".join(query or []), tags=tags, session_id=session, limit=limit)
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        total = index.count()
+    finally:
+        index.close()
+
+    if not hits:
+        typer.echo(f"🔍 검색 결과가 없습니다. (색인된 답변 {total}건, {elapsed_ms:.1f}ms)")
+        return
+
+    typer.echo(f"🔍 {len(hits)}건 (색인된 답변 {total}건, {elapsed_ms:.1f}ms)\n")
+    for rank, hit in enumerate(hits, start=1):
+        created = time.strftime("%Y-%m-%d %H:%M", time.localtime(hit.created_at))
+        typer.secho(f"{rank}. {hit.qna.title}", fg=typer.colors.CYAN, bold=True)
+        typer.secho(
+            f"   🔗 {hit.session_id} · {created}"
+            + (f" · 🏷️  {', '.join(hit.qna.tags)}" if hit.qna.tags else ""),
+            fg=typer.colors.BRIGHT_BLACK,
+        )
+        if full:
+            StreamingAnswerPrinter().finish(hit.qna)
+        else:
+            typer.echo(f"   {hit.snippet}\n")
+
+
+@app.command()
+def sessions(
+    limit: Annotated[int, typer.Option("--limit", "-n", min=1, help="보여 줄 세션 수")] = 10,
+):
+    """저장된 대화 세션을 최근 순서로 보여 줍니다 (`ask --resume`으로 이어서 질문)."""
+    from gonagi_saa.sessions import SessionStore
+
+    store = SessionStore()
+    try:
+        found = store.recent(limit)
+    finally:
+        store.close()
+
+    if not found:
+        typer.echo("📭 저장된 세션이 없습니다.")
+        return
+
+    typer.echo(f"🗂️  최근 세션 {len(found)}개:")
+    for info in found:
+        updated = time.strftime("%Y-%m-%d %H:%M", time.localtime(info.updated_at))
+        typer.secho(f"  🔗 {info.id}", fg=typer.colors.CYAN)
+        typer.secho(
+            f"     {info.turns}턴 · {info.model} · {updated} · 마지막 질문: {info.last_title}",
+            fg=typer.colors.BRIGHT_BLACK,
+        )
+
+
+@app.command()
+def stats():
+    """기록된 성능 지표(출력 방식별 토큰/파싱 실패율, 헤지 요청)를 요약합니다."""
+    generation_events = load_events("generation")
+    hedge_events = load_events("hedge")
+    if not generation_events and not hedge_events:
+        typer.echo("📭 기록된 지표가 없습니다.")
+        return
+
+    if generation_events:
+        _report_generation_stats(generation_events)
+    if hedge_events:
+        _report_hedge_stats(hedge_events)
+
+
+def _average(values: list[float]) -> str:
+    return f"{sum(values) / len(values):,.0f}" if values else "-"
+
+
+def _report_generation_stats(events: list[dict]) -> None:
+    """출력 방식(native/parser)별 토큰 사용량과 파싱 실패율 출력 (로컬 태그 추출을 썼으면 태그 방식별 출력 토큰도)"""
+    typer.echo("🧩 출력 방식별 생성 지표:")
+    for mode, label in (("native", "네이티브 구조화 출력"), ("parser", "포맷 지시문 + 파서")):
+        mode_events = [event for event in events if event["mode"] == mode]
+        if not mode_events:
+            continue
+
+        failures = sum(1 for event in mode_events if not event["ok"])
+        input_tokens = [e["input_tokens"] for e in mode_events if e.get("input_tokens")]
+        output_tokens = [e["output_tokens"] for e in mode_events if e.get("output_tokens")]
+        typer.echo(
+            f"  - {label}: {len(mode_events)}회, 파싱 실패 {failures}회 "
+            f"({failures / len(mode_events):.1%}), 평균 입력 {_average(input_tokens)} 토큰 · "
+            f"출력 {_average(output_tokens)} 토큰"
+        )
+
+    local_tags = [e["output_tokens"] for e in events if e.get("tags") == "local" and e.get("output_tokens")]
+    if local_tags:
+        llm_tags = [
+            e["output_tokens"] for e in events if e.get("tags", "llm") == "llm" and e.get("output_tokens")
+        ]
+        typer.echo(
+            f"  - 태그 생성: LLM 평균 출력 {_average(llm_tags)} 토큰 · "
+            f"로컬 추출 평균 출력 {_average(local_tags)} 토큰"
+        )
+
+
+def _report_hedge_stats(events: list[dict]) -> None:
+    """헤지 요청 발생률, 제공자별 승리 횟수, 절약 시간 출력"""
+    hedged = [event for event in events if event["hedged"]]
+    typer.echo(
+        f"🏁 헤지 요청: 답변 {len(events)}건 중 {len(hedged)}건에서 보조 모델 요청 "
+        f"({len(hedged) / len(events):.0%})"
+    )
+    if not hedged:
+        return
+
+    wins: dict[str, int] = {}
+    for event in hedged:
+        wins[event["winner_provider"]] = wins.get(event["winner_provider"], 0) + 1
+    for provider, count in sorted(wins.items(), key=lambda item: -item[1]):
+        typer.echo(f"  - {provider}: {count}회 승리")
+
+    # 취소된 기본 모델의 완료 시각은 알 수 없어 하한 추정치만 기록됨 (이전 기록은 latency_saved)
+    total_saved = sum(
+        event.get("latency_saved_min", event.get("latency_saved", 0.0)) for event in hedged
+    )
+    typer.echo(
+        f"⏱️  절약 시간 (하한 추정): 합계 {total_saved:.1f}초, "
+        f"헤지당 평균 {total_saved / len(hedged):.1f}초"
+    )
 
 
 @app.callback(invoke_without_command=True)
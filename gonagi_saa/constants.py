@@ -1,5 +1,26 @@
 """상수 정의"""
 
+from pathlib import Path
+
+# 설정/캐시/저장소 디렉토리 (설정을 읽지 않는 명령도 쓰므로 settings와 분리)
+CONFIG_DIR = Path.home() / ".config" / "gonagi-saa"
+CONFIG_FILE = CONFIG_DIR / "config.json"
+
+# 데몬이 준비될 때까지 기다리는 최대 시간 (초, 모듈/모델을 미리 불러오는 시간 포함)
+DAEMON_START_TIMEOUT = 30
+
+# 연결을 다시 준비하기 전 최소 유휴 시간 (httpx 유휴 연결 만료 5초), 질문 하나당 최대 재준비 횟수와
+# 요청 제한 시간 (초)
+WARMUP_IDLE_SECONDS = 5.0
+WARMUP_MAX_REWARMS = 3
+WARMUP_TIMEOUT = 5.0
+
+# tiktoken 인코딩을 처음 불러올 때 기다리는 최대 시간 (초, 인코딩 파일을 내려받는 동안은 근사치 사용)
+TIKTOKEN_LOAD_TIMEOUT = 2.0
+
+# 이미지 업로드 본문을 나눠 보내는 단위 (바이트, 파일 전체를 메모리에 복사하지 않도록)
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
 # 이미지를 지원하는 모델 목록
 VISION_SUPPORTED_MODELS = {
     # OpenAI
@@ -23,5 +44,53 @@ VISION_SUPPORTED_MODELS = {
     "gemini-pro-vision",
 }
 
+# 도구 호출(네이티브 구조화 출력)을 지원하지 않는 모델 (포맷 지시문 방식으로 생성)
+STRUCTURED_OUTPUT_UNSUPPORTED_MODELS = {
+    "o1-mini",
+    "o1-preview",
+}
+
 # 최대 이미지 개수
 MAX_IMAGES = 3
+
+# 확장자별 이미지 MIME 타입
+IMAGE_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+
+# 모델 제공자별 이미지 목표 해상도 (긴 변, 짧은 변)
+# - OpenAI: 2048 정사각형에 맞춘 뒤 짧은 변을 768로 축소
+# - Anthropic: 긴 변 1568px 초과 시 서버에서 축소
+# - Google: 3072px 이내로 축소 후 타일 단위 처리
+IMAGE_TARGET_RESOLUTIONS = {
+    "openai": (2048, 768),
+    "anthropic": (1568, 1568),
+    "google": (3072, 3072),
+}
+DEFAULT_IMAGE_TARGET_RESOLUTION = (2048, 2048)
+
+# 샘플링한 픽셀의 고유 색상 수가 이 값 이하이면 다이어그램/스크린샷으로 판단
+DIAGRAM_MAX_COLORS = 2048
+
+# 모델 제공자별 기본 요청 한도 (분당 요청 수, 배치 처리 시 사용)
+DEFAULT_REQUESTS_PER_MINUTE = {
+    "openai": 60,
+    "anthropic": 50,
+    "google": 60,
+}
+
+# Notion API 요청 하나에 넣을 수 있는 블록(children) 수
+# (요청 속도는 통합당 초당 약 3회로 제한되며 settings.notion_requests_per_second로 조절)
+NOTION_MAX_CHILDREN = 100
+
+# 아웃박스 항목 id(멱등성 키)를 기록하는 Notion 데이터베이스 속성 (텍스트, 없으면 자동 추가)
+NOTION_ENTRY_PROPERTY = "Entry"
+
+# Notion 429 응답 재시도 (Retry-After가 없으면 지수 백오프, 최대 대기 시간)
+NOTION_MAX_RETRIES = 5
+NOTION_BACKOFF_BASE_SECONDS = 1.0
+NOTION_BACKOFF_MAX_SECONDS = 30.0
@@ -0,0 +1,474 @@
+"""
+상주 데몬 (Unix 소켓)
+
+모듈 import, 설정, 모델/Notion 클라이언트를 미리 띄워 둔 프로세스가 ask/batch 요청을
+대신 처리합니다. CLI는 소켓이 있으면 요청만 전달하는 얇은 클라이언트로 동작하고,
+데몬이 없으면 지금처럼 직접 처리합니다.
+
+프로토콜: 요청 한 줄(JSON) → 이벤트 여러 줄(JSON) → result, error, unavailable 중 한 줄로 끝
+    {"op": "answer", "env": "...", ...}
+    {"event": "log" | "partial" | "item", "data": ...}
+    {"event": "result", "data": ...} 또는 {"event": "error", "data": "메시지"}
+
+unavailable은 요청을 처리하지 않고 거절했다는 뜻이므로 클라이언트가 직접 처리합니다.
+"""
+
+import hashlib
+import importlib
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from gonagi_saa.constants import CONFIG_DIR, CONFIG_FILE
+from gonagi_saa.models import QnAModel
+
+# 클라이언트 쪽에서는 소켓 통신만 하므로 LLM/Notion 관련 모듈은 데몬 안에서만 불러옴
+if TYPE_CHECKING:
+    import socketserver
+
+    from gonagi_saa.batch import BatchItem, BatchResult, BatchSummary
+
+SOCKET_FILE = CONFIG_DIR / "daemon.sock"
+LOG_FILE = CONFIG_DIR / "daemon.log"
+
+# 데몬을 띄울 때 미리 불러 두는 모듈
+_WARM_MODULES = ("gonagi_saa.services", "gonagi_saa.batch", "gonagi_saa.outbox", "gonagi_saa.history")
+
+# 설정을 읽어 처리하는 요청 (클라이언트와 설정 환경 변수가 같을 때만 데몬이 처리)
+_SETTINGS_OPS = {"answer", "save", "batch"}
+_ENV_PREFIX = "GONAGI_SAA_"
+
+
+class DaemonUnavailable(ConnectionError):
+    """데몬이 실행 중이 아님 (요청을 보내기 전에 실패했으므로 직접 처리해도 안전)"""
+
+
+class DaemonError(RuntimeError):
+    """데몬이 요청을 처리하다 실패했거나 처리 중 연결이 끊어짐"""
+
+
+def _env_fingerprint() -> str:
+    """
+    설정 환경 변수(GONAGI_SAA_*)의 지문
+
+    데몬은 설정을 프로세스 전체에서 공유하므로 요청마다 바꿀 수 없습니다. 대신
+    클라이언트의 환경 변수가 데몬을 시작할 때와 다르면 요청을 거절해 클라이언트가
+    자기 설정으로 직접 처리하게 합니다 (값 자체는 소켓으로 보내지 않음).
+    """
+    env = sorted((key, value) for key, value in os.environ.items() if key.startswith(_ENV_PREFIX))
+    return hashlib.sha256(json.dumps(env).encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# 클라이언트
+# ---------------------------------------------------------------------------
+
+
+def request(
+    op: str,
+    payload: dict[str, Any] | None = None,
+    on_event: Callable[[str, Any], None] | None = None,
+) -> Any:
+    """데몬에 요청을 보내고 result 데이터 반환 (중간 이벤트는 on_event로 전달)"""
+    if not SOCKET_FILE.exists():
+        raise DaemonUnavailable("데몬이 실행 중이 아닙니다.")
+
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            conn.connect(str(SOCKET_FILE))
+        except OSError as e:
+            raise DaemonUnavailable(f"데몬에 연결할 수 없습니다: {e}") from e
+
+        message = json.dumps(
+            {"op": op, "env": _env_fingerprint(), **(payload or {})}, ensure_ascii=False
+        )
+        conn.sendall(message.encode("utf-8") + b"\n")
+
+        with conn.makefile("r", encoding="utf-8") as lines:
+            for line in lines:
+                event = json.loads(line)
+                if event["event"] == "result":
+                    return event["data"]
+                if event["event"] == "error":
+                    raise DaemonError(event["data"])
+                if event["event"] == "unavailable":
+                    raise DaemonUnavailable(event["data"])
+                if on_event is not None:
+                    on_event(event["event"], event["data"])
+    except DaemonUnavailable:
+        raise
+    except OSError as e:
+        raise DaemonError(f"데몬과의 연결이 끊어졌습니다: {e}") from e
+    finally:
+        conn.close()
+
+    raise DaemonError("데몬이 응답하지 않고 연결을 닫았습니다.")
+
+
+def answer(
+    model_name: str,
+    question: str,
+    image_paths: list[str] | None = None,
+    history: list[QnAModel] | None = None,
+    on_partial: Callable[[dict[str, Any]], None] | None = None,
+    use_cache: bool = True,
+    verbose: bool = True,
+    hedge: bool = True,
+) -> QnAModel:
+    """services.answer_question과 같은 인자로 데몬에 답변 생성 요청"""
+
+    def on_event(event: str, data: Any) -> None:
+        if event == "partial" and on_partial is not None:
+            on_partial(data)
+        elif event == "log" and verbose:
+            print(data)
+
+    data = request(
+        "answer",
+        {
+            "model": model_name,
+            "question": question,
+            "image_paths": image_paths or [],
+            "history": [qna.model_dump() for qna in history or []],
+            "stream": on_partial is not None,
+            "use_cache": use_cache,
+            "verbose": verbose,
+            "hedge": hedge,
+        },
+        on_event,
+    )
+    return QnAModel.model_validate(data)
+
+
+def ping() -> dict[str, Any] | None:
+    """데몬 상태 (실행 중이 아니면 None)"""
+    try:
+        return request("ping")
+    except (DaemonUnavailable, DaemonError):
+        return None
+
+
+# ---------------------------------------------------------------------------
+# 서버
+# ---------------------------------------------------------------------------
+
+
+class _Route:
+    """출력 대상 (여러 스레드에서 쓸 수 있으므로 줄 버퍼는 lock으로 보호)"""
+
+    def __init__(self, sink: Callable[[str], None]) -> None:
+        self.sink = sink
+        self.buffer = ""
+        self.lock = threading.Lock()
+
+
+# 현재 요청의 출력 대상 (헤지 루프 작업, asyncio.to_thread 등 컨텍스트를 이어받는 곳까지 전달됨)
+_route: ContextVar[_Route | None] = ContextVar("gonagi_saa_stdout_route", default=None)
+
+
+class _RoutedStdout(io.TextIOBase):
+    """
+    요청별로 출력 대상을 바꿀 수 있는 stdout
+
+    services의 진행 메시지는 print로 출력되므로, 요청을 처리하는 동안의 출력은
+    줄 단위로 모아 클라이언트에 log 이벤트로 보내고 나머지는 원래 stdout(로그 파일)에 씁니다.
+    출력 대상은 contextvar로 정하므로 헤지 루프 스레드에서 실행되는 작업의 출력도
+    요청한 클라이언트로 갑니다.
+    """
+
+    def __init__(self, fallback: io.TextIOBase) -> None:
+        self._fallback = fallback
+
+    @contextmanager
+    def route(self, sink: Callable[[str], None]) -> Iterator[None]:
+        route = _Route(sink)
+        token = _route.set(route)
+        try:
+            yield
+        finally:
+            _route.reset(token)
+            if route.buffer:
+                sink(route.buffer)
+
+    def write(self, text: str) -> int:
+        route = _route.get()
+        if route is None:
+            return self._fallback.write(text)
+
+        with route.lock:
+            route.buffer += text
+            *lines, route.buffer = route.buffer.split("\n")
+        for line in lines:
+            route.sink(line)
+        return len(text)
+
+    def flush(self) -> None:
+        self._fallback.flush()
+
+    def writable(self) -> bool:
+        return True
+
+
+class _Rejected(Exception):
+    """요청을 처리하지 않고 거절 (클라이언트가 직접 처리)"""
+
+
+class _Daemon:
+    """요청 처리기 (모듈과 모델/클라이언트를 한 번만 만들어 재사용)"""
+
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._config_mtime = _config_mtime()
+        self._env = _env_fingerprint()
+        self.server: socketserver.BaseServer | None = None
+
+    def warm_up(self) -> None:
+        """무거운 모듈 import와 기본 모델 생성 (첫 요청이 import 비용을 내지 않도록)"""
+        for module in _WARM_MODULES:
+            importlib.import_module(module)
+
+        from gonagi_saa.services import llm_model_factory
+        from gonagi_saa.settings import settings
+
+        try:
+            llm_model_factory(settings.default_model)
+        except Exception as e:
+            # API Key가 없어도 데몬은 띄우고, 요청할 때 오류를 돌려줌
+            print(f"⚠️  기본 모델을 미리 만들지 못했습니다: {e}")
+
+    def reload_if_changed(self) -> None:
+        """설정 파일이 바뀌었으면 설정을 다시 읽음"""
+        mtime = _config_mtime()
+        with self._lock:
+            if mtime == self._config_mtime:
+                return
+            from gonagi_saa.settings import get_settings
+
+            # 모델/Notion 클라이언트는 API Key별로 재사용하므로 키가 바뀌면 새로 만들어짐
+            get_settings.cache_clear()
+            self._config_mtime = mtime
+        print("🔄 설정 파일이 바뀌어 다시 불러옵니다.")
+
+    def handle(self, message: dict[str, Any], send: Callable[[str, Any], bool]) -> Any:
+        with self._lock:
+            self.requests += 1
+        self.reload_if_changed()
+
+        op = message.get("op")
+        if op in _SETTINGS_OPS and message.get("env") != self._env:
+            raise _Rejected("환경 변수 설정(GONAGI_SAA_*)이 데몬과 달라 직접 처리합니다.")
+        if op == "ping":
+            from gonagi_saa.settings import settings
+
+            return {
+                "pid": os.getpid(),
+                "uptime": time.time() - self.started_at,
+                "requests": self.requests,
+                "model": settings.default_model,
+            }
+        if op == "answer":
+            return self._answer(message, send)
+        if op == "save":
+            from gonagi_saa.outbox import Outbox
+            from gonagi_saa.utils import get_notion_client
+
+            page_id = Outbox().send(get_notion_client(), message["entry_id"], verbose=False)
+            return {"page_id": page_id}
+        if op == "batch":
+            return self._batch(message, send)
+        if op == "shutdown":
+            assert self.server is not None
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return {"pid": os.getpid()}
+        raise ValueError(f"알 수 없는 요청입니다: {op}")
+
+    def _answer(self, message: dict[str, Any], send: Callable[[str, Any], bool]) -> Any:
+        from gonagi_saa.services import answer_question
+
+        stdout = sys.stdout
+        routed = (
+            stdout.route(lambda line: send("log", line))
+            if isinstance(stdout, _RoutedStdout)
+            else nullcontext()
+        )
+        with routed:
+            result = answer_question(
+                message["model"],
+                message["question"],
+                message["image_paths"] or None,
+                [QnAModel.model_validate(qna) for qna in message["history"]] or None,
+                on_partial=(lambda partial: send("partial", partial))
+                if message["stream"]
+                else None,
+                use_cache=message["use_cache"],
+                verbose=message["verbose"],
+                hedge=message["hedge"],
+            )
+        return result.model_dump()
+
+    def _batch(self, message: dict[str, Any], send: Callable[[str, Any], bool]) -> Any:
+        from gonagi_saa.batch import BatchItem, BatchResult, run_batch
+
+        def on_result(result: BatchResult) -> None:
+            # 클라이언트가 끊어지면(Ctrl+C, 터미널 종료) 예외를 던져 run_batch가 남은 항목을
+            # 취소하고 실행 중인 항목만 결과 파일에 기록한 뒤 멈추게 함
+            if not send("item", json.loads(result.to_json(message["model"]))):
+                print("🔌 클라이언트 연결이 끊어져 배치를 중단합니다.")
+                raise ConnectionAbortedError("클라이언트 연결이 끊어졌습니다.")
+
+        summary = run_batch(
+            [BatchItem(**item) for item in message["items"]],
+            Path(message["output"]),
+            message["model"],
+            workers=message["workers"],
+            requests_per_minute=message["rpm"],
+            session_id=message["session_id"],
+            use_cache=message["use_cache"],
+            resume=message["resume"],
+            hedge=message["hedge"],
+            on_result=on_result,
+        )
+        return {
+            "total": summary.total,
+            "skipped": summary.skipped,
+            "succeeded": summary.succeeded,
+            "failed": summary.failed,
+            "elapsed": summary.elapsed,
+            "latencies": summary.latencies,
+        }
+
+
+def _config_mtime() -> float | None:
+    try:
+        return CONFIG_FILE.stat().st_mtime
+    except OSError:
+        return None
+
+
+def run_batch_remote(
+    items: "list[BatchItem]",
+    output_path: Path,
+    model_name: str,
+    workers: int = 4,
+    requests_per_minute: float | None = None,
+    session_id: str | None = None,
+    use_cache: bool = True,
+    resume: bool = True,
+    hedge: bool = True,
+    on_result: "Callable[[BatchResult], None] | None" = None,
+) -> "BatchSummary":
+    """batch.run_batch와 같은 인자로 데몬에 배치 처리 요청 (결과 파일은 데몬이 기록)"""
+    from gonagi_saa.batch import BatchResult, BatchSummary
+
+    def on_event(event: str, data: Any) -> None:
+        if event == "item" and on_result is not None:
+            on_result(BatchResult.from_dict(data))
+
+    data = request(
+        "batch",
+        {
+            "items": [
+                {"id": item.id, "question": item.question, "image_paths": item.image_paths}
+                for item in items
+            ],
+            "output": str(output_path.absolute()),
+            "model": model_name,
+            "workers": workers,
+            "rpm": requests_per_minute,
+            "session_id": session_id,
+            "use_cache": use_cache,
+            "resume": resume,
+            "hedge": hedge,
+        },
+        on_event,
+    )
+    return BatchSummary(**data)
+
+
+def serve(socket_path: Path = SOCKET_FILE) -> None:
+    """데몬 실행 (미리 띄운 뒤 소켓을 열고, shutdown 요청이나 Ctrl+C까지 대기)"""
+    import socketserver
+
+    if ping() is not None:
+        raise RuntimeError("데몬이 이미 실행 중입니다.")
+
+    sys.stdout = _RoutedStdout(sys.stdout)  # type: ignore[assignment]
+    daemon = _Daemon()
+    started_at = time.perf_counter()
+    daemon.warm_up()
+    print(f"🔥 준비 완료 ({time.perf_counter() - started_at:.1f}초)", flush=True)
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            write_lock = threading.Lock()
+            disconnected = threading.Event()
+
+            def send(event: str, data: Any) -> bool:
+                """
+                이벤트 전송 (클라이언트 연결이 끊어졌으면 False)
+
+                연결이 끊어진 뒤의 출력은 버리므로 답변 생성 같은 작업은 출력 때문에
+                중단되지 않고 끝까지 진행됩니다 (결과는 캐시/결과 파일에 남음).
+                """
+                if disconnected.is_set():
+                    return False
+                line = json.dumps({"event": event, "data": data}, ensure_ascii=False)
+                with write_lock:
+                    try:
+                        self.wfile.write(line.encode("utf-8") + b"\n")
+                        self.wfile.flush()
+                    except OSError:
+                        disconnected.set()
+                        return False
+                return True
+
+            try:
+                message = json.loads(self.rfile.readline())
+                try:
+                    result = daemon.handle(message, send)
+                except _Rejected as e:
+                    send("unavailable", str(e))
+                except Exception as e:
+                    send("error", str(e))
+                else:
+                    send("result", result)
+            except (BrokenPipeError, ConnectionResetError):
+                # 클라이언트가 먼저 종료됨 (Ctrl+C 등)
+                pass
+
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)
+    # 소켓 파일이 잠깐이라도 다른 사용자에게 열리지 않도록 bind할 때부터 0600으로 생성
+    umask = os.umask(0o077)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(str(socket_path), Handler)
+    finally:
+        os.umask(umask)
+    server.daemon_threads = True
+    daemon.server = server
+    print(f"🟢 {socket_path}에서 요청을 기다립니다 (pid {os.getpid()})", flush=True)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+        print("👋 데몬을 종료합니다.", flush=True)
+
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,170 @@
+"""대화 히스토리 관리 (토큰 예산 내에서 최근 턴 유지, 오래된 턴 압축)"""
+
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+
+from gonagi_saa.constants import TIKTOKEN_LOAD_TIMEOUT
+from gonagi_saa.models import QnAModel
+from gonagi_saa.settings import settings
+from gonagi_saa.utils import get_model_provider
+
+
+def _load_encoding(model_name: str) -> Any:
+    """OpenAI 모델의 tiktoken 인코딩 (tiktoken이 없거나 인코딩을 받을 수 없으면 None)"""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        try:
+            return tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except (OSError, ValueError):
+        # 처음 사용할 때 인코딩 파일을 내려받으므로 오프라인이면 실패할 수 있음
+        # (requests 오류는 OSError, 내려받은 파일의 해시 불일치는 ValueError)
+        return None
+
+
+# 모델명별 인코딩 로드 결과 (백그라운드 스레드에서 한 번만 불러옴)
+_encodings: dict[str, "Future[Any]"] = {}
+_encodings_lock = threading.Lock()
+
+
+def _openai_encoding(model_name: str) -> Any:
+    """
+    tiktoken 인코딩 (아직 준비되지 않았으면 None)
+
+    tiktoken은 인코딩 파일을 제한 시간 없이 내려받으므로 별도 스레드에서 불러오고,
+    처음 요청한 호출만 TIKTOKEN_LOAD_TIMEOUT까지 기다립니다. 그 안에 준비되지 않으면
+    준비될 때까지 근사치를 사용합니다.
+    """
+    with _encodings_lock:
+        future = _encodings.get(model_name)
+        first = future is None
+        if future is None:
+            future = _encodings[model_name] = Future()
+            threading.Thread(
+                target=lambda: future.set_result(_load_encoding(model_name)),
+                name="gonagi-saa-tiktoken",
+                daemon=True,
+            ).start()
+
+    try:
+        return future.result(timeout=TIKTOKEN_LOAD_TIMEOUT if first else 0)
+    except TimeoutError:
+        return None
+
+
+def count_tokens(text: str, model_name: str) -> int:
+    """
+    텍스트의 토큰 수
+
+    OpenAI 모델은 tiktoken으로 정확히 세고, 그 외 제공자는 근사치를 사용합니다
+    (ASCII 약 4자당 1토큰, 한글 등 그 외 문자는 1자당 1토큰).
+    """
+    if get_model_provider(model_name) == "openai":
+        encoding = _openai_encoding(model_name)
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def count_message_tokens(messages: list[BaseMessage], model_name: str) -> int:
+    """메시지 목록의 텍스트 토큰 수 (이미지는 제외)"""
+    total = 0
+    for message in messages:
+        if isinstance(message.content, str):
+            total += count_tokens(message.content, model_name)
+        else:
+            for part in message.content:
+                if isinstance(part, str):
+                    total += count_tokens(part, model_name)
+                elif part.get("type") == "text":
+                    total += count_tokens(part["text"], model_name)
+    return total
+
+
+def _turn_text(qna: QnAModel) -> str:
+    return f"{qna.question}\n{qna.answer}"
+
+
+def _summary_line(qna: QnAModel) -> str:
+    tags = f" ({', '.join(qna.tags)})" if qna.tags else ""
+    return f"- {qna.title}{tags}"
+
+
+@dataclass
+class HistoryWindow:
+    """프롬프트에 넣을 히스토리 (최근 턴 원문 + 오래된 턴 요약)"""
+
+    recent: list[QnAModel] = field(default_factory=list)
+    summary: list[str] = field(default_factory=list)
+    compacted_turns: int = 0
+    dropped_turns: int = 0
+    tokens: int = 0
+
+    def to_messages(self) -> list[BaseMessage]:
+        """LLM 메시지로 변환 (요약 → 최근 턴 순서)"""
+        messages: list[BaseMessage] = []
+        if self.summary:
+            messages.append(
+                HumanMessage(content="지금까지 나눈 대화 주제:\n" + "\n".join(self.summary))
+            )
+            messages.append(AIMessage(content="네, 이전 대화 내용을 참고하여 답변하겠습니다."))
+        for qna in self.recent:
+            messages.append(HumanMessage(content=qna.question))
+            messages.append(AIMessage(content=qna.answer))
+        return messages
+
+
+def build_history_window(
+    history: list[QnAModel] | None,
+    model_name: str,
+    max_turns: int | None = None,
+    token_budget: int | None = None,
+) -> HistoryWindow:
+    """
+    토큰 예산 안에서 프롬프트에 넣을 히스토리 구성
+
+    - 최근 max_turns개 턴은 질문/답변 원문 그대로 유지
+    - 그보다 오래된 턴은 "제목 (태그)" 한 줄로 압축
+    - 예산을 넘으면 가장 오래된 원문 턴부터 압축하고, 그래도 넘으면 오래된 요약부터 제거
+    """
+    if not history:
+        return HistoryWindow()
+
+    max_turns = settings.history_max_turns if max_turns is None else max_turns
+    token_budget = settings.history_token_budget if token_budget is None else token_budget
+
+    split = max(len(history) - max_turns, 0)
+    recent = list(history[split:])
+    older = list(history[:split])
+
+    recent_tokens = [count_tokens(_turn_text(qna), model_name) for qna in recent]
+    while recent and sum(recent_tokens) > token_budget:
+        older.append(recent.pop(0))
+        recent_tokens.pop(0)
+
+    summary = [_summary_line(qna) for qna in older]
+    summary_tokens = [count_tokens(line, model_name) for line in summary]
+    dropped = 0
+    while summary and sum(recent_tokens) + sum(summary_tokens) > token_budget:
+        summary.pop(0)
+        summary_tokens.pop(0)
+        dropped += 1
+
+    return HistoryWindow(
+        recent=recent,
+        summary=summary,
+        compacted_turns=len(older) - dropped,
+        dropped_turns=dropped,
+        tokens=sum(recent_tokens) + sum(summary_tokens),
+    )
@@ -0,0 +1,188 @@
+"""SHA-256 기반 이미지 저장소 (파일당 한 번 읽기/인코딩/업로드)"""
+
+import base64
+import hashlib
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from gonagi_saa.constants import (
+    DEFAULT_IMAGE_TARGET_RESOLUTION,
+    IMAGE_MIME_TYPES,
+    MAX_IMAGES,
+)
+from gonagi_saa.images import optimize_image_bytes
+from gonagi_saa.settings import settings
+from gonagi_saa.storage import connect
+
+IMAGE_DB = "images.db"
+# 프로세스 내 메모리 캐시(원본/인코딩 결과)에 보관할 이미지 수
+_MEMORY_CACHE_SIZE = MAX_IMAGES * 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS uploads (
+    digest TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    uploaded_at REAL NOT NULL
+);
+"""
+
+
+@dataclass(frozen=True)
+class EncodedImage:
+    """전송용으로 인코딩된 이미지"""
+
+    digest: str
+    data: bytes
+    mime_type: str
+    original_size: int
+    base64: str = field(repr=False)
+
+    @property
+    def data_url(self) -> str:
+        return f"data:{self.mime_type};base64,{self.base64}"
+
+
+class ImageStore:
+    """
+    이미지 내용의 SHA-256 다이제스트를 키로 사용하는 저장소
+
+    - 파일 경로 → 다이제스트, 다이제스트 → 인코딩 결과는 프로세스 내에서 메모이즈
+    - 다이제스트 → imgbb URL은 CONFIG_DIR 아래 SQLite에 영구 저장
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._digests: dict[tuple[str, int, int], str] = {}
+        # 해시 계산 시 읽은 원본을 인코딩 전까지 보관 (파일을 다시 읽지 않도록)
+        self._raw: OrderedDict[str, bytes] = OrderedDict()
+        self._encoded: OrderedDict[tuple[str, tuple[int, int] | None], EncodedImage] = (
+            OrderedDict()
+        )
+        self._latest: OrderedDict[str, EncodedImage] = OrderedDict()
+
+    @staticmethod
+    def _remember(cache: OrderedDict, key: object, value: object) -> None:
+        """LRU 캐시에 저장 (호출자가 _lock을 잡고 있어야 함)"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > _MEMORY_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _recall(cache: OrderedDict, key: object) -> object | None:
+        """LRU 캐시 조회 (호출자가 _lock을 잡고 있어야 함)"""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    def _read(self, image_path: str) -> tuple[str, bytes | None]:
+        path = Path(image_path).resolve()
+        if not path.exists():
+            raise FileNotFoundError(f"이미지 파일을 찾을 수 없습니다: {image_path}")
+
+        stat = path.stat()
+        file_key = (str(path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._digests.get(file_key)
+            if digest is not None:
+                return digest, self._raw.pop(digest, None)
+
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            self._digests[file_key] = digest
+        return digest, raw
+
+    def digest(self, image_path: str) -> str:
+        """이미지 파일의 SHA-256 다이제스트"""
+        digest, raw = self._read(image_path)
+        if raw is not None:
+            with self._lock:
+                self._remember(self._raw, digest, raw)
+        return digest
+
+    def encoded(
+        self,
+        image_path: str,
+        resolution: tuple[int, int] | None = None,
+    ) -> EncodedImage:
+        """
+        전송용으로 인코딩된 이미지 반환
+
+        resolution이 주어지면 그 해상도로 전처리하고, 없으면 같은 이미지에 대해
+        가장 최근에 인코딩된 결과를 재사용합니다 (없으면 기본 해상도로 전처리).
+        전처리가 꺼져 있거나 Pillow로 읽을 수 없는 이미지는 원본을 그대로 사용합니다.
+        """
+        digest, raw = self._read(image_path)
+        with self._lock:
+            encoded = (
+                self._recall(self._latest, digest)
+                if resolution is None
+                else self._recall(self._encoded, (digest, resolution))
+            )
+        if encoded is not None:
+            return encoded
+
+        if raw is None:
+            raw = Path(image_path).read_bytes()
+
+        data = raw
+        mime_type = IMAGE_MIME_TYPES.get(Path(image_path).suffix.lower(), "image/jpeg")
+        if settings.optimize_images:
+            try:
+                optimized = optimize_image_bytes(
+                    raw, *(resolution or DEFAULT_IMAGE_TARGET_RESOLUTION)
+                )
+            except OSError as e:
+                # stdout은 `ask --json` 출력 전용이므로 경고는 stderr로 보냄
+                print(
+                    f"⚠️  이미지 최적화 실패 ({Path(image_path).name}), 원본을 사용합니다: {e}",
+                    file=sys.stderr,
+                )
+            else:
+                data, mime_type = optimized.data, optimized.mime_type
+
+        encoded = EncodedImage(
+            digest=digest,
+            data=data,
+            mime_type=mime_type,
+            original_size=len(raw),
+            base64=base64.b64encode(data).decode("utf-8"),
+        )
+        with self._lock:
+            self._remember(self._encoded, (digest, resolution), encoded)
+            self._remember(self._latest, digest, encoded)
+        return encoded
+
+    def get_url(self, digest: str) -> str | None:
+        """이전에 업로드된 imgbb URL 조회"""
+        conn = connect(IMAGE_DB)
+        try:
+            conn.executescript(_SCHEMA)
+            row = conn.execute(
+                "SELECT url FROM uploads WHERE digest = ?", (digest,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return row["url"] if row else None
+
+    def put_url(self, digest: str, url: str) -> None:
+        """업로드된 imgbb URL 저장"""
+        conn = connect(IMAGE_DB)
+        try:
+            conn.executescript(_SCHEMA)
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO uploads (digest, url, uploaded_at) VALUES (?, ?, ?)",
+                    (digest, url, time.time()),
+                )
+        finally:
+            conn.close()
+
+
+image_store = ImageStore()
@@ -0,0 +1,108 @@
+"""이미지 전처리 (축소, 메타데이터 제거, 포맷 변환)"""
+
+import io
+from dataclasses import dataclass
+
+from PIL import Image, ImageOps, features
+
+from gonagi_saa.constants import DIAGRAM_MAX_COLORS
+
+# 원본 그대로 전송해도 되는 포맷
+_PASSTHROUGH_FORMATS = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+}
+
+
+@dataclass(frozen=True)
+class OptimizedImage:
+    """전처리된 이미지"""
+
+    data: bytes
+    mime_type: str
+    width: int
+    height: int
+    original_size: int
+
+    @property
+    def saved_bytes(self) -> int:
+        return max(self.original_size - len(self.data), 0)
+
+
+def _is_diagram(image: Image.Image) -> bool:
+    """색상 수가 적으면 다이어그램/스크린샷으로 판단"""
+    sample = image.convert("RGB")
+    if sample.width * sample.height > 256 * 256:
+        ratio = (256 * 256 / (sample.width * sample.height)) ** 0.5
+        sample = sample.resize(
+            (max(int(sample.width * ratio), 1), max(int(sample.height * ratio), 1)),
+            Image.Resampling.NEAREST,
+        )
+    return sample.getcolors(maxcolors=DIAGRAM_MAX_COLORS) is not None
+
+
+def _target_size(width: int, height: int, max_long: int, max_short: int) -> tuple[int, int]:
+    """긴 변/짧은 변 한도에 맞춘 크기 (확대하지 않음)"""
+    long_side, short_side = max(width, height), min(width, height)
+    scale = min(1.0, max_long / long_side, max_short / short_side)
+    return max(round(width * scale), 1), max(round(height * scale), 1)
+
+
+def _encode(image: Image.Image, diagram: bool) -> tuple[bytes, str]:
+    """다이어그램은 PNG, 사진은 WebP(미지원 시 JPEG)로 인코딩 (메타데이터 제외)"""
+    buffer = io.BytesIO()
+    if diagram:
+        image.save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue(), "image/png"
+
+    if features.check("webp"):
+        image.save(buffer, format="WEBP", quality=85, method=4)
+        return buffer.getvalue(), "image/webp"
+
+    image.convert("RGB").save(buffer, format="JPEG", quality=85, optimize=True)
+    return buffer.getvalue(), "image/jpeg"
+
+
+def optimize_image_bytes(raw: bytes, max_long: int, max_short: int) -> OptimizedImage:
+    """
+    이미지 바이트를 목표 해상도로 축소하고 가장 작은 포맷으로 변환
+
+    - EXIF 방향을 반영한 뒤 메타데이터(EXIF, ICC 등)를 제거
+    - 다이어그램/스크린샷은 PNG, 사진은 WebP(또는 JPEG)
+    - 축소가 필요 없고 제거할 메타데이터도 없는데 재인코딩 결과가 더 크면 원본 유지
+
+    Raises:
+        PIL.UnidentifiedImageError: 이미지로 읽을 수 없는 경우
+    """
+    with Image.open(io.BytesIO(raw)) as source:
+        source_format = source.format or ""
+        has_metadata = bool(source.info.get("exif") or source.info.get("icc_profile"))
+
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA", "L", "LA"):
+            has_alpha = "A" in image.mode or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha else "RGB")
+
+        size = _target_size(image.width, image.height, max_long, max_short)
+        resized = size != (image.width, image.height)
+        if resized:
+            image = image.resize(size, Image.Resampling.LANCZOS)
+
+        data, mime_type = _encode(image, _is_diagram(image))
+
+    if (
+        not resized
+        and not has_metadata
+        and source_format in _PASSTHROUGH_FORMATS
+        and len(data) >= len(raw)
+    ):
+        data, mime_type = raw, _PASSTHROUGH_FORMATS[source_format]
+
+    return OptimizedImage(
+        data=data,
+        mime_type=mime_type,
+        width=size[0],
+        height=size[1],
+        original_size=len(raw),
+    )
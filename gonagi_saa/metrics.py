@@ -0,0 +1,41 @@
+"""성능 지표 기록 (CONFIG_DIR 아래 JSONL에 이벤트를 한 줄씩 추가)"""
+
+import json
+import threading
+import time
+from typing import Any
+
+from gonagi_saa.constants import CONFIG_DIR
+
+METRICS_FILE = CONFIG_DIR / "metrics.jsonl"
+
+_lock = threading.Lock()
+
+
+def record_event(kind: str, **fields: Any) -> None:
+    """지표 이벤트 기록 (기록에 실패해도 답변 생성/저장에는 영향을 주지 않음)"""
+    event = {"kind": kind, "at": time.time(), **fields}
+    line = json.dumps(event, ensure_ascii=False) + "\n"
+    try:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        with _lock, open(METRICS_FILE, "a", encoding="utf-8") as f:
+            f.write(line)
+    except OSError:
+        pass
+
+
+def load_events(kind: str | None = None) -> list[dict[str, Any]]:
+    """기록된 지표 이벤트 (kind가 주어지면 해당 종류만)"""
+    if not METRICS_FILE.exists():
+        return []
+
+    events = []
+    with open(METRICS_FILE, encoding="utf-8") as f:
+        for line in f:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if kind is None or event.get("kind") == kind:
+                events.append(event)
+    return events
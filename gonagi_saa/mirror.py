@@ -0,0 +1,256 @@
+"""Notion 데이터베이스 로컬 미러 (last_edited_time 커서 기반 증분 동기화)"""
+
+import json
+import time
+import zlib
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from notion_client import Client as NotionClient
+
+from gonagi_saa.constants import NOTION_MAX_CHILDREN
+from gonagi_saa.notion_writer import NotionWriter
+from gonagi_saa.storage import connect
+
+MIRROR_DB = "mirror.db"
+
+# Notion의 last_edited_time은 분 단위로 기록되므로 커서보다 조금 앞에서부터 다시 조회
+# (이미 받은 페이지는 last_edited_time이 같으면 블록을 다시 받지 않음)
+CURSOR_OVERLAP_SECONDS = 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    created_time TEXT NOT NULL,
+    last_edited_time TEXT NOT NULL,
+    properties BLOB NOT NULL,
+    blocks BLOB NOT NULL,
+    pulled_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_session ON pages (session_id);
+CREATE INDEX IF NOT EXISTS pages_edited ON pages (last_edited_time);
+CREATE TABLE IF NOT EXISTS sync_state (
+    database_id TEXT PRIMARY KEY,
+    cursor TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+# 블록에서 저장하지 않는 필드 (내용과 무관하고 자주 바뀌는 메타데이터)
+_VOLATILE_BLOCK_KEYS = frozenset(
+    {"created_by", "last_edited_by", "created_time", "last_edited_time", "parent", "request_id"}
+)
+
+
+@dataclass
+class PullReport:
+    """pull 결과"""
+
+    scanned: int
+    updated: int
+    unchanged: int
+    failed: int
+    total: int
+    elapsed: float
+    stored_bytes: int
+
+
+def _pack(data: object) -> bytes:
+    """JSON을 압축해서 저장 (블록 JSON은 반복되는 키가 많아 크기가 크게 줄어듦)"""
+    return zlib.compress(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode())
+
+
+def _plain_text(rich_text: list[dict]) -> str:
+    return "".join(part.get("plain_text", "") for part in rich_text)
+
+
+def _page_fields(page: dict) -> tuple[str, str, list[str]]:
+    """페이지 속성에서 (제목, 세션 ID, 태그) 추출"""
+    title, session_id, tags = "", "", []
+    for name, prop in page.get("properties", {}).items():
+        if prop.get("type") == "title":
+            title = _plain_text(prop["title"])
+        elif name == "Session" and prop.get("type") == "rich_text":
+            session_id = _plain_text(prop["rich_text"])
+        elif name == "Tags" and prop.get("type") == "multi_select":
+            tags = [option["name"] for option in prop["multi_select"]]
+    return title, session_id, tags
+
+
+def _compact_block(block: dict) -> dict:
+    return {key: value for key, value in block.items() if key not in _VOLATILE_BLOCK_KEYS}
+
+
+class NotionMirror:
+    """
+    CONFIG_DIR 아래 SQLite에 Notion 데이터베이스 페이지를 저장하는 로컬 미러
+
+    마지막으로 받은 페이지의 last_edited_time을 커서로 저장하고, 다음 pull에서는
+    그 이후에 수정된 페이지만 조회합니다. 페이지 본문(블록)은 속도 제한 안에서
+    병렬로 받아 압축해 저장합니다.
+    """
+
+    def __init__(self) -> None:
+        self._conn = connect(MIRROR_DB)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def cursor(self, database_id: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT cursor FROM sync_state WHERE database_id = ?", (database_id,)
+        ).fetchone()
+        return row["cursor"] if row else None
+
+    def reset(self, database_id: str) -> None:
+        """커서를 지워 다음 pull에서 전체를 다시 받도록 함"""
+        with self._conn:
+            self._conn.execute("DELETE FROM sync_state WHERE database_id = ?", (database_id,))
+
+    def _stored_edit_times(self, page_ids: list[str]) -> dict[str, str]:
+        if not page_ids:
+            return {}
+        rows = self._conn.execute(
+            f"SELECT id, last_edited_time FROM pages WHERE id IN ({','.join('?' * len(page_ids))})",
+            page_ids,
+        ).fetchall()
+        return {row["id"]: row["last_edited_time"] for row in rows}
+
+    def _upsert(self, page: dict, blocks: list[dict]) -> None:
+        title, session_id, tags = _page_fields(page)
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO pages
+                    (id, title, session_id, tags, created_time, last_edited_time,
+                     properties, blocks, pulled_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    page["id"],
+                    title,
+                    session_id,
+                    json.dumps(tags, ensure_ascii=False),
+                    page["created_time"],
+                    page["last_edited_time"],
+                    _pack(page.get("properties", {})),
+                    _pack(blocks),
+                    time.time(),
+                ),
+            )
+
+    def _save_cursor(self, database_id: str, cursor: str) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (database_id, cursor, updated_at) VALUES (?, ?, ?)",
+                (database_id, cursor, time.time()),
+            )
+
+    def pull(
+        self,
+        notion_client: NotionClient,
+        database_id: str,
+        workers: int = 3,
+        on_page: Callable[[dict, Exception | None], None] | None = None,
+    ) -> PullReport:
+        """
+        커서 이후 수정된 페이지를 받아 미러에 반영
+
+        last_edited_time 오름차순으로 한 번에 100개씩 조회하고, 저장된 것과 수정 시각이
+        다른 페이지만 블록을 받습니다. 한 묶음이 모두 반영된 뒤에만 커서를 옮기므로
+        중간에 중단되어도 다음 pull에서 이어서 받습니다.
+        """
+        writer = NotionWriter(notion_client)
+        started_at = time.perf_counter()
+        scanned = updated = unchanged = failed = 0
+
+        query: dict = {
+            "database_id": database_id,
+            "sorts": [{"timestamp": "last_edited_time", "direction": "ascending"}],
+            "page_size": NOTION_MAX_CHILDREN,
+        }
+        cursor = self.cursor(database_id)
+        if cursor is not None:
+            query["filter"] = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": _rewind(cursor)},
+            }
+
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            start_cursor: str | None = None
+            while True:
+                response = writer.query_database(
+                    **query, **({"start_cursor": start_cursor} if start_cursor else {})
+                )
+                pages = response["results"]
+                scanned += len(pages)
+
+                stored = self._stored_edit_times([page["id"] for page in pages])
+                changed = [
+                    page for page in pages if stored.get(page["id"]) != page["last_edited_time"]
+                ]
+                unchanged += len(pages) - len(changed)
+
+                futures = [
+                    (page, executor.submit(fetch_blocks, writer, page["id"])) for page in changed
+                ]
+                for page, future in futures:
+                    try:
+                        self._upsert(page, future.result())
+                    except Exception as e:
+                        failed += 1
+                        if on_page is not None:
+                            on_page(page, e)
+                        continue
+                    updated += 1
+                    if on_page is not None:
+                        on_page(page, None)
+
+                # 실패한 페이지가 있으면 커서를 더 옮기지 않아 다음 pull에서 다시 받음
+                if pages and failed == 0:
+                    self._save_cursor(database_id, pages[-1]["last_edited_time"])
+
+                if not response.get("has_more"):
+                    break
+                start_cursor = response["next_cursor"]
+
+        stats = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(properties) + LENGTH(blocks)), 0) FROM pages"
+        ).fetchone()
+        return PullReport(
+            scanned=scanned,
+            updated=updated,
+            unchanged=unchanged,
+            failed=failed,
+            total=stats[0],
+            elapsed=time.perf_counter() - started_at,
+            stored_bytes=stats[1],
+        )
+
+
+def _rewind(timestamp: str) -> str:
+    """ISO 시각을 CURSOR_OVERLAP_SECONDS만큼 앞당김"""
+    moment = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    return (moment - timedelta(seconds=CURSOR_OVERLAP_SECONDS)).isoformat()
+
+
+def fetch_blocks(writer: NotionWriter, block_id: str) -> list[dict]:
+    """블록의 하위 블록 전체 (페이지네이션, 하위 블록이 있는 블록은 재귀적으로 children에 포함)"""
+    blocks: list[dict] = []
+    start_cursor: str | None = None
+    while True:
+        response = writer.list_block_children(block_id, start_cursor)
+        for block in response["results"]:
+            block = _compact_block(block)
+            if block.get("has_children"):
+                block["children"] = fetch_blocks(writer, block["id"])
+            blocks.append(block)
+        if not response.get("has_more"):
+            return blocks
+        start_cursor = response["next_cursor"]
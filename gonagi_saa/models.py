@@ -2,12 +2,8 @@ from textwrap import dedent
 from pydantic import BaseModel, Field
 
 
-class QnAModel(BaseModel):
-    """질문-답변 모델"""
-
-    question: str = Field(
-        description="사용자의 원본 질문 (텍스트)"
-    )
+class QnAAnswerModel(BaseModel):
+    """LLM이 생성하는 답변 (네이티브 구조화 출력의 도구 스키마로 사용)"""
 
     title: str = Field(
         description=dedent(
@@ -69,6 +65,7 @@ class QnAModel(BaseModel):
     )
 
     tags: list[str] = Field(
+        default_factory=list,
         description=dedent(
             """\
             답변에서 언급된 주요 기술, 서비스, 개념을 태그로 추출.
@@ -80,3 +77,11 @@ class QnAModel(BaseModel):
         ),
         examples=["EC2", "VPC", "보안", "네트워킹"],
     )
+
+
+class QnAModel(QnAAnswerModel):
+    """질문-답변 모델"""
+
+    question: str = Field(
+        description="사용자의 원본 질문 (텍스트)"
+    )
@@ -0,0 +1,75 @@
+"""스트리밍 multipart/form-data 본문 (파일 내용을 복사하지 않고 조금씩 전송)"""
+
+import asyncio
+import mmap
+import os
+import secrets
+from collections.abc import AsyncIterator, Iterator
+
+from gonagi_saa.constants import UPLOAD_CHUNK_SIZE
+
+
+class MultipartBody:
+    """
+    텍스트 필드와 파일 하나로 이루어진 multipart/form-data 본문
+
+    파일 내용(bytes 또는 mmap)은 read()로 요청한 만큼만 잘라 보내므로 base64 문자열이나
+    폼 인코딩된 사본을 만들지 않습니다. 전체 길이를 미리 알 수 있어 requests/httpx가
+    chunked 전송 대신 Content-Length를 붙여 보냅니다.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, str],
+        file_field: str,
+        filename: str,
+        content: bytes | mmap.mmap,
+        mime_type: str,
+    ) -> None:
+        boundary = secrets.token_hex(16)
+        filename = filename.replace('"', "")
+        head = "".join(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'
+            for name, value in fields.items()
+        ) + (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n'
+            f"Content-Type: {mime_type}\r\n\r\n"
+        )
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._parts = (head.encode("utf-8"), content, f"\r\n--{boundary}--\r\n".encode())
+        self._length = sum(len(part) for part in self._parts)
+        self._position = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """읽기 위치 이동 (재시도 시 처음부터 다시 보내기 위해 사용)"""
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._position, os.SEEK_END: self._length}[whence]
+        self._position = min(max(base + offset, 0), self._length)
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        """현재 위치부터 최대 size 바이트 (음수면 끝까지)"""
+        end = self._length if size < 0 else min(self._position + size, self._length)
+        chunks = []
+        offset = 0
+        for part in self._parts:
+            start, stop = max(self._position - offset, 0), min(end - offset, len(part))
+            if start < stop:
+                chunks.append(part[start:stop])
+            offset += len(part)
+        self._position = end
+        return b"".join(chunks)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+    async def aiter(self) -> AsyncIterator[bytes]:
+        """비동기 전송용 (mmap 페이지를 읽는 동안 이벤트 루프를 막지 않도록 스레드에서 읽음)"""
+        while chunk := await asyncio.to_thread(self.read, UPLOAD_CHUNK_SIZE):
+            yield chunk
@@ -0,0 +1,197 @@
+"""Notion 쓰기 (요청 속도 제한, 블록 분할 전송, 429 재시도)"""
+
+import asyncio
+import random
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from notion_client import AsyncClient as AsyncNotionClient
+from notion_client import Client as NotionClient
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+
+from gonagi_saa.constants import (
+    NOTION_BACKOFF_BASE_SECONDS,
+    NOTION_BACKOFF_MAX_SECONDS,
+    NOTION_MAX_CHILDREN,
+    NOTION_MAX_RETRIES,
+)
+from gonagi_saa.ratelimit import TokenBucket, get_rate_limiter
+from gonagi_saa.settings import settings
+from gonagi_saa.tracing import span
+
+
+def notion_rate_limiter() -> TokenBucket:
+    """프로세스 안의 모든 Notion 요청이 공유하는 속도 제한기"""
+    return get_rate_limiter("notion", settings.notion_requests_per_second)
+
+
+def _warn_discard_failed(page_id: str, error: Exception) -> None:
+    # stdout은 `ask --json` 출력 전용이므로 경고는 stderr로 보냄
+    print(
+        f"⚠️  본문 추가에 실패한 Notion 페이지를 보관 처리하지 못했습니다 ({page_id}): {error}",
+        file=sys.stderr,
+    )
+
+
+def _is_rate_limited(error: HTTPResponseError) -> bool:
+    return error.status == 429
+
+
+def _backoff_delay(attempt: int, error: HTTPResponseError) -> float:
+    """
+    재시도 전 대기 시간(초)
+
+    Retry-After 헤더가 있으면 그 시간에 지터를 더하고, 없으면 지수 백오프 범위 안에서
+    무작위로 고릅니다 (여러 작업이 동시에 재시도하며 다시 몰리지 않도록).
+    """
+    retry_after = error.headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            return float(retry_after) + random.uniform(0, NOTION_BACKOFF_BASE_SECONDS)
+        except ValueError:
+            pass
+
+    ceiling = min(NOTION_BACKOFF_MAX_SECONDS, NOTION_BACKOFF_BASE_SECONDS * 2**attempt)
+    return random.uniform(0, ceiling)
+
+
+def _split_children(children: list[dict]) -> tuple[list[dict], list[list[dict]]]:
+    """블록을 페이지 생성 요청에 넣을 첫 묶음과 나머지 추가 요청 묶음으로 분할"""
+    batches = [
+        children[start : start + NOTION_MAX_CHILDREN]
+        for start in range(NOTION_MAX_CHILDREN, len(children), NOTION_MAX_CHILDREN)
+    ]
+    return children[:NOTION_MAX_CHILDREN], batches
+
+
+class NotionWriter:
+    """
+    모든 Notion 요청이 거치는 writer
+
+    - 프로세스 전역 토큰 버킷으로 요청 속도 제한 (settings.notion_requests_per_second)
+    - 429 응답은 Retry-After(없으면 지수 백오프)에 지터를 더해 재시도합니다.
+      429는 Notion이 요청을 처리하지 않았다는 뜻이므로 다시 보내도 중복되지 않습니다.
+    - 블록이 100개를 넘으면 첫 100개로 페이지를 만들고 나머지는
+      blocks.children.append로 100개씩 나눠 추가합니다.
+    """
+
+    def __init__(self, client: NotionClient, max_retries: int = NOTION_MAX_RETRIES) -> None:
+        self.client = client
+        self.max_retries = max_retries
+        self.limiter = notion_rate_limiter()
+
+    def request(self, method: Callable[..., Any], **kwargs: Any) -> Any:
+        """속도 제한과 429 재시도를 적용하여 Notion API 호출"""
+        attempt = 0
+        while True:
+            with span("notion.throttle"):
+                self.limiter.acquire()
+            try:
+                with span("notion.request", method=method.__qualname__, attempt=attempt):
+                    return method(**kwargs)
+            except HTTPResponseError as e:
+                if not _is_rate_limited(e) or attempt >= self.max_retries:
+                    raise
+                time.sleep(_backoff_delay(attempt, e))
+                attempt += 1
+
+    def create_page(self, children: list[dict], **kwargs: Any) -> dict:
+        """페이지 생성 (블록 수 제한을 넘는 본문은 나눠서 추가)"""
+        first, rest = _split_children(children)
+        page = self.request(self.client.pages.create, children=first, **kwargs)
+
+        try:
+            for batch in rest:
+                self.request(
+                    self.client.blocks.children.append,
+                    block_id=page["id"],
+                    children=batch,
+                )
+        except Exception:
+            self._discard(page["id"])
+            raise
+
+        return page
+
+    def query_database(self, **kwargs: Any) -> dict:
+        """databases.query 호출"""
+        return self.request(self.client.databases.query, **kwargs)
+
+    def retrieve_database(self, database_id: str) -> dict:
+        """databases.retrieve 호출 (속성 스키마 확인용)"""
+        return self.request(self.client.databases.retrieve, database_id=database_id)
+
+    def update_database(self, database_id: str, **kwargs: Any) -> dict:
+        """databases.update 호출"""
+        return self.request(self.client.databases.update, database_id=database_id, **kwargs)
+
+    def list_block_children(self, block_id: str, start_cursor: str | None = None) -> dict:
+        """blocks.children.list 호출 (한 번에 최대 100개)"""
+        kwargs: dict[str, Any] = {"block_id": block_id, "page_size": NOTION_MAX_CHILDREN}
+        if start_cursor is not None:
+            kwargs["start_cursor"] = start_cursor
+        return self.request(self.client.blocks.children.list, **kwargs)
+
+    def _discard(self, page_id: str) -> None:
+        """본문 추가에 실패한 페이지를 보관 처리 (재시도 시 반쪽짜리 페이지가 남지 않도록)"""
+        try:
+            self.request(self.client.pages.update, page_id=page_id, archived=True)
+        except (HTTPResponseError, RequestTimeoutError) as e:
+            _warn_discard_failed(page_id, e)
+
+
+class AsyncNotionWriter:
+    """NotionWriter의 비동기 버전 (같은 속도 제한기를 공유)"""
+
+    def __init__(
+        self, client: AsyncNotionClient, max_retries: int = NOTION_MAX_RETRIES
+    ) -> None:
+        self.client = client
+        self.max_retries = max_retries
+        self.limiter = notion_rate_limiter()
+
+    async def request(self, method: Callable[..., Awaitable[Any]], **kwargs: Any) -> Any:
+        """속도 제한과 429 재시도를 적용하여 Notion API 호출"""
+        attempt = 0
+        while True:
+            with span("notion.throttle"):
+                await self.limiter.acquire_async()
+            try:
+                with span("notion.request", method=method.__qualname__, attempt=attempt):
+                    return await method(**kwargs)
+            except HTTPResponseError as e:
+                if not _is_rate_limited(e) or attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(_backoff_delay(attempt, e))
+                attempt += 1
+
+    async def create_page(self, children: list[dict], **kwargs: Any) -> dict:
+        """페이지 생성 (블록 수 제한을 넘는 본문은 나눠서 추가)"""
+        first, rest = _split_children(children)
+        page = await self.request(self.client.pages.create, children=first, **kwargs)
+
+        try:
+            for batch in rest:
+                await self.request(
+                    self.client.blocks.children.append,
+                    block_id=page["id"],
+                    children=batch,
+                )
+        except Exception:
+            await self._discard(page["id"])
+            raise
+
+        return page
+
+    async def query_database(self, **kwargs: Any) -> dict:
+        """databases.query 호출"""
+        return await self.request(self.client.databases.query, **kwargs)
+
+    async def _discard(self, page_id: str) -> None:
+        """본문 추가에 실패한 페이지를 보관 처리 (재시도 시 반쪽짜리 페이지가 남지 않도록)"""
+        try:
+            await self.request(self.client.pages.update, page_id=page_id, archived=True)
+        except (HTTPResponseError, RequestTimeoutError) as e:
+            _warn_discard_failed(page_id, e)
@@ -0,0 +1,349 @@
+"""Notion 저장 아웃박스 (로컬 저널에 먼저 기록한 뒤 Notion에 전송)"""
+
+import json
+import sqlite3
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from notion_client import APIResponseError
+from notion_client import Client as NotionClient
+
+from gonagi_saa.constants import NOTION_ENTRY_PROPERTY
+from gonagi_saa.models import QnAModel
+from gonagi_saa.notion_writer import NotionWriter
+from gonagi_saa.settings import settings
+from gonagi_saa.storage import connect
+
+OUTBOX_DB = "outbox.db"
+
+# 전송 중(sending) 상태로 이 시간 이상 지나면 중단된 것으로 보고 다시 가져옴
+STALE_CLAIM_SECONDS = 5 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    image_paths TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    page_id TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_status ON entries (status, created_at);
+"""
+
+# 항목 상태
+# - pending: 전송 전이거나, Notion이 요청을 거부하여 다시 보내도 안전함
+# - sending: 어떤 프로세스가 전송 중
+# - uncertain: 전송 결과를 알 수 없음 (타임아웃, 5xx 등) → 재전송 전에 페이지 존재 확인
+# - done: 저장 완료
+PENDING, SENDING, UNCERTAIN, DONE = "pending", "sending", "uncertain", "done"
+
+
+@dataclass
+class OutboxEntry:
+    """아웃박스 항목"""
+
+    id: str
+    session_id: str
+    qna: QnAModel
+    image_paths: list[str]
+    status: str
+    attempts: int
+    last_error: str | None
+    created_at: float
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "OutboxEntry":
+        return cls(
+            id=row["id"],
+            session_id=row["session_id"],
+            qna=QnAModel.model_validate_json(row["payload"]),
+            image_paths=json.loads(row["image_paths"]),
+            status=row["status"],
+            attempts=row["attempts"],
+            last_error=row["last_error"],
+            created_at=row["created_at"],
+        )
+
+
+@dataclass
+class SyncReport:
+    """동기화 결과"""
+
+    sent: int
+    failed: int
+    remaining: int
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        return self.sent / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class Outbox:
+    """
+    CONFIG_DIR 아래 SQLite에 저장할 답변을 먼저 기록하는 아웃박스
+
+    각 항목의 id가 멱등성 키이며 페이지의 Entry 속성에 함께 기록됩니다. 항목은
+    원자적으로 점유(claim)한 뒤 전송하며, 결과를 알 수 없는 전송은 다시 보내기 전에
+    Notion에서 같은 Entry 값을 가진 페이지가 있는지 확인하므로 재시도해도 중복
+    페이지가 생기지 않습니다.
+    """
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = connect(OUTBOX_DB)
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def enqueue(
+        self,
+        qna: QnAModel,
+        session_id: str,
+        image_paths: list[str] | None = None,
+    ) -> str:
+        """답변을 아웃박스에 기록하고 항목 id(멱등성 키) 반환"""
+        entry_id = uuid.uuid4().hex
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    """
+                    INSERT INTO entries
+                        (id, session_id, payload, image_paths, status, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        entry_id,
+                        session_id,
+                        qna.model_dump_json(),
+                        json.dumps(image_paths or []),
+                        PENDING,
+                        now,
+                        now,
+                    ),
+                )
+        finally:
+            conn.close()
+        return entry_id
+
+    def pending_entries(self) -> list[OutboxEntry]:
+        """아직 저장되지 않은 항목 (오래된 순)"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT * FROM entries WHERE status != ? ORDER BY created_at", (DONE,)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [OutboxEntry.from_row(row) for row in rows]
+
+    def all_entries(self) -> list[OutboxEntry]:
+        """저장 여부와 관계없이 모든 항목 (오래된 순)"""
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT * FROM entries ORDER BY created_at").fetchall()
+        finally:
+            conn.close()
+        return [OutboxEntry.from_row(row) for row in rows]
+
+    def count_pending(self) -> int:
+        """아직 저장되지 않은 항목 수"""
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE status != ?", (DONE,)
+            ).fetchone()[0]
+        finally:
+            conn.close()
+
+    def send(
+        self,
+        notion_client: NotionClient,
+        entry_id: str,
+        verbose: bool = True,
+    ) -> str | None:
+        """
+        항목 하나를 Notion에 저장하고 페이지 id 반환
+
+        다른 프로세스가 전송 중이거나 이미 저장된 항목이면 None을 반환합니다.
+        """
+        claimed = self._claim(entry_id)
+        if claimed is None:
+            return None
+        entry, previous_status = claimed
+
+        try:
+            dedupe = _ensure_entry_property(notion_client)
+        except Exception as e:
+            self._update(entry.id, PENDING if previous_status == PENDING else UNCERTAIN, error=str(e))
+            raise
+
+        # 이전 전송 결과를 알 수 없으면 이미 만들어진 페이지가 있는지 먼저 확인
+        if dedupe and previous_status in (SENDING, UNCERTAIN):
+            page_id = _find_existing_page(notion_client, entry)
+            if page_id is not None:
+                self._update(entry.id, DONE, page_id=page_id)
+                return page_id
+
+        # services는 LLM 관련 모듈까지 불러오므로 실제로 보낼 때만 import
+        from gonagi_saa.services import save_to_notion
+
+        try:
+            page_id = save_to_notion(
+                notion_client,
+                entry.qna,
+                entry.session_id,
+                entry.image_paths or None,
+                verbose=verbose,
+                entry_id=entry.id if dedupe else None,
+            )
+        except APIResponseError as e:
+            # 4xx는 Notion이 요청을 처리하지 않은 것이므로 그대로 다시 보내도 안전
+            status = PENDING if 400 <= e.status < 500 else UNCERTAIN
+            self._update(entry.id, status, error=str(e))
+            raise
+        except Exception as e:
+            self._update(entry.id, UNCERTAIN, error=str(e))
+            raise
+
+        self._update(entry.id, DONE, page_id=page_id)
+        return page_id
+
+    def flush(
+        self,
+        notion_client: NotionClient,
+        on_progress: Callable[[OutboxEntry, Exception | None], None] | None = None,
+    ) -> SyncReport:
+        """저장되지 않은 항목을 모두 Notion에 전송"""
+        started_at = time.perf_counter()
+        sent = failed = 0
+
+        for entry in self.pending_entries():
+            try:
+                page_id = self.send(notion_client, entry.id, verbose=False)
+            except Exception as e:
+                failed += 1
+                if on_progress is not None:
+                    on_progress(entry, e)
+                continue
+
+            if page_id is not None:
+                sent += 1
+                if on_progress is not None:
+                    on_progress(entry, None)
+
+        return SyncReport(
+            sent=sent,
+            failed=failed,
+            remaining=self.count_pending(),
+            elapsed=time.perf_counter() - started_at,
+        )
+
+    def _claim(self, entry_id: str) -> tuple[OutboxEntry, str] | None:
+        """항목을 전송 중 상태로 원자적으로 점유하고 (항목, 이전 상태) 반환"""
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute(
+                    "SELECT * FROM entries WHERE id = ?", (entry_id,)
+                ).fetchone()
+                if row is None or row["status"] == DONE:
+                    return None
+                if (
+                    row["status"] == SENDING
+                    and now - row["updated_at"] < STALE_CLAIM_SECONDS
+                ):
+                    return None
+
+                conn.execute(
+                    """
+                    UPDATE entries
+                    SET status = ?, attempts = attempts + 1, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (SENDING, now, entry_id),
+                )
+        finally:
+            conn.close()
+        return OutboxEntry.from_row(row), row["status"]
+
+    def _update(
+        self,
+        entry_id: str,
+        status: str,
+        page_id: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    """
+                    UPDATE entries
+                    SET status = ?, page_id = COALESCE(?, page_id), last_error = ?, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (status, page_id, error, time.time(), entry_id),
+                )
+        finally:
+            conn.close()
+
+
+# 데이터베이스별 Entry 속성 사용 가능 여부 (프로세스당 한 번만 확인)
+_entry_property_ready: dict[str, bool] = {}
+
+
+def _ensure_entry_property(notion_client: NotionClient) -> bool:
+    """
+    데이터베이스에 Entry(텍스트) 속성이 없으면 추가하고, 사용할 수 있으면 True 반환
+
+    통합에 데이터베이스 수정 권한이 없어 추가할 수 없으면 경고만 남기고 False를
+    반환합니다. 이때는 Entry 속성 없이 저장하므로 결과를 알 수 없던 항목을 다시
+    보낼 때 중복 페이지가 생길 수 있습니다.
+    """
+    database_id = settings.notion_database_id
+    ready = _entry_property_ready.get(database_id)
+    if ready is not None:
+        return ready
+
+    writer = NotionWriter(notion_client)
+    properties = writer.retrieve_database(database_id)["properties"]
+    ready = True
+    if NOTION_ENTRY_PROPERTY not in properties:
+        try:
+            writer.update_database(
+                database_id, properties={NOTION_ENTRY_PROPERTY: {"rich_text": {}}}
+            )
+        except APIResponseError as e:
+            # 5xx는 일시적인 오류일 수 있으므로 다음에 다시 시도
+            if not 400 <= e.status < 500:
+                raise
+            ready = False
+            print(
+                f"⚠️  Notion 데이터베이스에 '{NOTION_ENTRY_PROPERTY}' 속성을 추가하지 못했습니다"
+                f" ({e}). 중복 저장 방지 없이 저장합니다.",
+                file=sys.stderr,
+            )
+    _entry_property_ready[database_id] = ready
+    return ready
+
+
+def _find_existing_page(notion_client: NotionClient, entry: OutboxEntry) -> str | None:
+    """이 항목으로 이미 만들어진 페이지 검색 (Entry 속성이 항목 id와 같은 페이지)"""
+    response = NotionWriter(notion_client).query_database(
+        database_id=settings.notion_database_id,
+        filter={"property": NOTION_ENTRY_PROPERTY, "rich_text": {"equals": entry.id}},
+        page_size=1,
+    )
+    results = response["results"]
+    return results[0]["id"] if results else None
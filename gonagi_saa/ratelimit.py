@@ -0,0 +1,96 @@
+"""토큰 버킷 속도 제한"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    토큰 버킷 속도 제한 (스레드 안전)
+
+    rate: 초당 채워지는 토큰 수, capacity: 한 번에 몰아서 쓸 수 있는 최대 토큰 수
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+
+        self.rate = rate
+        self._fixed_capacity = capacity is not None
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """지난 시간만큼 토큰 채우기 (lock을 잡은 상태에서 호출)"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def _reserve(self, tokens: float) -> float:
+        """토큰을 예약하고 기다려야 하는 시간(초) 반환 (부족분은 미리 차감하여 순서 보장)"""
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def set_rate(self, rate: float) -> None:
+        """
+        rate 변경 (지금까지 쌓인 토큰은 이전 rate로 계산)
+
+        capacity를 직접 지정하지 않았다면 capacity도 새 rate에 맞춰 조정합니다.
+        """
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+
+        with self._lock:
+            self._refill()
+            self.rate = rate
+            if not self._fixed_capacity:
+                self.capacity = max(1.0, rate)
+                self._tokens = min(self._tokens, self.capacity)
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """토큰이 바로 있으면 쓰고 True, 없으면 기다리지 않고 False (급하지 않은 요청용)"""
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 얻을 때까지 대기하고, 대기한 시간(초) 반환"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """acquire의 비동기 버전 (이벤트 루프를 막지 않고 대기)"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+_limiters: dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, rate: float) -> TokenBucket:
+    """
+    이름별로 프로세스 전역에서 공유하는 속도 제한기
+
+    이미 있는 제한기와 rate가 다르면 (데몬에서 `--rpm`이나 설정이 바뀐 경우)
+    새 rate로 갱신합니다.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = _limiters[name] = TokenBucket(rate)
+        elif limiter.rate != rate:
+            limiter.set_rate(rate)
+        return limiter
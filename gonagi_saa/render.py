@@ -0,0 +1,84 @@
+"""터미널 답변 출력"""
+
+from typing import Any
+
+from gonagi_saa.models import QnAModel
+
+DIVIDER = "=" * 60
+
+# (필드명, 헤더, 푸터) - 모델이 JSON을 생성하는 순서와 동일
+_SECTIONS: tuple[tuple[str, str, str], ...] = (
+    ("title", f"\n{DIVIDER}\n📌 제목: ", f"\n{DIVIDER}\n\n"),
+    ("answer", "💡 답변:\n\n", "\n\n"),
+    ("exam_tips", "\n📝 시험 팁:\n", "\n"),
+    ("common_traps", "\n⚠️  주의사항:\n", "\n"),
+    ("tags", "\n🏷️  태그: ", f"\n\n{DIVIDER}\n\n"),
+)
+
+
+def _section_text(key: str, value: Any) -> str:
+    """필드 값을 출력용 문자열로 변환 (부분 값이 늘어나도 앞부분은 유지됨)"""
+    if value is None:
+        return ""
+    if key in ("exam_tips", "common_traps"):
+        return "\n".join(f"  {item}" for item in value if item is not None)
+    if key == "tags":
+        return ", ".join(str(tag) for tag in value if tag is not None)
+    return str(value)
+
+
+class StreamingAnswerPrinter:
+    """부분 파싱된 답변을 받아 새로 도착한 부분만 이어서 출력"""
+
+    def __init__(self) -> None:
+        self._current = -1
+        self._printed: dict[str, str] = {}
+        self._opened: set[str] = set()
+
+    def update(self, partial: dict[str, Any]) -> None:
+        """부분 답변(dict)을 반영하여 출력 갱신"""
+        for index, (key, _, _) in enumerate(_SECTIONS):
+            if key not in partial or index < self._current:
+                continue
+            if index > self._current:
+                self._close_current()
+                self._open(index)
+            self._write(key, _section_text(key, partial[key]))
+
+    def finish(self, result: QnAModel) -> None:
+        """최종 답변으로 남은 부분을 모두 출력"""
+        if self._current >= 0:
+            key = _SECTIONS[self._current][0]
+            self._write(key, _section_text(key, getattr(result, key)))
+            self._close_current()
+
+        # 스트리밍 중 순서가 어긋나 건너뛴 섹션은 마지막에 출력
+        for index, (key, _, _) in enumerate(_SECTIONS):
+            if key in self._opened:
+                continue
+            self._open(index)
+            self._write(key, _section_text(key, getattr(result, key)))
+            self._close_current()
+
+    def _open(self, index: int) -> None:
+        key, header, _ = _SECTIONS[index]
+        self._current = index
+        self._opened.add(key)
+        self._printed[key] = ""
+        print(header, end="", flush=True)
+
+    def _close_current(self) -> None:
+        if self._current < 0:
+            return
+        key, _, footer = _SECTIONS[self._current]
+        if key in ("exam_tips", "common_traps") and not self._printed[key]:
+            footer = ""
+        print(footer, end="", flush=True)
+        self._current = -1
+
+    def _write(self, key: str, text: str) -> None:
+        printed = self._printed[key]
+        if len(text) <= len(printed):
+            return
+        print(text[len(printed):], end="", flush=True)
+        self._printed[key] = text
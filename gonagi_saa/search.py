@@ -0,0 +1,236 @@
+"""저장된 Q&A 로컬 전문 검색 (SQLite FTS5 색인)"""
+
+import hashlib
+import sqlite3
+import time
+from dataclasses import dataclass
+
+from gonagi_saa.models import QnAModel
+from gonagi_saa.storage import connect, escape_like
+
+SEARCH_DB = "search.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS qna (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    session_id TEXT NOT NULL,
+    model TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS qna_session ON qna (session_id, created_at);
+CREATE TABLE IF NOT EXISTS qna_tags (
+    qna_id INTEGER NOT NULL REFERENCES qna (id) ON DELETE CASCADE,
+    tag TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (qna_id, tag)
+);
+CREATE INDEX IF NOT EXISTS qna_tags_tag ON qna_tags (tag);
+"""
+
+# FTS 테이블 (rowid = qna.id). trigram 토크나이저는 띄어쓰기 없이 조사가 붙는 한국어도
+# 부분 문자열로 찾을 수 있어서 우선 사용하고, 지원하지 않는 SQLite(3.34 미만)에서는 unicode61 사용
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS qna_fts USING fts5(
+    title, question, answer, exam_tips, common_traps, tags,
+    tokenize = '{tokenizer}'
+);
+"""
+
+# bm25 열 가중치 (title, question, answer, exam_tips, common_traps, tags)
+_BM25_WEIGHTS = (10.0, 4.0, 1.0, 2.0, 2.0, 6.0)
+
+# trigram 색인으로 찾을 수 있는 최소 검색어 길이 (더 짧은 검색어는 LIKE로 찾음)
+_TRIGRAM_MIN_LENGTH = 3
+
+# 짧은 검색어를 LIKE로 비교할 때 쓰는 전체 텍스트
+_TEXT_COLUMNS = " || ' ' || ".join(
+    ["title", "question", "answer", "exam_tips", "common_traps", "tags"]
+)
+
+
+@dataclass
+class SearchHit:
+    """검색 결과"""
+
+    qna: QnAModel
+    session_id: str
+    model: str
+    created_at: float
+    snippet: str
+    score: float
+
+
+def _entry_key(qna: QnAModel, session_id: str) -> str:
+    """같은 세션에서 같은 답변을 다시 색인하지 않도록 하는 키"""
+    material = "\0".join([session_id, qna.question, qna.title, qna.answer])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _phrase(term: str) -> str:
+    """FTS5 검색 구문으로 쓸 수 있도록 따옴표로 감싸기 (AND/OR 같은 연산자로 해석되지 않도록)"""
+    return '"' + term.replace('"', '""') + '"'
+
+
+class SearchIndex:
+    """CONFIG_DIR 아래 SQLite FTS5에 Q&A를 색인하고 검색"""
+
+    def __init__(self) -> None:
+        self._conn = connect(SEARCH_DB)
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        self.trigram = self._create_fts_table()
+
+    def _create_fts_table(self) -> bool:
+        """FTS 테이블 생성 후 trigram 토크나이저 사용 여부 반환"""
+        row = self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'qna_fts'"
+        ).fetchone()
+        if row is not None:
+            return "trigram" in row["sql"]
+
+        try:
+            self._conn.executescript(_FTS_SCHEMA.format(tokenizer="trigram"))
+            return True
+        except sqlite3.OperationalError:
+            self._conn.executescript(_FTS_SCHEMA.format(tokenizer="unicode61"))
+            return False
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def add(
+        self,
+        qna: QnAModel,
+        session_id: str,
+        model_name: str = "",
+        created_at: float | None = None,
+    ) -> bool:
+        """답변 색인 (이미 색인된 답변이면 False)"""
+        with self._conn:
+            cursor = self._conn.execute(
+                """
+                INSERT OR IGNORE INTO qna (key, session_id, model, payload, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    _entry_key(qna, session_id),
+                    session_id,
+                    model_name,
+                    qna.model_dump_json(),
+                    created_at if created_at is not None else time.time(),
+                ),
+            )
+            if cursor.rowcount == 0:
+                return False
+
+            qna_id = cursor.lastrowid
+            self._conn.execute(
+                """
+                INSERT INTO qna_fts
+                    (rowid, title, question, answer, exam_tips, common_traps, tags)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    qna_id,
+                    qna.title,
+                    qna.question,
+                    qna.answer,
+                    "\n".join(qna.exam_tips),
+                    "\n".join(qna.common_traps),
+                    " ".join(qna.tags),
+                ),
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO qna_tags (qna_id, tag) VALUES (?, ?)",
+                [(qna_id, tag.strip()) for tag in qna.tags if tag.strip()],
+            )
+        return True
+
+    def search(
+        self,
+        query: str = "",
+        tags: list[str] | None = None,
+        session_id: str | None = None,
+        limit: int = 10,
+    ) -> list[SearchHit]:
+        """
+        검색어와 필터로 답변 검색
+
+        검색어는 공백으로 나눈 모든 단어를 포함해야 하며 bm25 점수(제목, 태그 가중)로
+        정렬합니다. tags는 모두 붙어 있어야 하고(대소문자 무시), session_id는 접두어로
+        비교합니다. 검색어가 없으면 최근 답변부터 반환합니다.
+        """
+        terms = query.split()
+        if self.trigram:
+            indexed = [term for term in terms if len(term) >= _TRIGRAM_MIN_LENGTH]
+            short = [term for term in terms if len(term) < _TRIGRAM_MIN_LENGTH]
+        else:
+            indexed, short = terms, []
+
+        conditions: list[str] = []
+        params: list[object] = []
+        if indexed:
+            conditions.append("qna_fts MATCH ?")
+            params.append(" AND ".join(_phrase(term) for term in indexed))
+        for term in short:
+            conditions.append(f"({_TEXT_COLUMNS}) LIKE ? ESCAPE '\\'")
+            params.append(f"%{escape_like(term)}%")
+        for tag in tags or []:
+            conditions.append(
+                "qna.id IN (SELECT qna_id FROM qna_tags WHERE tag = ?)"
+            )
+            params.append(tag)
+        if session_id:
+            conditions.append("qna.session_id LIKE ? || '%' ESCAPE '\\'")
+            params.append(escape_like(session_id))
+
+        if indexed:
+            score = f"bm25(qna_fts, {', '.join(map(str, _BM25_WEIGHTS))})"
+            snippet = "snippet(qna_fts, -1, '[', ']', '…', 16)"
+            order = "score, qna.created_at DESC"
+        else:
+            score = "0.0"
+            snippet = "substr(qna_fts.answer, 1, 80)"
+            order = "qna.created_at DESC"
+
+        where = " AND ".join(conditions) or "1"
+        rows = self._conn.execute(
+            f"""
+            SELECT qna.payload, qna.session_id, qna.model, qna.created_at,
+                   {snippet} AS snippet, {score} AS score
+            FROM qna_fts JOIN qna ON qna.id = qna_fts.rowid
+            WHERE {where}
+            ORDER BY {order}
+            LIMIT ?
+            """,
+            (*params, limit),
+        ).fetchall()
+
+        return [
+            SearchHit(
+                qna=QnAModel.model_validate_json(row["payload"]),
+                session_id=row["session_id"],
+                model=row["model"],
+                created_at=row["created_at"],
+                snippet=" ".join(row["snippet"].split()),
+                score=-row["score"],
+            )
+            for row in rows
+        ]
+
+    def count(self) -> int:
+        """색인된 답변 수"""
+        return self._conn.execute("SELECT COUNT(*) FROM qna").fetchone()[0]
+
+
+def index_answer(qna: QnAModel, session_id: str, model_name: str = "") -> None:
+    """답변 하나를 색인 (색인에 실패해도 답변 생성/저장에는 영향을 주지 않음)"""
+    try:
+        index = SearchIndex()
+        try:
+            index.add(qna, session_id, model_name)
+        finally:
+            index.close()
+    except sqlite3.Error:
+        pass
@@ -1,16 +1,234 @@
-from typing import cast
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cache
 from pathlib import Path
 from textwrap import dedent
+from typing import TYPE_CHECKING, Any, cast
 
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.messages import HumanMessage
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import (
+    AIMessageChunk,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+)
 from langchain_core.output_parsers import PydanticOutputParser
-from notion_client import Client as NotionClient
-from notionize import notionize
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
+from langchain_core.utils.json import parse_json_markdown, parse_partial_json
+from pydantic import BaseModel, ValidationError, create_model
 
-from gonagi_saa.models import QnAModel
-from gonagi_saa.utils import llm_model_factory, prepare_image_content, upload_image_to_imgbb
+from gonagi_saa.cache import AnswerCache, make_cache_key
+from gonagi_saa.constants import (
+    MAX_IMAGES,
+    NOTION_ENTRY_PROPERTY,
+    STRUCTURED_OUTPUT_UNSUPPORTED_MODELS,
+)
+from gonagi_saa.history import HistoryWindow, build_history_window, count_message_tokens
+from gonagi_saa.image_store import image_store
+from gonagi_saa.metrics import record_event
+from gonagi_saa.models import QnAAnswerModel, QnAModel
 from gonagi_saa.settings import settings
+from gonagi_saa.tags import MAX_TAGS, extract_tags, normalize_tags
+from gonagi_saa.tracing import span
+from gonagi_saa.utils import (
+    get_model_provider,
+    is_vision_model,
+    llm_model_factory,
+    prepare_image_content,
+    upload_image_to_imgbb,
+    upload_image_to_imgbb_async,
+)
+
+# Notion/HTTP 클라이언트는 저장할 때만 불러옴 (답변 생성 경로의 시작 시간 단축)
+if TYPE_CHECKING:
+    import httpx
+    from notion_client import AsyncClient as AsyncNotionClient
+    from notion_client import Client as NotionClient
+
+# 시스템 프롬프트 (format_instructions는 프로세스당 한 번만 렌더링)
+SYSTEM_PROMPT = dedent(
+    """\
+    You are an AWS SAA (Solutions Architect Associate) exam preparation expert.
+
+    Provide clear, well-structured answers in Korean with the following components:
+
+    1. **answer**: Core concept explanation - clear and concise with key features and how it works
+    2. **exam_tips**: Exam-specific tips including:
+       - Common question patterns in the exam
+       - Key keywords that indicate the correct answer
+       - Important characteristics to remember
+    3. **common_traps**: Common pitfalls and wrong answer patterns:
+       - Easily confused similar services/concepts
+       - Typical mistakes candidates make
+       - Characteristics of incorrect choices
+
+    Write in Korean and use markdown formatting (bullet points, bold text) for readability.
+
+    {format_instructions}
+    """
+)
+
+
+def _silent(*args: Any, **kwargs: Any) -> None:
+    """출력하지 않는 log 함수"""
+
+
+@cache
+def _output_schema(native: bool, tags: bool = True) -> type[BaseModel]:
+    """
+    LLM에 전달하는 응답 스키마 (native이면 도구 스키마, 아니면 포맷 지시문용 스키마)
+
+    tags=False이면 tags 필드만 뺀 같은 이름의 스키마를 만들어 모델이 태그를 생성하지
+    않도록 합니다 (도구 이름은 그대로 유지, 태그는 로컬에서 추출).
+    """
+    schema = QnAAnswerModel if native else QnAModel
+    if tags:
+        return schema
+    fields: dict[str, Any] = {
+        name: (field.annotation, field)
+        for name, field in schema.model_fields.items()
+        if name != "tags"
+    }
+    return create_model(schema.__name__, __doc__=schema.__doc__, **fields)
+
+
+@cache
+def _system_prompt(native: bool = False, tags: bool = True) -> str:
+    """
+    포맷 지시문까지 렌더링된 시스템 프롬프트 (프로세스 내 메모이즈)
+
+    native=True이면 응답 형식을 도구 스키마로 전달하므로 JSON 스키마를 넣지 않습니다.
+    """
+    if native:
+        format_instructions = f"Respond by calling the `{QnAAnswerModel.__name__}` tool."
+    else:
+        parser = PydanticOutputParser(pydantic_object=_output_schema(False, tags))
+        format_instructions = parser.get_format_instructions()
+    return SYSTEM_PROMPT.format(format_instructions=format_instructions)
+
+
+def _with_cache_control(message: BaseMessage) -> BaseMessage:
+    """Anthropic 프롬프트 캐시 지점 표시 (이 메시지까지의 프리픽스를 캐시)"""
+    content = message.content
+    blocks = [{"type": "text", "text": content}] if isinstance(content, str) else list(content)
+    blocks[-1] = {**blocks[-1], "cache_control": {"type": "ephemeral"}}
+    return message.model_copy(update={"content": blocks})
+
+
+def _system_message(cacheable: bool, native: bool = False) -> SystemMessage:
+    """시스템 프롬프트 메시지 (cacheable이면 Anthropic 캐시 지점 표시)"""
+    message = SystemMessage(content=_system_prompt(native, not settings.local_tags))
+    return cast(SystemMessage, _with_cache_control(message)) if cacheable else message
+
+
+def _report_cached_tokens(message: BaseMessage, log: Callable[..., None] = print) -> None:
+    """응답 메타데이터의 입력 토큰/캐시 적중 토큰 출력"""
+    usage = getattr(message, "usage_metadata", None)
+    if not usage or not usage.get("input_tokens"):
+        return
+
+    details = usage.get("input_token_details") or {}
+    cache_read = details.get("cache_read") or 0
+    cache_creation = details.get("cache_creation") or 0
+    input_tokens = usage["input_tokens"]
+
+    summary = f"🧊 입력 {input_tokens:,} 토큰 중 캐시 적중 {cache_read:,} 토큰 ({cache_read / input_tokens:.0%})"
+    if cache_creation:
+        summary += f", 캐시 저장 {cache_creation:,} 토큰"
+    log(summary)
+
+
+def _lookup_cache(cache_key: str) -> QnAModel | None:
+    """캐시된 답변 조회 (호출한 스레드에서 연결을 열고 닫음)"""
+    with span("cache.lookup"):
+        cache = AnswerCache()
+        try:
+            return cache.get(cache_key)
+        finally:
+            cache.close()
+
+
+def _cached_answer(
+    model_name: str,
+    question: str,
+    image_paths: list[str] | None,
+    window: HistoryWindow,
+    hedge_model: str | None = None,
+    log: Callable[..., None] = print,
+) -> tuple[str, QnAModel | None]:
+    """캐시 키와 캐시된 답변 (있으면 이번 질문 원문으로 바꿔서 반환)"""
+    cache_key = make_cache_key(model_name, question, image_paths, window, hedge_model)
+    cached = _lookup_cache(cache_key)
+    if cached is not None:
+        log("⚡ 캐시된 답변을 사용합니다.")
+        cached.question = question
+    return cache_key, cached
+
+
+def _store_cache(cache_key: str, model_name: str, result: QnAModel) -> None:
+    """답변을 캐시에 저장 (호출한 스레드에서 연결을 열고 닫음)"""
+    cache = AnswerCache()
+    try:
+        cache.put(cache_key, model_name, result)
+    finally:
+        cache.close()
+
+
+def _hedge_model(model_name: str, image_paths: list[str] | None) -> str | None:
+    """헤지 요청에 사용할 모델 (설정되지 않았거나 이미지를 처리할 수 없으면 None)"""
+    hedge_model = settings.hedge_model
+    if not hedge_model or hedge_model == model_name:
+        return None
+    if image_paths and not is_vision_model(hedge_model):
+        return None
+    return hedge_model
+
+
+def hedge_loop_models(model_name: str, hedge: bool = True) -> list[str]:
+    """동기 API(answer_question)가 헤지 루프에서 쓰는 모델 (헤지를 쓰지 않으면 빈 목록)"""
+    hedge_model = _hedge_model(model_name, None) if hedge else None
+    return [model_name, hedge_model] if hedge_model is not None else []
+
+
+# 동기 API의 헤지 요청을 실행하는 이벤트 루프 (프로세스당 하나, 전용 스레드에서 계속 실행)
+_hedge_loop: asyncio.AbstractEventLoop | None = None
+_hedge_loop_lock = threading.Lock()
+
+
+def hedge_event_loop() -> asyncio.AbstractEventLoop:
+    """헤지 요청을 실행하는 이벤트 루프 (처음 호출할 때 전용 스레드에서 시작)"""
+    global _hedge_loop
+    with _hedge_loop_lock:
+        if _hedge_loop is None:
+            _hedge_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_hedge_loop.run_forever, name="gonagi-saa-hedge", daemon=True
+            ).start()
+        return _hedge_loop
+
+
+def _run_on_hedge_loop[T](coro: Coroutine[Any, Any, T]) -> T:
+    """
+    코루틴을 전용 이벤트 루프 스레드에서 실행하고 결과를 기다림
+
+    호출한 스레드에 이미 이벤트 루프가 돌고 있어도(Jupyter, 비동기 앱) 동작하고,
+    매번 새 루프를 만들지 않으므로 루프별로 재사용하는 모델 인스턴스도 유지됩니다.
+    기다리는 중에 중단되면(Ctrl+C) 루프 안의 작업도 취소합니다.
+    """
+    loop = hedge_event_loop()
+
+    # run_coroutine_threadsafe는 호출한 쪽의 contextvars를 복사하므로 span 부모 관계도 유지됨
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
 
 
 def answer_question(
@@ -18,48 +236,120 @@ def answer_question(
     question: str,
     image_paths: list[str] | None = None,
     history: list[QnAModel] | None = None,
+    on_partial: Callable[[dict[str, Any]], None] | None = None,
+    use_cache: bool = True,
+    verbose: bool = True,
+    hedge: bool = True,
 ) -> QnAModel:
-    """질문에 대한 답변 생성 (텍스트 + 이미지 지원, 대화 히스토리 포함)"""
-    parser = PydanticOutputParser(pydantic_object=QnAModel)
-
-    # 프롬프트 구성
-    system_prompt = dedent(
-        """\
-        You are an AWS SAA (Solutions Architect Associate) exam preparation expert.
-
-        Provide clear, well-structured answers in Korean with the following components:
-
-        1. **answer**: Core concept explanation - clear and concise with key features and how it works
-        2. **exam_tips**: Exam-specific tips including:
-           - Common question patterns in the exam
-           - Key keywords that indicate the correct answer
-           - Important characteristics to remember
-        3. **common_traps**: Common pitfalls and wrong answer patterns:
-           - Easily confused similar services/concepts
-           - Typical mistakes candidates make
-           - Characteristics of incorrect choices
-
-        Write in Korean and use markdown formatting (bullet points, bold text) for readability.
-
-        {format_instructions}
-        """
-    )
+    """
+    질문에 대한 답변 생성 (텍스트 + 이미지 지원, 대화 히스토리 포함)
+
+    on_partial이 주어지면 토큰 스트리밍으로 생성하며, JSON이 부분적으로
+    파싱될 때마다 지금까지의 필드(dict)를 전달합니다.
+    히스토리는 최근 턴만 원문으로 넣고 오래된 턴은 토큰 예산에 맞춰 압축합니다.
+    같은 모델/질문/히스토리/이미지/설정 조합은 디스크 캐시에서 바로 반환합니다.
+    verbose=False이면 진행 메시지를 출력하지 않습니다 (배치 처리용).
+    settings.hedge_model이 설정되어 있고 hedge=True이면 헤지 요청을 사용합니다.
+    """
+    with span("answer_question", model=model_name, images=len(image_paths or [])):
+        log = print if verbose else _silent
+        window = build_history_window(history, model_name)
+        hedge_model = _hedge_model(model_name, image_paths) if hedge else None
+
+        def generate() -> QnAModel:
+            if hedge_model is not None:
+                return _run_on_hedge_loop(
+                    _agenerate_hedged(
+                        model_name, hedge_model, question, image_paths, window, on_partial, verbose
+                    )
+                )
+            return _generate_answer(model_name, question, image_paths, window, on_partial, verbose)
+
+        if not (use_cache and settings.cache_enabled):
+            return generate()
+
+        cache_key, cached = _cached_answer(
+            model_name, question, image_paths, window, hedge_model, log
+        )
+        if cached is not None:
+            return cached
+
+        result = generate()
+        _store_cache(cache_key, model_name, result)
+        return result
+
+
+async def answer_question_async(
+    model_name: str,
+    question: str,
+    image_paths: list[str] | None = None,
+    history: list[QnAModel] | None = None,
+    on_partial: Callable[[dict[str, Any]], None] | None = None,
+    use_cache: bool = True,
+    verbose: bool = True,
+    hedge: bool = True,
+) -> QnAModel:
+    """
+    answer_question의 비동기 버전
+
+    LLM 호출은 ainvoke/astream으로 수행하고, 이미지 인코딩과 캐시 조회 같은
+    블로킹 작업은 스레드에서 처리하므로 하나의 이벤트 루프에서 여러 질문을
+    동시에 처리할 수 있습니다.
+    """
+    with span("answer_question", model=model_name, images=len(image_paths or [])):
+        log = print if verbose else _silent
+        window = build_history_window(history, model_name)
+        hedge_model = _hedge_model(model_name, image_paths) if hedge else None
+
+        async def generate() -> QnAModel:
+            if hedge_model is not None:
+                return await _agenerate_hedged(
+                    model_name, hedge_model, question, image_paths, window, on_partial, verbose
+                )
+            return await _agenerate_answer(
+                model_name, question, image_paths, window, on_partial, verbose
+            )
+
+        if not (use_cache and settings.cache_enabled):
+            return await generate()
 
-    # 메시지 구성 (히스토리 + 현재 질문)
-    messages: list = [("system", system_prompt)]
+        cache_key, cached = await asyncio.to_thread(
+            _cached_answer, model_name, question, image_paths, window, hedge_model, log
+        )
+        if cached is not None:
+            return cached
+
+        result = await generate()
+        await asyncio.to_thread(_store_cache, cache_key, model_name, result)
+        return result
+
+
+def _build_prompt(
+    model_name: str,
+    question: str,
+    image_parts: list[dict[str, Any]],
+    history: HistoryWindow,
+    log: Callable[..., None] = print,
+    native: bool = False,
+) -> tuple[ChatPromptTemplate, dict[str, Any]]:
+    """프롬프트와 입력값 구성 (동기/비동기 생성에서 공유)"""
+    cacheable = get_model_provider(model_name) == "anthropic"
 
-    # 대화 히스토리 추가
-    if history:
-        for prev_qna in history:
-            messages.append(("human", prev_qna.question))
-            messages.append(("assistant", prev_qna.answer))
+    # 메시지 구성 (고정 프리픽스 → 히스토리 → 현재 질문)
+    # 제공자의 프롬프트 캐시가 적중하도록 시스템 프롬프트와 히스토리를 앞쪽에 고정
+    messages: list = [_system_message(cacheable, native)]
+
+    # 대화 히스토리 추가 (최근 턴 원문 + 오래된 턴 요약)
+    history_messages = history.to_messages()
+    if cacheable and history_messages:
+        history_messages[-1] = _with_cache_control(history_messages[-1])
+    messages.extend(history_messages)
 
     # 현재 질문 추가
-    if image_paths:
+    if image_parts:
         # 이미지가 있는 경우: HumanMessage content를 리스트로 구성
         content_parts: list[dict | str] = [{"type": "text", "text": question}]
-        for image_path in image_paths:
-            content_parts.append(prepare_image_content(image_path))
+        content_parts.extend(image_parts)
         messages.append(HumanMessage(content=content_parts))
     else:
         # 텍스트만 있는 경우
@@ -67,92 +357,605 @@ def answer_question(
 
     prompt = ChatPromptTemplate.from_messages(messages)
 
-    model = llm_model_factory(model_name)
-    chain = prompt | model | parser
+    inputs = {} if image_parts else {"question": question}
 
-    print("🔥 질문에 대한 답변을 생성합니다...")
+    # 턴마다 프롬프트 크기 표시 (히스토리가 길어져도 일정하게 유지되는지 확인용)
+    # 출력하지 않을 때는 프롬프트를 렌더링해서 토큰을 세지 않음
+    if log is _silent:
+        return prompt, inputs
 
-    if image_paths:
-        result = cast(
-            QnAModel,
-            chain.invoke({"format_instructions": parser.get_format_instructions()}),
+    prompt_tokens = count_message_tokens(prompt.format_messages(**inputs), model_name)
+    if history.recent or history.summary:
+        log(
+            f"📏 프롬프트: 약 {prompt_tokens:,} 토큰 "
+            f"(히스토리 {history.tokens:,} 토큰, 원문 {len(history.recent)}턴, "
+            f"요약 {history.compacted_turns}턴, 제외 {history.dropped_turns}턴)"
         )
     else:
-        result = cast(
-            QnAModel,
-            chain.invoke(
-                {
-                    "question": question,
-                    "format_instructions": parser.get_format_instructions(),
-                }
-            ),
-        )
+        log(f"📏 프롬프트: 약 {prompt_tokens:,} 토큰")
+
+    return prompt, inputs
 
-    # question 필드에 원본 질문 저장
-    result.question = question
 
+def _use_native_output(model_name: str) -> bool:
+    """네이티브 구조화 출력(도구 호출)을 사용할지 여부"""
+    return (
+        settings.native_structured_output
+        and model_name not in STRUCTURED_OUTPUT_UNSUPPORTED_MODELS
+    )
+
+
+def _bind_model(model_name: str, native: bool) -> Runnable:
+    """모델 생성 (native이면 답변 스키마를 도구로 바인딩하고 호출을 강제)"""
+    model = llm_model_factory(model_name)
+    if not native:
+        return model
+    schema = _output_schema(True, not settings.local_tags)
+    return model.bind_tools([schema], tool_choice=schema.__name__)
+
+
+def _parse_answer(
+    message: BaseMessage,
+    question: str,
+    log: Callable[..., None] = print,
+    native: bool = False,
+) -> QnAModel:
+    """응답 메시지를 QnAModel로 파싱 (native이면 도구 호출 인자를 검증)"""
+    _report_cached_tokens(message, log)
+
+    if native:
+        tool_calls = getattr(message, "tool_calls", None)
+        if not tool_calls:
+            raise OutputParserException("모델이 구조화된 응답(도구 호출)을 반환하지 않았습니다.")
+        try:
+            result = QnAModel.model_validate({**tool_calls[0]["args"], "question": question})
+        except ValidationError as e:
+            raise OutputParserException(f"구조화된 응답 검증 실패: {e}") from e
+    else:
+        parser = PydanticOutputParser(pydantic_object=QnAModel)
+        result = cast(QnAModel, parser.invoke(message))
+
+        # question 필드에 원본 질문 저장
+        result.question = question
+
+    result.tags = _resolve_tags(result)
     return result
 
 
-def save_to_notion(
-    notion_client: NotionClient,
-    qna: QnAModel,
-    session_id: str,
-    image_paths: list[str] | None = None,
+def _resolve_tags(result: QnAModel) -> list[str]:
+    """
+    답변에 붙일 태그 확정
+
+    local_tags이면 본문에서 사전으로 추출하고, 그래도 모델이 태그를 준 경우 사전 표기로
+    통일하여 뒤에 붙입니다. 꺼져 있으면 모델이 준 태그를 그대로 사용합니다.
+    """
+    if not settings.local_tags:
+        return result.tags
+    return normalize_tags([*extract_tags(result), *result.tags])[:MAX_TAGS]
+
+
+def _record_generation(
+    model_name: str,
+    native: bool,
+    message: BaseMessage | None,
+    ok: bool,
 ) -> None:
-    """질문-답변을 Notion에 저장 (이미지 포함)"""
-    print("🔥 Notion에 저장합니다...")
+    """출력 방식별 토큰 사용량과 파싱 성공 여부 기록 (`gonagi-saa stats`로 비교)"""
+    usage = getattr(message, "usage_metadata", None) or {}
+    record_event(
+        "generation",
+        model=model_name,
+        mode="native" if native else "parser",
+        tags="local" if settings.local_tags else "llm",
+        input_tokens=usage.get("input_tokens"),
+        output_tokens=usage.get("output_tokens"),
+        ok=ok,
+    )
+
+
+def _prepare_chain(
+    model_name: str,
+    question: str,
+    image_parts: list[dict[str, Any]],
+    history: HistoryWindow,
+    log: Callable[..., None],
+    native: bool,
+) -> tuple[Runnable, dict[str, Any]]:
+    """프롬프트를 구성하고 모델과 연결 (동기/비동기 생성에서 공유)"""
+    with span("prompt.build", mode="native" if native else "parser"):
+        prompt, inputs = _build_prompt(model_name, question, image_parts, history, log, native)
+        chain = prompt | _bind_model(model_name, native)
+
+    log("🔥 질문에 대한 답변을 생성합니다...")
+    return chain, inputs
+
+
+@contextmanager
+def _generating(model_name: str, native: bool, stream: bool) -> Iterator[None]:
+    """LLM 호출 구간 (응답을 받지 못해 실패하면 결과 기록)"""
+    try:
+        with span(
+            "llm.generate", model=model_name, mode="native" if native else "parser", stream=stream
+        ):
+            yield
+    except OutputParserException:
+        _record_generation(model_name, native, None, ok=False)
+        raise
+
+
+def _finish_generation(
+    model_name: str,
+    question: str,
+    message: BaseMessage,
+    log: Callable[..., None],
+    native: bool,
+) -> QnAModel:
+    """응답 메시지를 파싱하고 결과 기록"""
+    try:
+        with span("llm.parse", mode="native" if native else "parser"):
+            result = _parse_answer(message, question, log, native)
+    except OutputParserException:
+        _record_generation(model_name, native, message, ok=False)
+        raise
+
+    _record_generation(model_name, native, message, ok=True)
+    return result
+
+
+def _announce_fallback(
+    error: OutputParserException, native: bool, log: Callable[..., None]
+) -> None:
+    """네이티브 출력이 실패했으면 포맷 지시문 방식으로 다시 생성한다고 알림 (아니면 예외 전달)"""
+    if not native:
+        raise error
+    log(
+        "⚠️  구조화된 응답을 받지 못해 포맷 지시문 방식으로 다시 생성합니다: "
+        f"{str(error).splitlines()[0]}"
+    )
+
+
+def _generate_once(
+    model_name: str,
+    question: str,
+    image_parts: list[dict[str, Any]],
+    history: HistoryWindow,
+    on_partial: Callable[[dict[str, Any]], None] | None,
+    log: Callable[..., None],
+    native: bool,
+) -> QnAModel:
+    """지정한 출력 방식(native/포맷 지시문)으로 한 번 생성하고 결과 기록"""
+    chain, inputs = _prepare_chain(model_name, question, image_parts, history, log, native)
+
+    with _generating(model_name, native, stream=on_partial is not None):
+        if on_partial is None:
+            message = chain.invoke(inputs)
+        else:
+            collector = _StreamCollector(on_partial, log, native)
+            for chunk in chain.stream(inputs):
+                collector.add(chunk)
+            message = collector.message()
+
+    return _finish_generation(model_name, question, message, log, native)
+
+
+def _generate_answer(
+    model_name: str,
+    question: str,
+    image_paths: list[str] | None,
+    history: HistoryWindow,
+    on_partial: Callable[[dict[str, Any]], None] | None,
+    verbose: bool = True,
+) -> QnAModel:
+    """
+    LLM을 호출하여 답변 생성
+
+    지원하는 모델은 네이티브 구조화 출력(도구 호출)을 사용하고, 응답을 파싱할 수
+    없으면 포맷 지시문 방식으로 한 번 더 생성합니다.
+    """
+    log = print if verbose else _silent
+    image_parts = [
+        prepare_image_content(image_path, model_name, verbose=verbose)
+        for image_path in image_paths or []
+    ]
+
+    native = _use_native_output(model_name)
+    try:
+        return _generate_once(
+            model_name, question, image_parts, history, on_partial, log, native
+        )
+    except OutputParserException as e:
+        _announce_fallback(e, native, log)
+        return _generate_once(
+            model_name, question, image_parts, history, on_partial, log, native=False
+        )
+
+
+async def _agenerate_once(
+    model_name: str,
+    question: str,
+    image_parts: list[dict[str, Any]],
+    history: HistoryWindow,
+    on_partial: Callable[[dict[str, Any]], None] | None,
+    log: Callable[..., None],
+    native: bool,
+    on_first_token: Callable[[], None] | None = None,
+) -> QnAModel:
+    """_generate_once의 비동기 버전"""
+    chain, inputs = _prepare_chain(model_name, question, image_parts, history, log, native)
+
+    stream = on_partial is not None or on_first_token is not None
+    with _generating(model_name, native, stream):
+        if not stream:
+            message = await chain.ainvoke(inputs)
+        else:
+            collector = _StreamCollector(on_partial or _silent, log, native, on_first_token)
+            async for chunk in chain.astream(inputs):
+                collector.add(chunk)
+            message = collector.message()
+
+    return _finish_generation(model_name, question, message, log, native)
+
+
+async def _agenerate_answer(
+    model_name: str,
+    question: str,
+    image_paths: list[str] | None,
+    history: HistoryWindow,
+    on_partial: Callable[[dict[str, Any]], None] | None,
+    verbose: bool = True,
+    on_first_token: Callable[[], None] | None = None,
+) -> QnAModel:
+    """
+    LLM을 비동기로 호출하여 답변 생성 (이미지는 스레드에서 병렬로 인코딩)
+
+    on_first_token이 주어지면 스트리밍으로 생성하며 첫 토큰을 받을 때 호출합니다.
+    """
+    log = print if verbose else _silent
+    image_parts = list(
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    prepare_image_content, image_path, model_name, verbose=verbose
+                )
+                for image_path in image_paths or []
+            )
+        )
+    )
+
+    native = _use_native_output(model_name)
+    try:
+        return await _agenerate_once(
+            model_name, question, image_parts, history, on_partial, log, native, on_first_token
+        )
+    except OutputParserException as e:
+        _announce_fallback(e, native, log)
+        return await _agenerate_once(
+            model_name, question, image_parts, history, on_partial, log, False, on_first_token
+        )
+
+
+async def _agenerate_hedged(
+    model_name: str,
+    hedge_model: str,
+    question: str,
+    image_paths: list[str] | None,
+    history: HistoryWindow,
+    on_partial: Callable[[dict[str, Any]], None] | None,
+    verbose: bool = True,
+) -> QnAModel:
+    """
+    헤지 요청으로 답변 생성
+
+    기본 모델이 settings.hedge_delay_seconds 안에 첫 토큰을 보내지 않으면 같은
+    프롬프트를 hedge_model에도 보내고, 먼저 유효한 QnAModel을 반환한 쪽을 사용합니다
+    (나머지 요청은 취소). on_partial이 주어지면 먼저 첫 토큰을 보낸 모델의 부분 결과를
+    전달하고, 화면에 보여 준 답변과 반환하는 답변이 같도록 그 모델로 확정하여 다른
+    요청을 바로 취소합니다. 승자와 절약 시간의 하한 추정치는 지표 파일에 기록합니다.
+    """
+    log = print if verbose else _silent
+    delay = settings.hedge_delay_seconds
+    started_at = time.perf_counter()
+    first_token_at: dict[str, float] = {}
+    primary_first_token = asyncio.Event()
+    # 부분 결과를 화면에 보내는 모델 (먼저 첫 토큰을 보낸 쪽으로 고정)
+    streaming: dict[str, str] = {}
+    running: dict[str, asyncio.Task[QnAModel]] = {}
+
+    def commit_to(name: str) -> None:
+        """스트리밍 중인 모델만 남기고 나머지 요청 취소"""
+        for other, task in running.items():
+            if other != name:
+                task.cancel()
+
+    def forward_from(name: str) -> Callable[[dict[str, Any]], None]:
+        def forward(partial: dict[str, Any]) -> None:
+            if streaming.get("model") == name and on_partial is not None:
+                on_partial(partial)
+
+        return forward
+
+    def mark_first_token(name: str) -> Callable[[], None]:
+        def mark() -> None:
+            first_token_at.setdefault(name, time.perf_counter() - started_at)
+            if streaming.setdefault("model", name) == name and on_partial is not None:
+                commit_to(name)
+            if name == model_name:
+                primary_first_token.set()
+
+        return mark
+
+    primary = asyncio.create_task(
+        _agenerate_answer(
+            model_name,
+            question,
+            image_paths,
+            history,
+            forward_from(model_name),
+            verbose,
+            on_first_token=mark_first_token(model_name),
+        )
+    )
+    running[model_name] = primary
+    waiter = asyncio.create_task(primary_first_token.wait())
+    try:
+        await asyncio.wait(
+            {primary, waiter}, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        waiter.cancel()
+
+    if primary.done() or primary_first_token.is_set():
+        result = await primary
+        record_event(
+            "hedge",
+            primary=model_name,
+            secondary=hedge_model,
+            hedged=False,
+            winner=model_name,
+            winner_provider=get_model_provider(model_name),
+            elapsed=round(time.perf_counter() - started_at, 3),
+            latency_saved_min=0.0,
+        )
+        return result
+
+    log(f"🐢 {delay:.1f}초 동안 첫 토큰이 없어 {hedge_model}에도 요청합니다...")
+    secondary = asyncio.create_task(
+        _agenerate_answer(
+            hedge_model,
+            question,
+            image_paths,
+            history,
+            forward_from(hedge_model),
+            verbose=False,
+            on_first_token=mark_first_token(hedge_model),
+        )
+    )
+    running[hedge_model] = secondary
+
+    tasks = {primary: model_name, secondary: hedge_model}
+    pending: set[asyncio.Task[QnAModel]] = {primary, secondary}
+    errors: dict[str, BaseException] = {}
+    winner: str | None = None
+    result: QnAModel | None = None
+    try:
+        while pending and winner is None:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            # 동시에 끝나면 기본 모델 우선
+            for task in sorted(done, key=lambda task: task is not primary):
+                if task.cancelled():
+                    continue
+                error = task.exception()
+                if error is None:
+                    winner, result = tasks[task], task.result()
+                    break
+                errors[tasks[task]] = error
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if winner is None or result is None:
+        raise errors.get(model_name) or next(iter(errors.values()))
+
+    elapsed = time.perf_counter() - started_at
+    latency_saved_min = 0.0
+    if winner == hedge_model:
+        # 취소한 기본 모델의 실제 완료 시각은 알 수 없으므로 하한만 추정: 기본 모델도 첫
+        # 토큰 이후 헤지 모델만큼 생성 시간이 걸리고, 첫 토큰을 아직 받지 못했다면
+        # 지금 받았다고 가정 (실제 절약 시간은 대개 이보다 큼)
+        generation_time = elapsed - first_token_at.get(hedge_model, elapsed)
+        primary_estimate = first_token_at.get(model_name, elapsed) + generation_time
+        latency_saved_min = max(primary_estimate - elapsed, 0.0)
+
+    log(f"🏁 {winner} 답변 사용 ({elapsed:.1f}초, 절약 시간 최소 {latency_saved_min:.1f}초 추정)")
+    record_event(
+        "hedge",
+        primary=model_name,
+        secondary=hedge_model,
+        hedged=True,
+        winner=winner,
+        winner_provider=get_model_provider(winner),
+        elapsed=round(elapsed, 3),
+        latency_saved_min=round(latency_saved_min, 3),
+        errors={name: str(error) for name, error in errors.items()},
+    )
+    return result
+
+
+def _partial_fields(message: AIMessageChunk, native: bool) -> dict[str, Any] | None:
+    """지금까지 받은 응답을 부분 JSON으로 파싱 (native이면 도구 호출 인자)"""
+    try:
+        if native:
+            if not message.tool_call_chunks:
+                return None
+            partial = parse_partial_json(message.tool_call_chunks[0].get("args") or "")
+        else:
+            partial = parse_json_markdown(message.text())
+    except ValueError:
+        return None
+    return partial if isinstance(partial, dict) and partial else None
+
+
+def _has_tokens(chunk: AIMessageChunk) -> bool:
+    return bool(chunk.content or chunk.tool_call_chunks)
+
+
+class _StreamCollector:
+    """
+    스트리밍으로 받은 청크를 모아 부분 JSON을 전달 (동기/비동기 스트리밍에서 공유)
+
+    첫 토큰을 받으면 수신 시간을 표시하고 on_first_token을 호출합니다.
+    """
+
+    def __init__(
+        self,
+        on_partial: Callable[[dict[str, Any]], None],
+        log: Callable[..., None] = print,
+        native: bool = False,
+        on_first_token: Callable[[], None] | None = None,
+    ) -> None:
+        self.on_partial = on_partial
+        self.log = log
+        self.native = native
+        self.on_first_token = on_first_token
+        self._started_at = time.perf_counter()
+        self._first_token_received = False
+        self._message: AIMessageChunk | None = None
+        self._last_partial: dict[str, Any] | None = None
+
+    def add(self, chunk: AIMessageChunk) -> None:
+        if not self._first_token_received and _has_tokens(chunk):
+            self._first_token_received = True
+            self.log(f"⚡ 첫 토큰 수신: {time.perf_counter() - self._started_at:.2f}초")
+            if self.on_first_token is not None:
+                self.on_first_token()
+        self._message = chunk if self._message is None else self._message + chunk
+
+        partial = _partial_fields(self._message, self.native)
+        if partial is not None and partial != self._last_partial:
+            self._last_partial = partial
+            self.on_partial(partial)
+
+    def message(self) -> AIMessageChunk:
+        """전체 응답 메시지 (토큰을 하나도 받지 못했으면 OutputParserException)"""
+        if self._message is None or not self._first_token_received:
+            raise OutputParserException("모델이 빈 응답을 반환했습니다.")
+        return self._message
+
+
+def _external_image_block(image_url: str) -> dict:
+    """Notion image 블록 (질문 바로 아래)"""
+    return {
+        "object": "block",
+        "type": "image",
+        "image": {
+            "type": "external",
+            "external": {"url": image_url},
+        },
+    }
+
+
+def _failed_image_block(path: Path) -> dict:
+    """업로드 실패 시 파일명만 텍스트로 기록하는 문단 블록"""
+    return {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": [
+                {
+                    "type": "text",
+                    "text": {
+                        "content": f"📎 첨부 이미지 (업로드 실패): {path.name}"
+                    },
+                }
+            ]
+        },
+    }
+
+
+def _uploaded_image_url(path: Path, log: Callable[..., None] = print) -> tuple[str, str | None]:
+    """이미지 해시와 이미 업로드한 같은 내용 이미지의 URL (없으면 None)"""
+    digest = image_store.digest(str(path))
+    image_url = image_store.get_url(digest)
+    if image_url is not None:
+        log(f"♻️  이미 업로드된 이미지: {path.name}")
+    else:
+        log(f"📤 이미지를 imgbb에 업로드 중: {path.name}")
+    return digest, image_url
+
+
+def _remember_image_url(digest: str, image_url: str, log: Callable[..., None] = print) -> None:
+    image_store.put_url(digest, image_url)
+    log(f"✅ 업로드 완료: {image_url}")
+
+
+def _image_block(path: Path, imgbb_api_key: str, log: Callable[..., None] = print) -> dict:
+    """이미지를 imgbb에 업로드하고 Notion image 블록 반환 (실패 시 파일명 문단)"""
+    try:
+        # 같은 내용의 이미지를 이미 업로드했다면 저장된 URL 재사용
+        digest, image_url = _uploaded_image_url(path, log)
+        if image_url is None:
+            image_url = upload_image_to_imgbb(str(path), imgbb_api_key)
+            _remember_image_url(digest, image_url, log)
+        return _external_image_block(image_url)
+    except Exception as e:
+        log(f"⚠️  이미지 업로드 실패 ({path.name}): {e}")
+        return _failed_image_block(path)
+
+
+async def _aimage_block(
+    path: Path,
+    imgbb_api_key: str,
+    http_client: "httpx.AsyncClient",
+    log: Callable[..., None] = print,
+) -> dict:
+    """_image_block의 비동기 버전 (해시 계산과 URL 조회/저장은 스레드에서 수행)"""
+    try:
+        digest, image_url = await asyncio.to_thread(_uploaded_image_url, path, log)
+        if image_url is None:
+            image_url = await upload_image_to_imgbb_async(
+                str(path), imgbb_api_key, http_client
+            )
+            await asyncio.to_thread(_remember_image_url, digest, image_url, log)
+        return _external_image_block(image_url)
+    except Exception as e:
+        log(f"⚠️  이미지 업로드 실패 ({path.name}): {e}")
+        return _failed_image_block(path)
+
+
+def _uploadable_images(
+    image_paths: list[str] | None,
+    log: Callable[..., None] = print,
+) -> tuple[str, list[Path]]:
+    """업로드할 이미지와 imgbb API Key (키가 없으면 이미지를 건너뜀)"""
+    if not image_paths:
+        return "", []
+
+    imgbb_api_key = settings.imgbb_api_key.get_secret_value()
+    if not imgbb_api_key:
+        log("⚠️  imgbb API Key가 설정되지 않았습니다. 이미지를 건너뜁니다.")
+        return "", []
+
+    return imgbb_api_key, [Path(p) for p in image_paths if Path(p).exists()]
+
+
+def _page_children(qna: QnAModel, image_blocks: list[dict]) -> list[dict]:
+    """Notion 페이지 본문 블록 구성 (질문 → 이미지 → 답변 → 시험 팁 → 주의사항)"""
+    with span("notionize"):
+        return _build_page_children(qna, image_blocks)
+
+
+def _build_page_children(qna: QnAModel, image_blocks: list[dict]) -> list[dict]:
+    # notionize는 저장할 때만 필요하므로 답변만 생성하는 경로에서는 불러오지 않음
+    from notionize import notionize
 
     # 질문 블록 구성 (코드 블록으로 감싸서 개행 유지)
     question_content = f"## 질문\n\n```\n{qna.question.rstrip()}\n```"
     children = notionize(question_content)
 
     # 이미지를 질문 바로 아래에 추가
-    if image_paths:
-        imgbb_api_key = settings.imgbb_api_key.get_secret_value()
-
-        if not imgbb_api_key:
-            print("⚠️  imgbb API Key가 설정되지 않았습니다. 이미지를 건너뜁니다.")
-        else:
-            for image_path in image_paths:
-                path = Path(image_path)
-                if path.exists():
-                    try:
-                        print(f"📤 이미지를 imgbb에 업로드 중: {path.name}")
-                        # imgbb에 이미지 업로드
-                        image_url = upload_image_to_imgbb(str(path), imgbb_api_key)
-                        print(f"✅ 업로드 완료: {image_url}")
-
-                        # Notion image 블록 추가 (질문 바로 아래)
-                        children.append(
-                            {
-                                "object": "block",
-                                "type": "image",
-                                "image": {
-                                    "type": "external",
-                                    "external": {"url": image_url},
-                                },
-                            }
-                        )
-                    except Exception as e:
-                        print(f"⚠️  이미지 업로드 실패 ({path.name}): {e}")
-                        # 실패 시 파일명만 텍스트로 기록
-                        children.append(
-                            {
-                                "object": "block",
-                                "type": "paragraph",
-                                "paragraph": {
-                                    "rich_text": [
-                                        {
-                                            "type": "text",
-                                            "text": {
-                                                "content": f"📎 첨부 이미지 (업로드 실패): {path.name}"
-                                            },
-                                        }
-                                    ]
-                                },
-                            }
-                        )
+    children.extend(image_blocks)
 
     # 이미지와 답변 사이 구분선 추가
     children.append(
@@ -195,11 +998,20 @@ def save_to_notion(
     common_traps_content = f"### ⚠️ 주의사항\n\n{common_traps_text}"
     children.extend(notionize(common_traps_content))
 
-    # Notion 페이지 생성
-    notion_client.pages.create(
-        parent={"database_id": settings.notion_database_id},
-        icon={"type": "emoji", "emoji": "💡"},
-        properties={
+    return children
+
+
+def _page_create_kwargs(
+    qna: QnAModel,
+    session_id: str,
+    image_blocks: list[dict],
+    entry_id: str | None = None,
+) -> dict:
+    """pages.create 요청 인자 (entry_id가 있으면 아웃박스 항목 id 속성도 기록)"""
+    kwargs: dict[str, Any] = {
+        "parent": {"database_id": settings.notion_database_id},
+        "icon": {"type": "emoji", "emoji": "💡"},
+        "properties": {
             "title": {
                 "title": [
                     {
@@ -220,7 +1032,88 @@ def save_to_notion(
                 ]
             },
         },
-        children=children,
-    )
+        "children": _page_children(qna, image_blocks),
+    }
+    if entry_id is not None:
+        kwargs["properties"][NOTION_ENTRY_PROPERTY] = {
+            "rich_text": [{"type": "text", "text": {"content": entry_id}}]
+        }
+    return kwargs
+
+
+def save_to_notion(
+    notion_client: "NotionClient",
+    qna: QnAModel,
+    session_id: str,
+    image_paths: list[str] | None = None,
+    verbose: bool = True,
+    entry_id: str | None = None,
+) -> str:
+    """
+    질문-답변을 Notion에 저장 (이미지 포함)하고 생성된 페이지 id 반환
+
+    verbose=False이면 진행 메시지를 출력하지 않습니다 (백그라운드 저장용).
+    entry_id는 아웃박스 항목 id로, 재시도 전에 이미 만든 페이지를 찾는 데 씁니다.
+    """
+    log = print if verbose else _silent
+    log("🔥 Notion에 저장합니다...")
+
+    with span("save_to_notion", images=len(image_paths or [])):
+        # 업로드는 병렬로 수행하되 블록 순서는 입력 순서 유지
+        image_blocks: list[dict] = []
+        imgbb_api_key, paths = _uploadable_images(image_paths, log)
+        if paths:
+            with ThreadPoolExecutor(max_workers=min(len(paths), MAX_IMAGES)) as executor:
+                image_blocks.extend(
+                    executor.map(lambda path: _image_block(path, imgbb_api_key, log), paths)
+                )
+
+        # Notion 페이지 생성 (속도 제한, 100블록 단위 분할, 429 재시도)
+        from gonagi_saa.notion_writer import NotionWriter
+
+        page = NotionWriter(notion_client).create_page(
+            **_page_create_kwargs(qna, session_id, image_blocks, entry_id)
+        )
+
+    log("✅ Notion에 저장되었습니다!")
+
+    return cast(dict, page)["id"]
+
+
+async def save_to_notion_async(
+    notion_client: "AsyncNotionClient",
+    qna: QnAModel,
+    session_id: str,
+    image_paths: list[str] | None = None,
+    verbose: bool = True,
+    entry_id: str | None = None,
+) -> str:
+    """save_to_notion의 비동기 버전 (이미지 업로드는 동시에 수행)"""
+    import httpx
+
+    from gonagi_saa.notion_writer import AsyncNotionWriter
+
+    log = print if verbose else _silent
+    log("🔥 Notion에 저장합니다...")
+
+    with span("save_to_notion", images=len(image_paths or [])):
+        image_blocks: list[dict] = []
+        imgbb_api_key, paths = _uploadable_images(image_paths, log)
+        if paths:
+            async with httpx.AsyncClient() as http_client:
+                image_blocks.extend(
+                    await asyncio.gather(
+                        *(
+                            _aimage_block(path, imgbb_api_key, http_client, log)
+                            for path in paths
+                        )
+                    )
+                )
+
+        page = await AsyncNotionWriter(notion_client).create_page(
+            **_page_create_kwargs(qna, session_id, image_blocks, entry_id)
+        )
+
+    log("✅ Notion에 저장되었습니다!")
 
-    print("✅ Notion에 저장되었습니다!")
+    return cast(dict, page)["id"]
@@ -0,0 +1,136 @@
+"""대화 세션 저장소 (턴을 생성되는 대로 기록하고 `ask --resume`으로 이어서 질문)"""
+
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+
+from gonagi_saa.models import QnAModel
+from gonagi_saa.storage import connect, escape_like
+
+SESSIONS_DB = "sessions.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    turns INTEGER NOT NULL,
+    last_title TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_updated ON sessions (updated_at);
+CREATE TABLE IF NOT EXISTS turns (
+    session_id TEXT NOT NULL REFERENCES sessions (id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    payload BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (session_id, seq)
+);
+"""
+
+
+@dataclass
+class SessionInfo:
+    """저장된 세션 요약 (턴 본문은 포함하지 않음)"""
+
+    id: str
+    model: str
+    turns: int
+    last_title: str
+    created_at: float
+    updated_at: float
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "SessionInfo":
+        return cls(
+            id=row["id"],
+            model=row["model"],
+            turns=row["turns"],
+            last_title=row["last_title"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+
+class SessionStore:
+    """
+    CONFIG_DIR 아래 SQLite에 세션별 대화 턴을 저장
+
+    턴은 QnAModel JSON을 압축해 한 행씩 추가하고, 세션 목록과 이어서 질문할 세션을
+    찾을 때는 요약 테이블만 읽습니다. 턴 본문은 load()를 호출할 때 풀어서 읽습니다.
+    """
+
+    def __init__(self) -> None:
+        self._conn = connect(SESSIONS_DB)
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def append(self, session_id: str, model_name: str, qna: QnAModel) -> None:
+        """세션에 턴 하나 추가 (세션이 없으면 생성)"""
+        now = time.time()
+        payload = zlib.compress(qna.model_dump_json().encode("utf-8"))
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO sessions (id, model, turns, last_title, created_at, updated_at)
+                VALUES (?, ?, 1, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    model = excluded.model,
+                    turns = turns + 1,
+                    last_title = excluded.last_title,
+                    updated_at = excluded.updated_at
+                """,
+                (session_id, model_name, qna.title, now, now),
+            )
+            self._conn.execute(
+                """
+                INSERT INTO turns (session_id, seq, payload, created_at)
+                VALUES (?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM turns WHERE session_id = ?), ?, ?)
+                """,
+                (session_id, session_id, payload, now),
+            )
+
+    def find(self, session_id: str) -> SessionInfo | None:
+        """세션 ID 또는 앞부분으로 세션 찾기 (여러 개면 가장 최근에 이어진 세션)"""
+        row = self._conn.execute(
+            """
+            SELECT * FROM sessions
+            WHERE id = ? OR id LIKE ? || '%' ESCAPE '\\'
+            ORDER BY id = ? DESC, updated_at DESC
+            LIMIT 1
+            """,
+            (session_id, escape_like(session_id), session_id),
+        ).fetchone()
+        return SessionInfo.from_row(row) if row else None
+
+    def recent(self, limit: int = 10) -> list[SessionInfo]:
+        """최근에 이어진 순서로 세션 목록"""
+        rows = self._conn.execute(
+            "SELECT * FROM sessions ORDER BY updated_at DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [SessionInfo.from_row(row) for row in rows]
+
+    def load(self, session_id: str) -> list[QnAModel]:
+        """세션의 턴 전체 (오래된 순)"""
+        rows = self._conn.execute(
+            "SELECT payload FROM turns WHERE session_id = ? ORDER BY seq", (session_id,)
+        ).fetchall()
+        return [
+            QnAModel.model_validate_json(zlib.decompress(row["payload"])) for row in rows
+        ]
+
+
+def record_turn(session_id: str, model_name: str, qna: QnAModel) -> None:
+    """턴 하나를 세션에 기록 (기록에 실패해도 답변 생성/저장에는 영향을 주지 않음)"""
+    try:
+        store = SessionStore()
+        try:
+            store.append(session_id, model_name, qna)
+        finally:
+            store.close()
+    except sqlite3.Error:
+        pass
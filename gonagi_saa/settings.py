@@ -1,4 +1,6 @@
-from pathlib import Path
+from functools import cache
+from typing import Any, cast
+
 from pydantic import SecretStr
 from pydantic_settings import (
     BaseSettings,
@@ -7,8 +9,7 @@ from pydantic_settings import (
     JsonConfigSettingsSource,
 )
 
-CONFIG_DIR = Path.home() / ".config" / "gonagi-saa"
-CONFIG_FILE = CONFIG_DIR / "config.json"
+from gonagi_saa.constants import CONFIG_DIR, CONFIG_FILE
 
 
 class Settings(BaseSettings):
@@ -24,6 +25,40 @@ class Settings(BaseSettings):
     google_api_key: SecretStr = SecretStr("")
     imgbb_api_key: SecretStr = SecretStr("")
 
+    # 이미지 전처리 (축소, 메타데이터 제거, 포맷 변환)
+    optimize_images: bool = True
+
+    # 대화 히스토리: 최근 턴 수(원문 유지)와 히스토리 토큰 예산
+    history_max_turns: int = 3
+    history_token_budget: int = 4000
+
+    # 시작 시 저장되지 않은 답변(아웃박스)을 백그라운드에서 Notion에 동기화
+    sync_on_startup: bool = True
+
+    # 모델 제공자별 분당 요청 수 (예: {"openai": 500}), 지정하지 않으면 기본값 사용
+    requests_per_minute: dict[str, float] = {}
+
+    # Notion API 초당 요청 수 (모든 저장 경로가 공유)
+    notion_requests_per_second: float = 3.0
+
+    # 지원하는 모델은 네이티브 구조화 출력(도구 호출)으로 답변 생성
+    # (끄면 프롬프트에 JSON 스키마를 넣고 응답 텍스트를 파싱)
+    native_structured_output: bool = True
+
+    # 태그를 LLM이 생성하지 않고 답변 본문에서 AWS 서비스/개념 사전으로 추출
+    # (응답 스키마에서 tags를 빼므로 출력 토큰이 줄어듦)
+    local_tags: bool = False
+
+    # 헤지 요청: 기본 모델이 hedge_delay_seconds 안에 첫 토큰을 보내지 않으면
+    # hedge_model에도 같은 프롬프트를 보내고 먼저 끝난 답변을 사용 (비워두면 사용 안 함)
+    hedge_model: str = ""
+    hedge_delay_seconds: float = 3.0
+
+    # 답변 캐시
+    cache_enabled: bool = True
+    cache_max_mb: int = 100
+    cache_max_age_days: int = 30
+
     @classmethod
     def settings_customise_sources(
         cls,
@@ -51,6 +86,22 @@ class Settings(BaseSettings):
         return tuple(sources)
 
 
-settings = Settings()
+@cache
+def get_settings() -> Settings:
+    """설정 로드 (설정 파일과 환경 변수는 처음 호출할 때 한 번만 읽음)"""
+    return Settings()
+
+
+class _LazySettings:
+    """처음 속성에 접근할 때 설정을 로드하는 프록시 (import만으로는 설정 파일을 읽지 않음)"""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_settings(), name, value)
+
+
+settings = cast(Settings, _LazySettings())
 
-__all__ = ["settings", "CONFIG_DIR", "CONFIG_FILE"]
+__all__ = ["settings", "get_settings", "CONFIG_DIR", "CONFIG_FILE"]
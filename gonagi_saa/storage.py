@@ -0,0 +1,21 @@
+"""로컬 SQLite 저장소"""
+
+import sqlite3
+
+from gonagi_saa.constants import CONFIG_DIR
+
+
+def connect(filename: str) -> sqlite3.Connection:
+    """CONFIG_DIR 아래의 SQLite 데이터베이스에 연결 (WAL 모드)"""
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(CONFIG_DIR / filename, timeout=10, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def escape_like(text: str) -> str:
+    """LIKE 패턴에 넣을 문자열의 %, _, \\ 이스케이프 (`LIKE ? ESCAPE '\\'`와 함께 사용)"""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,250 @@
+"""로컬 태그 추출 (AWS 서비스/개념 사전과 별칭을 본문에서 한 번에 찾음)"""
+
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from functools import cache
+
+from gonagi_saa.models import QnAAnswerModel
+
+# 답변 하나에 붙이는 최대 태그 수
+MAX_TAGS = 7
+
+# 태그 → 별칭 (태그 자체도 별칭으로 취급, 대소문자 무시)
+# 서비스명은 약어를, 개념은 한국어 표기를 태그로 사용
+TAG_ALIASES: dict[str, tuple[str, ...]] = {
+    # 컴퓨팅
+    "EC2": ("Elastic Compute Cloud",),
+    "Lambda": ("람다",),
+    "Auto Scaling": ("오토 스케일링", "오토스케일링", "Auto Scaling Group", "ASG"),
+    "ECS": ("Elastic Container Service",),
+    "EKS": ("Elastic Kubernetes Service",),
+    "ECR": ("Elastic Container Registry",),
+    "Fargate": (),
+    "Elastic Beanstalk": ("Beanstalk",),
+    "AWS Batch": (),
+    "Outposts": (),
+    "Spot Instance": ("스팟 인스턴스", "Spot Instances", "Spot Fleet"),
+    "Reserved Instance": ("예약 인스턴스", "Reserved Instances", "RI"),
+    "Savings Plans": ("Savings Plan",),
+    # 스토리지
+    "S3": ("Simple Storage Service",),
+    "S3 Glacier": ("Glacier", "Glacier Deep Archive", "S3 Glacier Deep Archive"),
+    "EBS": ("Elastic Block Store",),
+    "EFS": ("Elastic File System",),
+    "FSx": ("FSx for Lustre", "FSx for Windows File Server", "FSx for NetApp ONTAP"),
+    "Storage Gateway": ("File Gateway", "Volume Gateway", "Tape Gateway"),
+    "Snow Family": ("Snowball", "Snowball Edge", "Snowcone", "Snowmobile"),
+    "DataSync": (),
+    "AWS Backup": (),
+    # 데이터베이스
+    "RDS": ("Relational Database Service",),
+    "Aurora": ("오로라", "Aurora Serverless", "Aurora Global Database"),
+    "DynamoDB": ("DynamoDB Accelerator", "DAX"),
+    "ElastiCache": ("ElastiCache for Redis", "ElastiCache for Memcached"),
+    "Redshift": ("Redshift Spectrum",),
+    "DocumentDB": (),
+    "Neptune": (),
+    "DMS": ("Database Migration Service",),
+    # 네트워킹
+    "VPC": ("Virtual Private Cloud",),
+    "Subnet": ("서브넷", "Subnets", "Public Subnet", "Private Subnet"),
+    "Security Group": ("보안 그룹", "Security Groups"),
+    "NACL": ("Network ACL", "네트워크 ACL"),
+    "Internet Gateway": ("인터넷 게이트웨이", "IGW"),
+    "NAT Gateway": ("NAT 게이트웨이", "NAT Instance"),
+    "VPC Endpoint": ("VPC 엔드포인트", "Gateway Endpoint", "Interface Endpoint", "PrivateLink"),
+    "VPC Peering": ("VPC 피어링",),
+    "Transit Gateway": ("전송 게이트웨이",),
+    "Direct Connect": ("DX",),
+    "Site-to-Site VPN": ("VPN", "Client VPN"),
+    "Route 53": ("Route53",),
+    "CloudFront": ("CDN",),
+    "Global Accelerator": (),
+    "ELB": ("Elastic Load Balancing", "로드 밸런서", "Load Balancer"),
+    "ALB": ("Application Load Balancer",),
+    "NLB": ("Network Load Balancer",),
+    "GWLB": ("Gateway Load Balancer",),
+    "API Gateway": ("API 게이트웨이",),
+    # 애플리케이션 통합
+    "SQS": ("Simple Queue Service", "FIFO Queue", "Dead-Letter Queue", "DLQ"),
+    "SNS": ("Simple Notification Service",),
+    "EventBridge": ("CloudWatch Events",),
+    "Step Functions": (),
+    "Kinesis": ("Kinesis Data Streams", "Kinesis Data Firehose", "Data Firehose", "Firehose"),
+    "Amazon MQ": (),
+    # 분석
+    "Athena": (),
+    "Glue": ("Glue Data Catalog",),
+    "EMR": ("Elastic MapReduce",),
+    "OpenSearch": ("Elasticsearch", "OpenSearch Service"),
+    "QuickSight": (),
+    "Lake Formation": (),
+    # 보안
+    "IAM": ("Identity and Access Management", "IAM Role", "IAM Policy", "IAM 역할", "IAM 정책"),
+    "Cognito": ("User Pool", "Identity Pool"),
+    "KMS": ("Key Management Service",),
+    "CloudHSM": (),
+    "Secrets Manager": (),
+    "Parameter Store": (),
+    "ACM": ("Certificate Manager",),
+    "WAF": ("Web Application Firewall",),
+    "Shield": ("Shield Advanced",),
+    "GuardDuty": (),
+    "Inspector": (),
+    "Macie": (),
+    "Security Hub": (),
+    "IAM Identity Center": ("AWS SSO", "Single Sign-On"),
+    # 관리/거버넌스
+    "CloudWatch": ("CloudWatch Logs", "CloudWatch Alarms"),
+    "CloudTrail": (),
+    "AWS Config": ("Config Rules",),
+    "Organizations": ("SCP", "Service Control Policy"),
+    "Control Tower": (),
+    "CloudFormation": (),
+    "Systems Manager": ("SSM", "Session Manager"),
+    "Trusted Advisor": (),
+    "Cost Explorer": ("AWS Budgets", "Budgets"),
+    # 개념
+    "Multi-AZ": ("다중 AZ", "Multi AZ", "다중 가용 영역"),
+    "Read Replica": ("읽기 전용 복제본", "Read Replicas"),
+    "고가용성": ("High Availability",),
+    "재해 복구": ("Disaster Recovery", "RPO", "RTO", "Pilot Light", "Warm Standby"),
+    "서버리스": ("Serverless",),
+    "보안": ("암호화", "Encryption", "최소 권한"),
+    "네트워킹": ("네트워크", "Networking"),
+    "스토리지": ("Storage", "수명 주기", "Lifecycle Policy"),
+    "데이터베이스": ("Database",),
+    "캐싱": ("Caching",),
+    "디커플링": ("Decoupling", "느슨한 결합"),
+    "비용 최적화": ("Cost Optimization", "비용 절감"),
+    "확장성": ("Scalability", "수평 확장", "Horizontal Scaling"),
+    "모니터링": ("Monitoring",),
+    "마이그레이션": ("Migration",),
+    "하이브리드 클라우드": ("Hybrid Cloud", "온프레미스", "On-Premises"),
+}
+
+
+class TagMatcher:
+    """
+    여러 별칭을 한 번에 찾는 Aho-Corasick 자동자
+
+    본문 길이에 비례하는 한 번의 순회로 모든 별칭의 출현 위치를 찾습니다.
+    별칭과 본문은 소문자로 비교합니다.
+    """
+
+    def __init__(self, aliases: dict[str, str]) -> None:
+        # 상태별 전이, 실패 링크, (별칭 길이, 태그) 출력
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[int, str]]] = [[]]
+
+        for alias, tag in aliases.items():
+            state = 0
+            for char in alias:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = next_state
+            self._out[state].append((len(alias), tag))
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def finditer(self, text: str) -> Iterator[tuple[int, int, str]]:
+        """본문(소문자)에서 찾은 별칭의 (시작, 끝, 태그) (겹치는 결과도 모두 포함)"""
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, tag in self._out[state]:
+                yield index + 1 - length, index + 1, tag
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+@cache
+def _alias_table() -> dict[str, str]:
+    """소문자 별칭 → 태그"""
+    table = {}
+    for tag, aliases in TAG_ALIASES.items():
+        for alias in (tag, *aliases):
+            table[alias.lower()] = tag
+    return table
+
+
+@cache
+def _matcher() -> TagMatcher:
+    return TagMatcher(_alias_table())
+
+
+def find_tags(text: str) -> list[tuple[int, str]]:
+    """
+    본문에 나온 태그의 (위치, 태그) 목록
+
+    영문 별칭은 단어 경계에서만 인정하고(예: "ECS"는 "ECS2"에서 찾지 않음), 한국어는
+    조사가 붙어도 찾습니다. 겹치는 별칭은 가장 왼쪽·가장 긴 것 하나만 사용하므로
+    "S3 Glacier"는 S3가 아닌 S3 Glacier로 셉니다.
+    """
+    lowered = text.lower()
+    matches = []
+    for start, end, tag in _matcher().finditer(lowered):
+        if _is_word_char(lowered[start]) and start > 0 and _is_word_char(lowered[start - 1]):
+            continue
+        if _is_word_char(lowered[end - 1]) and end < len(lowered) and _is_word_char(lowered[end]):
+            continue
+        matches.append((start, end, tag))
+
+    found = []
+    last_end = 0
+    for start, end, tag in sorted(matches, key=lambda match: (match[0], -match[1])):
+        if start >= last_end:
+            found.append((start, tag))
+            last_end = end
+    return found
+
+
+def extract_tags(qna: QnAAnswerModel, limit: int = MAX_TAGS) -> list[str]:
+    """답변/시험 팁/주의사항에서 태그 추출 (많이 나온 순, 같으면 먼저 나온 순)"""
+    text = "\n".join([qna.answer, *qna.exam_tips, *qna.common_traps])
+    found = find_tags(text)
+    counts = Counter(tag for _, tag in found)
+    first_seen: dict[str, int] = {}
+    for position, tag in found:
+        first_seen.setdefault(tag, position)
+    return sorted(counts, key=lambda tag: (-counts[tag], first_seen[tag]))[:limit]
+
+
+def normalize_tags(tags: Iterable[str]) -> list[str]:
+    """
+    태그 표기를 사전 기준으로 통일 (예: "Amazon Simple Queue Service" → "SQS")
+
+    사전에 없는 태그는 그대로 두고, 같은 태그는 한 번만 남깁니다 (대소문자 무시).
+    """
+    table = _alias_table()
+    normalized: dict[str, str] = {}
+    for tag in tags:
+        name = tag.strip()
+        lowered = name.lower()
+        if lowered not in table:
+            for prefix in ("amazon ", "aws "):
+                if lowered.startswith(prefix) and lowered.removeprefix(prefix) in table:
+                    lowered = lowered.removeprefix(prefix)
+        name = table.get(lowered, name)
+        if name:
+            normalized.setdefault(name.lower(), name)
+    return list(normalized.values())
@@ -0,0 +1,208 @@
+"""단계별 시간 측정 (span 기록, 단계별 요약, Chrome trace/OTLP JSON 내보내기)"""
+
+import itertools
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# 추적이 꺼져 있을 때 반환하는 공용 no-op 컨텍스트 (할당 없이 재사용)
+_NOOP: AbstractContextManager[None] = nullcontext()
+
+_current_span: ContextVar[int | None] = ContextVar("gonagi_saa_span", default=None)
+
+
+@dataclass
+class Span:
+    """측정 구간"""
+
+    id: int
+    parent_id: int | None
+    name: str
+    start_ns: int
+    end_ns: int
+    thread_id: int
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+
+@dataclass
+class StageSummary:
+    """같은 이름의 span 집계"""
+
+    name: str
+    count: int
+    total_ms: float
+    max_ms: float
+
+
+class Tracer:
+    """span 수집기 (스레드/비동기 작업 간 부모-자식 관계는 contextvars로 추적)"""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        # perf_counter 기준 시각을 UNIX 시각으로 바꾸기 위한 기준점
+        self._epoch_ns = time.time_ns() - time.perf_counter_ns()
+        self.started_ns = time.perf_counter_ns()
+
+    @contextmanager
+    def span(self, name: str, attributes: dict[str, Any]) -> Iterator[None]:
+        span_id = next(self._ids)
+        parent_id = _current_span.get()
+        token = _current_span.set(span_id)
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end_ns = time.perf_counter_ns()
+            _current_span.reset(token)
+            self._append(
+                Span(span_id, parent_id, name, start_ns, end_ns, threading.get_ident(), attributes)
+            )
+
+    def add_span(self, name: str, start_ns: int, end_ns: int, **attributes: Any) -> None:
+        """이미 지난 구간을 span으로 추가 (예: 추적 시작 전의 import 시간)"""
+        self._append(
+            Span(next(self._ids), None, name, start_ns, end_ns, threading.get_ident(), attributes)
+        )
+
+    def _append(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def summary(self) -> list[StageSummary]:
+        """단계별 집계 (처음 시작한 순서)"""
+        stages: dict[str, StageSummary] = {}
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start_ns)
+        for span in spans:
+            stage = stages.get(span.name)
+            if stage is None:
+                stage = stages[span.name] = StageSummary(span.name, 0, 0.0, 0.0)
+            stage.count += 1
+            stage.total_ms += span.duration_ms
+            stage.max_ms = max(stage.max_ms, span.duration_ms)
+        return list(stages.values())
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Chrome trace 이벤트 형식 (chrome://tracing, Perfetto에서 열기)"""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+        return {
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "ph": "X",
+                    "ts": (span.start_ns - self.started_ns) / 1000,
+                    "dur": (span.end_ns - span.start_ns) / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": span.attributes,
+                }
+                for span in spans
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+    def to_otlp(self) -> dict[str, Any]:
+        """OpenTelemetry OTLP/JSON 형식 (ExportTraceServiceRequest)"""
+        trace_id = os.urandom(16).hex()
+        with self._lock:
+            spans = list(self.spans)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [_otlp_attribute("service.name", "gonagi-saa")]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "gonagi_saa.tracing"},
+                            "spans": [
+                                {
+                                    "traceId": trace_id,
+                                    "spanId": f"{span.id:016x}",
+                                    "parentSpanId": (
+                                        f"{span.parent_id:016x}" if span.parent_id else ""
+                                    ),
+                                    "name": span.name,
+                                    "kind": 1,
+                                    "startTimeUnixNano": str(self._epoch_ns + span.start_ns),
+                                    "endTimeUnixNano": str(self._epoch_ns + span.end_ns),
+                                    "attributes": [
+                                        _otlp_attribute(key, value)
+                                        for key, value in span.attributes.items()
+                                    ],
+                                }
+                                for span in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def export(self, path: Path, format: str = "chrome") -> None:
+        """span을 JSON 파일로 저장 (format: chrome 또는 otlp)"""
+        if format == "chrome":
+            data = self.to_chrome_trace()
+        elif format == "otlp":
+            data = self.to_otlp()
+        else:
+            raise ValueError(f"지원하지 않는 trace 형식입니다: {format}")
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+_tracer: Tracer | None = None
+
+
+def start_tracing() -> Tracer:
+    """추적 시작 (이미 시작했다면 기존 Tracer 반환)"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def stop_tracing() -> Tracer | None:
+    """추적을 멈추고 수집한 Tracer 반환"""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def span(name: str, **attributes: Any) -> AbstractContextManager[None]:
+    """
+    구간 측정
+
+        with span("imgbb.upload", file=path.name):
+            ...
+
+    추적이 꺼져 있으면 공용 no-op 컨텍스트를 반환하므로 비용이 거의 없습니다.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP
+    return tracer.span(name, attributes)
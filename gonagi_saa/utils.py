@@ -1,24 +1,85 @@
+import asyncio
+import mmap
 import re
-import base64
+import secrets
+import threading
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any
-
-import requests
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain.chat_models.base import BaseChatModel
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 from gonagi_saa.settings import settings
-from gonagi_saa.constants import VISION_SUPPORTED_MODELS
+from gonagi_saa.constants import (
+    DEFAULT_IMAGE_TARGET_RESOLUTION,
+    IMAGE_MIME_TYPES,
+    IMAGE_TARGET_RESOLUTIONS,
+    MAX_IMAGES,
+    VISION_SUPPORTED_MODELS,
+)
+from gonagi_saa.image_store import image_store
+from gonagi_saa.multipart import MultipartBody
+from gonagi_saa.tracing import span
+
+# 제공자 SDK와 HTTP 클라이언트는 import 비용이 커서 실제로 사용할 때 불러옴
+if TYPE_CHECKING:
+    import httpx
+    import requests
+    from langchain.chat_models.base import BaseChatModel
+    from notion_client import Client as NotionClient
+
+IMGBB_UPLOAD_URL = "https://api.imgbb.com/1/upload"
+IMGBB_TIMEOUT = 60
+
+
+# 모델 인스턴스 재사용 ((모델명, API Key) → 인스턴스). 비동기 HTTP 클라이언트는 만든
+# 이벤트 루프에서만 쓸 수 있으므로 이벤트 루프 안에서 만든 인스턴스는 루프별로 따로 보관
+_models: dict[tuple[str, str], "BaseChatModel"] = {}
+_loop_models: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = weakref.WeakKeyDictionary()
+_models_lock = threading.Lock()
 
 
 def llm_model_factory(
     name: str,
-) -> BaseChatModel:
+) -> "BaseChatModel":
+    """
+    모델명으로 LLM 인스턴스 반환 (선택한 제공자의 SDK만 import)
+
+    같은 모델명과 API Key 조합은 프로세스 안에서 한 번만 만들어 재사용하므로
+    턴마다 HTTP 클라이언트와 연결을 새로 만들지 않습니다.
+    """
+    key = (name, _provider_api_key(name))
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        models = _models
+    else:
+        models = _loop_models.setdefault(loop, {})
+
+    with _models_lock:
+        model = models.get(key)
+        if model is None:
+            model = models[key] = _create_model(name)
+    return model
+
+
+def _provider_api_key(name: str) -> str:
+    """모델 제공자의 API Key (인스턴스 재사용 키, 설정이 바뀌면 새로 만들도록)"""
+    api_key = {
+        "anthropic": settings.anthropic_api_key,
+        "openai": settings.openai_api_key,
+        "google": settings.google_api_key,
+    }[get_model_provider(name)]
+    return api_key.get_secret_value()
+
+
+def _create_model(name: str) -> "BaseChatModel":
     """모델명으로 LLM 인스턴스 생성"""
     if name.startswith("claude"):
+        from langchain_anthropic import ChatAnthropic
+
         return ChatAnthropic(
             model_name=name,
             api_key=settings.anthropic_api_key,
@@ -28,21 +89,29 @@ def llm_model_factory(
             stop=None,
         )
     elif name.startswith("gpt"):
+        from langchain_openai import ChatOpenAI
+
         return ChatOpenAI(
             name=name,
             model=name,
             api_key=settings.openai_api_key,
             temperature=0.0,
             max_retries=3,
+            stream_usage=True,
         )
     elif re.match(r"^o\d", name):
+        from langchain_openai import ChatOpenAI
+
         return ChatOpenAI(
             name=name,
             model=name,
             api_key=settings.openai_api_key,
             max_retries=3,
+            stream_usage=True,
         )
     elif name.startswith("gemini"):
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
         return ChatGoogleGenerativeAI(
             name=name,
             model=name,
@@ -54,19 +123,26 @@ def llm_model_factory(
         raise ValueError(f"Unknown model: {name}")
 
 
+def get_model_provider(name: str) -> str:
+    """모델명으로 제공자(openai, anthropic, google) 판별"""
+    if name.startswith("claude"):
+        return "anthropic"
+    elif name.startswith("gpt") or re.match(r"^o\d", name):
+        return "openai"
+    elif name.startswith("gemini"):
+        return "google"
+    else:
+        raise ValueError(f"Unknown model: {name}")
+
+
 def is_vision_model(model_name: str) -> bool:
     """모델이 이미지 입력을 지원하는지 확인"""
     return model_name in VISION_SUPPORTED_MODELS
 
 
-def encode_image(image_path: str) -> str:
-    """이미지 파일을 base64로 인코딩"""
-    path = Path(image_path)
-    if not path.exists():
-        raise FileNotFoundError(f"이미지 파일을 찾을 수 없습니다: {image_path}")
-
-    with open(path, "rb") as image_file:
-        return base64.b64encode(image_file.read()).decode("utf-8")
+def encode_image(image_path: str, resolution: tuple[int, int] | None = None) -> str:
+    """이미지 파일을 base64로 인코딩 (같은 이미지는 프로세스 내에서 한 번만 인코딩)"""
+    return image_store.encoded(image_path, resolution).base64
 
 
 def get_image_mime_type(image_path: str) -> str:
@@ -74,30 +150,98 @@ def get_image_mime_type(image_path: str) -> str:
     path = Path(image_path)
     suffix = path.suffix.lower()
 
-    mime_types = {
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".png": "image/png",
-        ".gif": "image/gif",
-        ".webp": "image/webp",
-    }
+    return IMAGE_MIME_TYPES.get(suffix, "image/jpeg")
 
-    return mime_types.get(suffix, "image/jpeg")
 
+def format_size(num_bytes: int) -> str:
+    """바이트 수를 읽기 쉬운 단위로 변환"""
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
 
-def prepare_image_content(image_path: str) -> dict[str, Any]:
-    """이미지를 LangChain 메시지 형식으로 변환"""
-    base64_image = encode_image(image_path)
-    mime_type = get_image_mime_type(image_path)
+
+def prepare_image_content(
+    image_path: str,
+    model_name: str | None = None,
+    verbose: bool = True,
+) -> dict[str, Any]:
+    """이미지를 LangChain 메시지 형식으로 변환 (모델 제공자별 해상도로 전처리)"""
+    resolution = DEFAULT_IMAGE_TARGET_RESOLUTION
+    if model_name is not None:
+        resolution = IMAGE_TARGET_RESOLUTIONS.get(
+            get_model_provider(model_name), DEFAULT_IMAGE_TARGET_RESOLUTION
+        )
+
+    with span("image.prepare", file=Path(image_path).name):
+        image = image_store.encoded(image_path, resolution)
+
+    if verbose and len(image.data) < image.original_size:
+        print(
+            f"🗜️  이미지 최적화: {Path(image_path).name} "
+            f"{format_size(image.original_size)} → {format_size(len(image.data))} "
+            f"({(image.original_size - len(image.data)) / image.original_size:.0%} 절감)"
+        )
 
     return {
         "type": "image_url",
         "image_url": {
-            "url": f"data:{mime_type};base64,{base64_image}"
+            "url": image.data_url
         },
     }
 
 
+def get_notion_client() -> "NotionClient":
+    """프로세스 전역에서 공유하는 Notion 클라이언트 (API Key가 바뀌면 새로 만듦)"""
+    return _notion_client(settings.notion_api_key.get_secret_value())
+
+
+@cache
+def _notion_client(api_key: str) -> "NotionClient":
+    from notion_client import Client as NotionClient
+
+    return NotionClient(auth=api_key)
+
+
+@cache
+def get_http_session() -> "requests.Session":
+    """프로세스 전역에서 공유하는 keep-alive HTTP 세션"""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_IMAGES * 2)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@contextmanager
+def _imgbb_upload_body(image_path: str, api_key: str) -> Iterator[MultipartBody]:
+    """
+    imgbb 업로드 요청 본문 (이미지를 base64 대신 바이너리 파일 필드로 전송)
+
+    전처리를 사용하면 LLM 전송용으로 만들어 둔 이미지 바이트를 그대로 보내고,
+    사용하지 않으면 원본 파일을 mmap으로 열어 필요한 부분만 읽으며 보냅니다.
+    """
+    path = Path(image_path)
+    fields = {"key": api_key}
+    if settings.optimize_images:
+        image = image_store.encoded(image_path)
+        yield MultipartBody(fields, "image", path.name, image.data, image.mime_type)
+        return
+
+    mime_type = get_image_mime_type(image_path)
+    with open(path, "rb") as file:
+        if path.stat().st_size == 0:
+            yield MultipartBody(fields, "image", path.name, b"", mime_type)
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            yield MultipartBody(fields, "image", path.name, content, mime_type)
+
+
 def upload_image_to_imgbb(image_path: str, api_key: str) -> str:
     """
     이미지를 imgbb에 업로드하고 URL 반환
@@ -118,22 +262,16 @@ def upload_image_to_imgbb(image_path: str, api_key: str) -> str:
         FileNotFoundError: 이미지 파일을 찾을 수 없는 경우
         requests.HTTPError: imgbb API 요청 실패
     """
-    path = Path(image_path)
-    if not path.exists():
-        raise FileNotFoundError(f"이미지 파일을 찾을 수 없습니다: {image_path}")
-
-    # 이미지를 base64로 인코딩
-    with open(path, "rb") as image_file:
-        image_data = base64.b64encode(image_file.read()).decode("utf-8")
-
-    # imgbb API 요청
-    url = "https://api.imgbb.com/1/upload"
-    data = {
-        "key": api_key,
-        "image": image_data,
-    }
-
-    response = requests.post(url, data=data)
+    with (
+        span("imgbb.upload", file=Path(image_path).name),
+        _imgbb_upload_body(image_path, api_key) as body,
+    ):
+        response = get_http_session().post(
+            IMGBB_UPLOAD_URL,
+            data=body,
+            headers={"Content-Type": body.content_type},
+            timeout=IMGBB_TIMEOUT,
+        )
     response.raise_for_status()
 
     # 업로드된 이미지 URL 반환
@@ -141,14 +279,50 @@ def upload_image_to_imgbb(image_path: str, api_key: str) -> str:
     return result["data"]["url"]
 
 
+async def upload_image_to_imgbb_async(
+    image_path: str,
+    api_key: str,
+    client: "httpx.AsyncClient",
+) -> str:
+    """
+    upload_image_to_imgbb의 비동기 버전
+
+    이미지 전처리와 본문 읽기는 이벤트 루프를 막지 않도록 스레드에서 수행합니다.
+
+    Raises:
+        FileNotFoundError: 이미지 파일을 찾을 수 없는 경우
+        httpx.HTTPStatusError: imgbb API 요청 실패
+    """
+    if settings.optimize_images:
+        # 결과는 image_store에 남으므로 본문을 만들 때 다시 전처리하지 않음
+        await asyncio.to_thread(image_store.encoded, image_path)
+
+    with (
+        span("imgbb.upload", file=Path(image_path).name),
+        _imgbb_upload_body(image_path, api_key) as body,
+    ):
+        response = await client.post(
+            IMGBB_UPLOAD_URL,
+            content=body.aiter(),
+            headers={"Content-Type": body.content_type, "Content-Length": str(len(body))},
+            timeout=IMGBB_TIMEOUT,
+        )
+    response.raise_for_status()
+
+    result = response.json()
+    return result["data"]["url"]
+
+
 def generate_session_id() -> str:
     """
     현재 시간 기반 Session ID 생성
 
-    형식: YYYY-MM-DD-HH:MM
-    예: 2026-02-11-15:30
+    형식: YYYY-MM-DD-HH:MM:SS-xxxx (xxxx는 임의의 16진수 4자리)
+    예: 2026-02-11-15:30:42-9f1c
+
+    같은 초에 시작한 세션끼리도 겹치지 않도록 임의의 접미사를 붙입니다.
 
     Returns:
         Session ID 문자열
     """
-    return datetime.now().strftime("%Y-%m-%d-%H:%M")
+    return f"{datetime.now().strftime('%Y-%m-%d-%H:%M:%S')}-{secrets.token_hex(2)}"
@@ -0,0 +1,177 @@
+"""연결 미리 열기 (질문을 입력하는 동안 LLM 제공자와 Notion에 TLS 연결을 맺어 둠)"""
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from gonagi_saa.constants import WARMUP_IDLE_SECONDS, WARMUP_MAX_REWARMS, WARMUP_TIMEOUT
+
+if TYPE_CHECKING:
+    import httpx
+
+    from gonagi_saa.ratelimit import TokenBucket
+
+# 모델/클라이언트를 만들 때 날 수 있는 오류 (SDK 미설치, API Key 누락, 알 수 없는 모델)
+_SETUP_ERRORS = (ImportError, ValueError)
+
+
+def _sdk_http_client(model: Any, asynchronous: bool = False) -> "tuple[Any, str] | None":
+    """LangChain 모델이 내부에서 쓰는 SDK의 HTTP 클라이언트와 API 주소 (알 수 없으면 None)"""
+    # ChatOpenAI는 root_client/root_async_client, ChatAnthropic은 _client/_async_client로
+    # SDK 클라이언트를 가지고 있음
+    if asynchronous:
+        sdk_client = getattr(model, "root_async_client", None) or getattr(
+            model, "_async_client", None
+        )
+    else:
+        sdk_client = getattr(model, "root_client", None) or getattr(model, "_client", None)
+    http_client = getattr(sdk_client, "_client", None)
+    base_url = getattr(sdk_client, "base_url", None)
+    if http_client is None or base_url is None:
+        return None
+    return http_client, str(base_url)
+
+
+class ConnectionWarmer:
+    """
+    백그라운드에서 모델 생성과 연결 준비를 미리 해 두는 작업
+
+    모델 인스턴스와 Notion 클라이언트는 프로세스 안에서 재사용되므로, 같은 HTTP
+    클라이언트로 가벼운 HEAD 요청을 보내 두면 첫 요청이 TLS 핸드셰이크를 기다리지
+    않습니다. 시작할 때 한 번 준비하고, 이후에는 rewarm()이 호출됐을 때(질문 입력을
+    마쳤을 때 등) 유휴 연결이 닫혔을 만큼 시간이 지났으면 최대 WARMUP_MAX_REWARMS번
+    다시 준비합니다. Notion 요청은 공유 속도 제한기의 토큰이 남아 있을 때만 보내며,
+    연결 실패는 무시합니다.
+
+    hedge_model이 설정되어 있으면 answer_question은 헤지 루프에서 루프별 모델
+    인스턴스의 비동기 클라이언트로 요청하므로, 그 루프 안에서도 같은 준비를 합니다.
+    """
+
+    def __init__(self, model_name: str, notion: bool = True, hedge: bool = True) -> None:
+        self.model_name = model_name
+        self.notion = notion
+        self.hedge = hedge
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "ConnectionWarmer":
+        self._thread = threading.Thread(target=self._run, name="gonagi-saa-warmup", daemon=True)
+        self._thread.start()
+        return self
+
+    def rewarm(self) -> None:
+        """곧 요청을 보낼 때 호출 (마지막 준비 후 연결이 닫혔을 수 있으면 다시 준비)"""
+        self._wake.set()
+
+    def stop(self) -> None:
+        """연결 준비를 멈춤 (이미 열린 연결은 그대로 재사용됨)"""
+        self._stopped.set()
+        self._wake.set()
+
+    def _targets(self) -> "list[tuple[httpx.Client, str, TokenBucket | None]]":
+        from gonagi_saa.notion_writer import notion_rate_limiter
+        from gonagi_saa.utils import get_notion_client, llm_model_factory
+
+        targets: list[tuple[httpx.Client, str, TokenBucket | None]] = []
+        try:
+            target = _sdk_http_client(llm_model_factory(self.model_name))
+        except _SETUP_ERRORS:
+            target = None
+        if target is not None:
+            targets.append((*target, None))
+
+        if self.notion:
+            try:
+                notion_client = get_notion_client()
+                targets.append(
+                    (notion_client.client, notion_client.options.base_url, notion_rate_limiter())
+                )
+            except _SETUP_ERRORS:
+                pass
+        return targets
+
+    def _hedge_models(self) -> list[str]:
+        """헤지 루프에서 준비할 모델 (헤지를 쓰지 않으면 빈 목록)"""
+        if not self.hedge:
+            return []
+        from gonagi_saa.services import hedge_loop_models
+
+        try:
+            return hedge_loop_models(self.model_name)
+        except _SETUP_ERRORS:
+            return []
+
+    def _warm(
+        self,
+        targets: "list[tuple[httpx.Client, str, TokenBucket | None]]",
+        hedge_models: list[str],
+    ) -> None:
+        import httpx
+
+        for http_client, url, limiter in targets:
+            # 실제 저장 요청의 몫을 빼앗지 않도록 토큰이 바로 없으면 건너뜀
+            if limiter is not None and not limiter.try_acquire():
+                continue
+            try:
+                http_client.head(url, timeout=WARMUP_TIMEOUT)
+            except httpx.HTTPError:
+                pass
+
+        if hedge_models:
+            self._warm_hedge_loop(hedge_models)
+
+    def _warm_hedge_loop(self, model_names: list[str]) -> None:
+        """헤지 루프 안에서 모델을 만들고 비동기 클라이언트의 연결을 준비 (끝날 때까지 대기)"""
+        from gonagi_saa.services import hedge_event_loop
+
+        future = asyncio.run_coroutine_threadsafe(
+            _awarm_models(model_names), hedge_event_loop()
+        )
+        try:
+            future.result(timeout=WARMUP_TIMEOUT * 2)
+        except TimeoutError:
+            future.cancel()
+
+    def _run(self) -> None:
+        targets = self._targets()
+        hedge_models = self._hedge_models()
+        if not (targets or hedge_models) or self._stopped.is_set():
+            return
+        self._warm(targets, hedge_models)
+        warmed_at = time.monotonic()
+
+        rewarms = 0
+        while rewarms < WARMUP_MAX_REWARMS:
+            self._wake.wait()
+            self._wake.clear()
+            if self._stopped.is_set():
+                return
+            if time.monotonic() - warmed_at < WARMUP_IDLE_SECONDS:
+                continue
+            self._warm(targets, hedge_models)
+            warmed_at = time.monotonic()
+            rewarms += 1
+
+
+async def _awarm_models(model_names: list[str]) -> None:
+    """현재 이벤트 루프의 모델 인스턴스를 만들고 비동기 HTTP 클라이언트로 연결 준비"""
+    import httpx
+
+    from gonagi_saa.utils import llm_model_factory
+
+    async def warm(model_name: str) -> None:
+        try:
+            target = _sdk_http_client(llm_model_factory(model_name), asynchronous=True)
+        except _SETUP_ERRORS:
+            return
+        if target is None:
+            return
+        http_client, url = target
+        try:
+            await http_client.head(url, timeout=WARMUP_TIMEOUT)
+        except httpx.HTTPError:
+            pass
+
+    await asyncio.gather(*(warm(model_name) for model_name in model_names))
@@ -0,0 +1,42 @@
+"""테스트 공통 설정 (실제 ~/.config/gonagi-saa와 GONAGI_SAA_* 환경 변수를 쓰지 않도록 격리)"""
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from gonagi_saa import metrics, storage
+from gonagi_saa import settings as settings_module
+from gonagi_saa.models import QnAModel
+from gonagi_saa.settings import get_settings
+
+
+@pytest.fixture(autouse=True)
+def config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """SQLite 저장소/지표/설정 파일 위치를 테스트별 임시 디렉토리로 변경"""
+    path = tmp_path / "config"
+    monkeypatch.setattr(storage, "CONFIG_DIR", path)
+    monkeypatch.setattr(metrics, "CONFIG_DIR", path)
+    monkeypatch.setattr(metrics, "METRICS_FILE", path / "metrics.jsonl")
+    monkeypatch.setattr(settings_module, "CONFIG_FILE", path / "config.json")
+    for name in list(os.environ):
+        if name.startswith("GONAGI_SAA_"):
+            monkeypatch.delenv(name)
+    get_settings.cache_clear()
+    yield path
+    get_settings.cache_clear()
+
+
+def make_qna(**fields: object) -> QnAModel:
+    """테스트용 답변 (지정하지 않은 필드는 기본값)"""
+    values: dict[str, object] = {
+        "title": "VPC와 Subnet의 차이",
+        "answer": "VPC는 격리된 네트워크이고 Subnet은 VPC를 나눈 범위입니다.",
+        "exam_tips": ["Public Subnet은 Internet Gateway로 라우팅됩니다."],
+        "common_traps": ["NAT Gateway는 Public Subnet에 둡니다."],
+        "tags": ["VPC", "Subnet"],
+        "question": "VPC와 Subnet의 차이는?",
+    }
+    values.update(fields)
+    return QnAModel.model_validate(values)
@@ -0,0 +1,103 @@
+import pytest
+
+from gonagi_saa import cache as cache_module
+from gonagi_saa.cache import AnswerCache, make_cache_key
+from gonagi_saa.settings import get_settings
+from tests.conftest import make_qna
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module, "time", fake)
+    return fake
+
+
+def _entry_size() -> int:
+    return len(make_qna().model_dump_json().encode("utf-8"))
+
+
+def test_put_and_get_round_trip(clock: FakeClock) -> None:
+    cache = AnswerCache()
+    cache.put("k", "gpt-4o", make_qna())
+
+    assert cache.get("k") == make_qna()
+    assert cache.get("missing") is None
+    assert cache.stats().hits == 1
+
+
+def test_evicts_least_recently_used_over_size_limit(clock: FakeClock) -> None:
+    cache = AnswerCache(max_bytes=2 * _entry_size())
+    cache.put("a", "gpt-4o", make_qna())
+    clock.now += 1
+    cache.put("b", "gpt-4o", make_qna())
+    clock.now += 1
+    cache.get("a")  # a를 최근에 사용
+    clock.now += 1
+    cache.put("c", "gpt-4o", make_qna())
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats().entries == 2
+
+
+def test_expired_entries_are_misses_and_evicted(clock: FakeClock) -> None:
+    cache = AnswerCache(max_age_seconds=60)
+    cache.put("old", "gpt-4o", make_qna())
+    clock.now += 30
+    cache.put("new", "gpt-4o", make_qna())
+    clock.now += 31
+
+    assert cache.evict() == 1
+    assert cache.get("old") is None
+    assert cache.get("new") is not None
+    clock.now += 60
+    assert cache.get("new") is None
+    assert cache.stats().entries == 0
+
+
+def test_clear_removes_everything(clock: FakeClock) -> None:
+    cache = AnswerCache()
+    cache.put("a", "gpt-4o", make_qna())
+    cache.put("b", "claude-3-5-sonnet-latest", make_qna())
+
+    assert cache.stats().models == {"gpt-4o": 1, "claude-3-5-sonnet-latest": 1}
+    assert cache.clear() == 2
+    assert cache.stats().entries == 0
+
+
+def test_cache_key_normalizes_whitespace_and_separates_models() -> None:
+    key = make_cache_key("gpt-4o", "VPC란  무엇인가요?\n")
+
+    assert key == make_cache_key("gpt-4o", "VPC란 무엇인가요?")
+    assert key != make_cache_key("gpt-4o-mini", "VPC란 무엇인가요?")
+
+
+def test_cache_key_separates_hedge_models() -> None:
+    key = make_cache_key("gpt-4o", "q")
+
+    assert make_cache_key("gpt-4o", "q", hedge_model=None) == key
+    assert make_cache_key("gpt-4o", "q", hedge_model="claude-3-5-haiku-latest") != key
+
+
+@pytest.mark.parametrize(
+    "setting", ["NATIVE_STRUCTURED_OUTPUT", "LOCAL_TAGS", "OPTIMIZE_IMAGES"]
+)
+def test_cache_key_changes_with_answer_settings(
+    setting: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    key = make_cache_key("gpt-4o", "q")
+    current = getattr(get_settings(), setting.lower())
+    monkeypatch.setenv(f"GONAGI_SAA_{setting}", str(not current).lower())
+    get_settings.cache_clear()
+
+    assert make_cache_key("gpt-4o", "q") != key
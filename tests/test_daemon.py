@@ -0,0 +1,60 @@
+import asyncio
+import io
+import threading
+
+import pytest
+
+from gonagi_saa import services
+from gonagi_saa.daemon import _RoutedStdout
+
+
+@pytest.fixture
+def stdout() -> tuple[_RoutedStdout, io.StringIO]:
+    # pytest가 sys.stdout을 바꿔 끼우므로 테스트에서는 file=로 직접 출력
+    fallback = io.StringIO()
+    return _RoutedStdout(fallback), fallback  # type: ignore[arg-type]
+
+
+def test_routes_lines_printed_on_the_hedge_loop(
+    stdout: tuple[_RoutedStdout, io.StringIO],
+) -> None:
+    routed, fallback = stdout
+    lines: list[str] = []
+
+    async def report() -> None:
+        print("헤지 루프에서 출력", file=routed)
+
+    with routed.route(lines.append):
+        print("요청 스레드에서 출력", file=routed)
+        services._run_on_hedge_loop(report())
+        print("끝", end="", file=routed)
+
+    assert lines == ["요청 스레드에서 출력", "헤지 루프에서 출력", "끝"]
+    assert fallback.getvalue() == ""
+
+
+def test_other_threads_keep_writing_to_the_fallback(
+    stdout: tuple[_RoutedStdout, io.StringIO],
+) -> None:
+    routed, fallback = stdout
+    lines: list[str] = []
+
+    with routed.route(lines.append):
+        thread = threading.Thread(target=print, args=("다른 요청",), kwargs={"file": routed})
+        thread.start()
+        thread.join()
+
+    assert lines == []
+    assert fallback.getvalue() == "다른 요청\n"
+
+
+def test_route_is_restored_after_the_request(
+    stdout: tuple[_RoutedStdout, io.StringIO],
+) -> None:
+    routed, fallback = stdout
+
+    with routed.route(lambda line: None):
+        pass
+    asyncio.run(asyncio.to_thread(print, "로그 파일", file=routed))
+
+    assert fallback.getvalue() == "로그 파일\n"
@@ -0,0 +1,53 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from benchmarks.stubs import SAMPLE_ANSWER, FakeChatModel
+from gonagi_saa import services
+from gonagi_saa.models import QnAModel
+from gonagi_saa.settings import get_settings
+
+PRIMARY, HEDGE = "gpt-4o", "claude-3-5-sonnet-latest"
+
+
+@pytest.fixture(autouse=True)
+def models(monkeypatch: pytest.MonkeyPatch) -> None:
+    """기본 모델은 첫 토큰이 늦지만 빨리 끝나고, 헤지 모델은 먼저 스트리밍하지만 늦게 끝남"""
+    monkeypatch.setenv("GONAGI_SAA_HEDGE_MODEL", HEDGE)
+    monkeypatch.setenv("GONAGI_SAA_HEDGE_DELAY_SECONDS", "0.1")
+    get_settings.cache_clear()
+    fakes = {
+        PRIMARY: FakeChatModel(
+            first_token_latency=0.4,
+            token_delay=0,
+            answer={**SAMPLE_ANSWER, "title": "PRIMARY"},
+        ),
+        HEDGE: FakeChatModel(
+            first_token_latency=0.05,
+            token_delay=0.01,
+            answer={**SAMPLE_ANSWER, "title": "HEDGE"},
+        ),
+    }
+    monkeypatch.setattr(services, "llm_model_factory", fakes.__getitem__)
+
+
+def _answer(on_partial: Any = None) -> QnAModel:
+    return asyncio.run(
+        services.answer_question_async(
+            PRIMARY, "q", on_partial=on_partial, use_cache=False, verbose=False
+        )
+    )
+
+
+def test_streamed_answer_is_the_returned_answer() -> None:
+    partials: list[dict[str, Any]] = []
+    result = _answer(partials.append)
+
+    streamed_titles = [partial["title"] for partial in partials if partial.get("title")]
+    assert result.title == "HEDGE"
+    assert streamed_titles and all("HEDGE".startswith(title) for title in streamed_titles)
+
+
+def test_without_streaming_first_finished_answer_wins() -> None:
+    assert _answer().title == "PRIMARY"
@@ -0,0 +1,105 @@
+import threading
+
+import pytest
+
+from gonagi_saa import history as history_module
+from gonagi_saa.history import build_history_window, count_tokens
+from gonagi_saa.models import QnAModel
+from gonagi_saa.settings import get_settings
+from tests.conftest import make_qna
+
+# 근사치로 토큰을 세는 제공자 (tiktoken 유무와 관계없이 결과가 같음)
+MODEL = "claude-3-5-sonnet-latest"
+
+
+def _turns(count: int, answer: str = "a" * 40) -> list[QnAModel]:
+    return [
+        make_qna(title=f"제목{i}", question=f"q{i}", answer=answer, tags=[f"T{i}"])
+        for i in range(count)
+    ]
+
+
+def test_empty_history() -> None:
+    window = build_history_window(None, MODEL)
+
+    assert window.recent == [] and window.summary == [] and window.tokens == 0
+    assert window.to_messages() == []
+
+
+def test_keeps_recent_turns_and_summarizes_older_ones() -> None:
+    history = _turns(5)
+    window = build_history_window(history, MODEL, max_turns=2, token_budget=10_000)
+
+    assert window.recent == history[3:]
+    assert window.summary == ["- 제목0 (T0)", "- 제목1 (T1)", "- 제목2 (T2)"]
+    assert (window.compacted_turns, window.dropped_turns) == (3, 0)
+
+
+def test_compacts_oldest_recent_turns_when_over_budget() -> None:
+    history = _turns(3)
+    turn_tokens = count_tokens("q0\n" + "a" * 40, MODEL)
+    summary_tokens = count_tokens("- 제목0 (T0)", MODEL)
+    window = build_history_window(
+        history, MODEL, max_turns=3, token_budget=2 * turn_tokens + summary_tokens
+    )
+
+    assert window.recent == history[1:]
+    assert window.summary == ["- 제목0 (T0)"]
+    assert window.tokens <= 2 * turn_tokens + summary_tokens
+
+
+def test_drops_oldest_summaries_when_still_over_budget() -> None:
+    history = _turns(4, answer="a" * 400)
+    summary_tokens = count_tokens("- 제목0 (T0)", MODEL)
+    window = build_history_window(history, MODEL, max_turns=1, token_budget=2 * summary_tokens)
+
+    # 원문 턴 하나도 예산을 넘으므로 모두 압축되고, 요약은 최근 것부터 남음
+    assert window.recent == []
+    assert window.summary == ["- 제목2 (T2)", "- 제목3 (T3)"]
+    assert (window.compacted_turns, window.dropped_turns) == (2, 2)
+    assert window.tokens <= 2 * summary_tokens
+
+
+def test_to_messages_puts_summary_before_recent_turns() -> None:
+    history = _turns(2)
+    messages = build_history_window(history, MODEL, max_turns=1, token_budget=10_000).to_messages()
+
+    assert [message.type for message in messages] == ["human", "ai", "human", "ai"]
+    assert "- 제목0 (T0)" in messages[0].content
+    assert messages[2].content == "q1"
+
+
+def test_uses_settings_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GONAGI_SAA_HISTORY_MAX_TURNS", "1")
+    get_settings.cache_clear()
+    window = build_history_window(_turns(3), MODEL)
+
+    assert len(window.recent) == 1
+    assert window.compacted_turns == 2
+
+
+class FakeEncoding:
+    def encode(self, text: str, disallowed_special: tuple = ()) -> list[str]:
+        return text.split()
+
+
+def test_slow_tiktoken_load_falls_back_to_approximation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loaded = threading.Event()
+
+    def load(model_name: str) -> FakeEncoding:
+        loaded.wait(5)
+        return FakeEncoding()
+
+    monkeypatch.setattr(history_module, "_load_encoding", load)
+    monkeypatch.setattr(history_module, "_encodings", {})
+    monkeypatch.setattr(history_module, "TIKTOKEN_LOAD_TIMEOUT", 0.01)
+    text = "aaaa bbbb cccc dddd"
+
+    # 인코딩을 내려받는 동안에는 기다리지 않고 근사치 사용
+    assert count_tokens(text, "gpt-4o") == count_tokens(text, MODEL)
+
+    loaded.set()
+    history_module._encodings["gpt-4o"].result(timeout=5)
+    assert count_tokens(text, "gpt-4o") == 4
@@ -0,0 +1,19 @@
+from gonagi_saa.image_store import _MEMORY_CACHE_SIZE, ImageStore
+
+
+def test_encoded_caches_are_bounded(tmp_path, monkeypatch):
+    monkeypatch.setenv("GONAGI_SAA_OPTIMIZE_IMAGES", "false")
+    store = ImageStore()
+    paths = []
+    for i in range(_MEMORY_CACHE_SIZE + 3):
+        path = tmp_path / f"{i}.png"
+        path.write_bytes(f"image-{i}".encode())
+        paths.append(str(path))
+        store.encoded(str(path))
+        store.encoded(str(path), (64, 64))
+
+    assert len(store._raw) <= _MEMORY_CACHE_SIZE
+    assert len(store._encoded) == _MEMORY_CACHE_SIZE
+    assert len(store._latest) == _MEMORY_CACHE_SIZE
+    # 가장 최근 항목은 남아 있어 다시 인코딩하지 않음
+    assert store.encoded(paths[-1]) is store._latest[store.digest(paths[-1])]
@@ -0,0 +1,135 @@
+import asyncio
+import mmap
+import os
+from email.parser import BytesParser
+from pathlib import Path
+
+import pytest
+
+from gonagi_saa.constants import UPLOAD_CHUNK_SIZE
+from gonagi_saa.multipart import MultipartBody
+
+CONTENT = bytes(range(256)) * 4096  # 1MB, 여러 청크에 걸치도록
+
+
+def _body(content: bytes | mmap.mmap = CONTENT) -> MultipartBody:
+    return MultipartBody(
+        {"key": "secret", "expiration": "600"}, "image", 'dia"gram.png', content, "image/png"
+    )
+
+
+def _parse(body: MultipartBody, data: bytes) -> dict[str, tuple[str | None, bytes]]:
+    """표준 MIME 파서로 필드별 (파일명, 내용) 추출"""
+    message = BytesParser().parsebytes(
+        f"Content-Type: {body.content_type}\r\n\r\n".encode() + data
+    )
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_filename(),
+            part.get_payload(decode=True),
+        )
+        for part in message.get_payload()
+    }
+
+
+def _body_bytes(body: MultipartBody) -> bytes:
+    position = body.tell()
+    body.seek(0)
+    data = body.read()
+    body.seek(position)
+    return data
+
+
+def test_read_returns_valid_multipart_form() -> None:
+    body = _body()
+    fields = _parse(body, body.read())
+
+    assert fields["key"] == (None, b"secret")
+    assert fields["expiration"] == (None, b"600")
+    assert fields["image"] == ("diagram.png", CONTENT)
+
+
+def test_len_matches_bytes_read() -> None:
+    body = _body()
+
+    assert len(body) == len(body.read())
+    assert body.tell() == len(body)
+    assert body.read() == b""
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096, UPLOAD_CHUNK_SIZE])
+def test_chunked_reads_concatenate_to_full_body(size: int) -> None:
+    body = _body()
+    expected = _body_bytes(body)
+
+    chunks = []
+    while chunk := body.read(size):
+        assert len(chunk) <= size
+        chunks.append(chunk)
+
+    assert b"".join(chunks) == expected
+
+
+def test_iter_yields_upload_sized_chunks() -> None:
+    body = _body()
+    chunks = list(body)
+
+    assert all(len(chunk) <= UPLOAD_CHUNK_SIZE for chunk in chunks)
+    assert sum(map(len, chunks)) == len(body)
+
+
+def test_seek_allows_resending_from_start() -> None:
+    body = _body()
+    first = body.read()
+
+    assert body.seek(0) == 0
+    assert body.read() == first
+
+
+def test_seek_whence_and_clamping() -> None:
+    body = _body()
+    data = _body_bytes(body)
+
+    assert body.seek(-10, os.SEEK_END) == len(body) - 10
+    assert body.read() == data[-10:]
+    assert body.seek(5) == 5
+    assert body.seek(3, os.SEEK_CUR) == 8
+    assert body.read(4) == data[8:12]
+    assert body.seek(-100) == 0
+    assert body.seek(10, os.SEEK_END) == len(body)
+
+
+def test_reads_from_mmap_without_copying_file(tmp_path: Path) -> None:
+    path = tmp_path / "image.png"
+    path.write_bytes(CONTENT)
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        body = _body(mapped)
+        assert _parse(body, body.read())["image"][1] == CONTENT
+
+
+def test_works_as_requests_file_like_body() -> None:
+    # requests는 read()와 len()/tell()/seek()로 본문 길이를 계산해 Content-Length를 붙임
+    from requests.utils import super_len
+
+    body = _body()
+    assert super_len(body) == len(body)
+    body.read(100)
+    assert super_len(body) == len(body) - 100
+
+
+async def _collect(body: MultipartBody) -> bytes:
+    return b"".join([chunk async for chunk in body.aiter()])
+
+
+def test_aiter_streams_whole_body() -> None:
+    body = _body()
+    assert asyncio.run(_collect(body)) == _body_bytes(body)
+
+
+def test_empty_file() -> None:
+    body = _body(b"")
+    data = body.read()
+
+    assert len(data) == len(body)
+    assert _parse(body, data)["image"][1] == b""
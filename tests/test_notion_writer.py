@@ -0,0 +1,43 @@
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from notion_client import APIErrorCode, APIResponseError
+
+from gonagi_saa import notion_writer
+from gonagi_saa.notion_writer import NotionWriter
+from gonagi_saa.ratelimit import TokenBucket
+
+
+def _api_error(status: int) -> APIResponseError:
+    request = httpx.Request("PATCH", "https://api.notion.com/v1/pages/page-1")
+    response = httpx.Response(status, request=request)
+    return APIResponseError(response, "error", APIErrorCode.ObjectNotFound)
+
+
+def test_failed_append_discards_page_and_reports_discard_failure(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(notion_writer, "notion_rate_limiter", lambda: TokenBucket(1000))
+
+    def create(**kwargs: object) -> dict:
+        return {"id": "page-1"}
+
+    def append(**kwargs: object) -> dict:
+        raise _api_error(400)
+
+    def update(**kwargs: object) -> dict:
+        raise _api_error(404)
+
+    client = SimpleNamespace(
+        pages=SimpleNamespace(create=create, update=update),
+        blocks=SimpleNamespace(children=SimpleNamespace(append=append)),
+    )
+    children = [{"type": "paragraph"}] * (notion_writer.NOTION_MAX_CHILDREN + 1)
+
+    with pytest.raises(APIResponseError) as raised:
+        NotionWriter(client).create_page(children)  # type: ignore[arg-type]
+
+    # 보관 처리 실패가 원래 오류를 가리지 않고, 페이지 id와 함께 경고로 남음
+    assert raised.value.status == 400
+    assert "page-1" in capsys.readouterr().err
@@ -0,0 +1,268 @@
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+from notion_client import APIErrorCode, APIResponseError
+
+from gonagi_saa import notion_writer, outbox, services
+from gonagi_saa.constants import NOTION_ENTRY_PROPERTY
+from gonagi_saa.outbox import DONE, PENDING, SENDING, UNCERTAIN, Outbox
+from gonagi_saa.ratelimit import TokenBucket
+from tests.conftest import make_qna
+
+
+class FakeNotion:
+    """databases.retrieve/update/query만 흉내 내는 Notion 클라이언트 (Entry 값으로 페이지 검색)"""
+
+    def __init__(self, has_entry_property: bool = True) -> None:
+        self.properties: dict[str, Any] = {"title": {"title": {}}}
+        if has_entry_property:
+            self.properties[NOTION_ENTRY_PROPERTY] = {"rich_text": {}}
+        self.pages: dict[str, str] = {}  # Entry 값 → 페이지 id
+        self.retrieved = 0
+        self.databases = SimpleNamespace(
+            retrieve=self.retrieve, update=self.update, query=self.query
+        )
+
+    def retrieve(self, database_id: str) -> dict:
+        self.retrieved += 1
+        return {"id": database_id, "properties": dict(self.properties)}
+
+    def update(self, database_id: str, properties: dict) -> dict:
+        self.properties.update(properties)
+        return {"id": database_id}
+
+    def query(self, database_id: str, filter: dict, page_size: int) -> dict:
+        page_id = self.pages.get(filter["rich_text"]["equals"])
+        return {"results": [{"id": page_id}] if page_id else []}
+
+
+class FakeSaver:
+    """services.save_to_notion 대역 (실패를 지정하지 않으면 페이지를 만들고 id 반환)"""
+
+    def __init__(self, notion: FakeNotion) -> None:
+        self.notion = notion
+        self.calls: list[str] = []
+        self.error: Exception | None = None
+        self.create_before_error = False
+
+    def __call__(
+        self, notion_client: Any, qna: Any, session_id: str, *args: Any, **kwargs: Any
+    ) -> str:
+        entry_id = kwargs["entry_id"]
+        self.calls.append(entry_id)
+        page_id = f"page-{len(self.calls)}"
+        if self.error is not None:
+            if self.create_before_error:
+                self.notion.pages[entry_id] = page_id
+            raise self.error
+        self.notion.pages[entry_id] = page_id
+        return page_id
+
+
+def _api_error(status: int) -> APIResponseError:
+    request = httpx.Request("POST", "https://api.notion.com/v1/pages")
+    response = httpx.Response(status, request=request)
+    return APIResponseError(response, "error", APIErrorCode.ValidationError)
+
+
+@pytest.fixture
+def notion(monkeypatch: pytest.MonkeyPatch) -> FakeNotion:
+    monkeypatch.setenv("GONAGI_SAA_NOTION_DATABASE_ID", "db")
+    monkeypatch.setattr(notion_writer, "notion_rate_limiter", lambda: TokenBucket(1000))
+    monkeypatch.setattr(outbox, "_entry_property_ready", {})
+    return FakeNotion()
+
+
+@pytest.fixture
+def saver(notion: FakeNotion, monkeypatch: pytest.MonkeyPatch) -> FakeSaver:
+    fake = FakeSaver(notion)
+    monkeypatch.setattr(services, "save_to_notion", fake)
+    return fake
+
+
+def _status(box: Outbox, entry_id: str) -> str:
+    return next(entry.status for entry in box.all_entries() if entry.id == entry_id)
+
+
+def test_enqueue_records_pending_entry(notion: FakeNotion) -> None:
+    box = Outbox()
+    entry_id = box.enqueue(make_qna(), "session", ["/tmp/a.png"])
+
+    [entry] = box.pending_entries()
+    assert (entry.id, entry.status, entry.attempts) == (entry_id, PENDING, 0)
+    assert entry.qna == make_qna()
+    assert entry.image_paths == ["/tmp/a.png"]
+    assert box.count_pending() == 1
+
+
+def test_send_marks_done_and_passes_entry_id(notion: FakeNotion, saver: FakeSaver) -> None:
+    box = Outbox()
+    entry_id = box.enqueue(make_qna(), "session")
+
+    assert box.send(notion, entry_id) == "page-1"  # type: ignore[arg-type]
+    assert saver.calls == [entry_id]
+    assert _status(box, entry_id) == DONE
+    assert box.count_pending() == 0
+    # 이미 저장된 항목은 다시 보내지 않음
+    assert box.send(notion, entry_id) is None  # type: ignore[arg-type]
+    assert saver.calls == [entry_id]
+
+
+def test_client_error_returns_to_pending(notion: FakeNotion, saver: FakeSaver) -> None:
+    box = Outbox()
+    entry_id = box.enqueue(make_qna(), "session")
+    saver.error = _api_error(400)
+
+    with pytest.raises(APIResponseError):
+        box.send(notion, entry_id)  # type: ignore[arg-type]
+
+    [entry] = box.pending_entries()
+    assert (entry.status, entry.attempts) == (PENDING, 1)
+    assert entry.last_error == "error"
+
+
+@pytest.mark.parametrize("error", [_api_error(502), TimeoutError("timed out")])
+def test_unknown_result_becomes_uncertain(
+    error: Exception, notion: FakeNotion, saver: FakeSaver
+) -> None:
+    box = Outbox()
+    entry_id = box.enqueue(make_qna(), "session")
+    saver.error = error
+
+    with pytest.raises(type(error)):
+        box.send(notion, entry_id)  # type: ignore[arg-type]
+
+    assert _status(box, entry_id) == UNCERTAIN
+
+
+def test_uncertain_retry_reuses_page_created_by_previous_attempt(
+    notion: FakeNotion, saver: FakeSaver
+) -> None:
+    box = Outbox()
+    entry_id = box.enqueue(make_qna(), "session")
+    saver.error, saver.create_before_error = TimeoutError(), True
+    with pytest.raises(TimeoutError):
+        box.send(notion, entry_id)  # type: ignore[arg-type]
+
+    saver.error = None
+    assert box.send(notion, entry_id) == "page-1"  # type: ignore[arg-type]
+    assert len(saver.calls) == 1
+    assert _status(box, entry_id) == DONE
+
+
+def test_uncertain_retry_sends_again_when_no_page_exists(
+    notion: FakeNotion, saver: FakeSaver
+) -> None:
+    box = Outbox()
+    entry_id = box.enqueue(make_qna(), "session")
+    saver.error = TimeoutError()
+    with pytest.raises(TimeoutError):
+        box.send(notion, entry_id)  # type: ignore[arg-type]
+
+    saver.error = None
+    assert box.send(notion, entry_id) == "page-2"  # type: ignore[arg-type]
+    assert _status(box, entry_id) == DONE
+
+
+def test_same_title_in_same_session_is_not_deduplicated(
+    notion: FakeNotion, saver: FakeSaver
+) -> None:
+    box = Outbox()
+    first = box.enqueue(make_qna(), "session")
+    second = box.enqueue(make_qna(), "session")
+
+    assert box.send(notion, first) != box.send(notion, second)  # type: ignore[arg-type]
+    assert saver.calls == [first, second]
+
+
+def test_entry_being_sent_elsewhere_is_skipped_until_stale(
+    notion: FakeNotion, saver: FakeSaver
+) -> None:
+    box = Outbox()
+    entry_id = box.enqueue(make_qna(), "session")
+    box._update(entry_id, SENDING)
+
+    assert box.send(notion, entry_id) is None  # type: ignore[arg-type]
+    assert saver.calls == []
+
+    # 점유한 프로세스가 중단된 것으로 보이면 다시 가져와 전송
+    conn = box._connect()
+    with conn:
+        conn.execute(
+            "UPDATE entries SET updated_at = ?", (time.time() - outbox.STALE_CLAIM_SECONDS - 1,)
+        )
+    conn.close()
+    assert box.send(notion, entry_id) == "page-1"  # type: ignore[arg-type]
+
+
+def test_adds_missing_entry_property_once(saver: FakeSaver) -> None:
+    notion = FakeNotion(has_entry_property=False)
+    saver.notion = notion
+    box = Outbox()
+
+    box.send(notion, box.enqueue(make_qna(), "session"))  # type: ignore[arg-type]
+    box.send(notion, box.enqueue(make_qna(), "session"))  # type: ignore[arg-type]
+
+    assert notion.properties[NOTION_ENTRY_PROPERTY] == {"rich_text": {}}
+    assert notion.retrieved == 1
+
+
+def test_saves_without_entry_property_when_it_cannot_be_added(
+    saver: FakeSaver, capsys: pytest.CaptureFixture[str]
+) -> None:
+    notion = FakeNotion(has_entry_property=False)
+    saver.notion = notion
+
+    def forbid(database_id: str, properties: dict) -> dict:
+        raise _api_error(403)
+
+    notion.databases.update = forbid
+    box = Outbox()
+    first = box.enqueue(make_qna(), "session")
+    second = box.enqueue(make_qna(), "session")
+
+    assert box.send(notion, first) == "page-1"  # type: ignore[arg-type]
+    assert box.send(notion, second) == "page-2"  # type: ignore[arg-type]
+
+    assert saver.calls == [None, None]
+    assert notion.retrieved == 1
+    assert _status(box, first) == _status(box, second) == DONE
+    assert capsys.readouterr().err.count(NOTION_ENTRY_PROPERTY) == 1
+
+
+def test_property_check_failure_keeps_entry_retryable(
+    notion: FakeNotion, saver: FakeSaver
+) -> None:
+    box = Outbox()
+    entry_id = box.enqueue(make_qna(), "session")
+
+    def fail(database_id: str) -> dict:
+        raise _api_error(503)
+
+    notion.databases.retrieve = fail
+    with pytest.raises(APIResponseError):
+        box.send(notion, entry_id)  # type: ignore[arg-type]
+
+    assert _status(box, entry_id) == PENDING
+    assert saver.calls == []
+
+
+def test_flush_reports_sent_failed_and_remaining(notion: FakeNotion, saver: FakeSaver) -> None:
+    box = Outbox()
+    box.enqueue(make_qna(), "session")
+    box.enqueue(make_qna(), "session")
+    progress: list[Exception | None] = []
+
+    report = box.flush(
+        notion, lambda entry, error: progress.append(error)  # type: ignore[arg-type]
+    )
+    assert (report.sent, report.failed, report.remaining) == (2, 0, 0)
+    assert progress == [None, None]
+
+    box.enqueue(make_qna(), "session")
+    saver.error = _api_error(400)
+    report = box.flush(notion)  # type: ignore[arg-type]
+    assert (report.sent, report.failed, report.remaining) == (0, 1, 1)
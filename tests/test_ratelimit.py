@@ -0,0 +1,125 @@
+import asyncio
+
+import pytest
+
+from gonagi_saa import ratelimit
+from gonagi_saa.ratelimit import TokenBucket, get_rate_limiter
+
+
+class FakeClock:
+    """time 모듈 대신 쓰는 시계 (sleep하면 그만큼 시간이 흐름)"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.slept: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(ratelimit, "time", fake)
+    return fake
+
+
+def test_rejects_non_positive_rate() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_capacity_defaults_to_rate_but_at_least_one() -> None:
+    assert TokenBucket(5).capacity == 5
+    assert TokenBucket(0.5).capacity == 1.0
+
+
+def test_burst_up_to_capacity_then_waits_for_refill(clock: FakeClock) -> None:
+    bucket = TokenBucket(rate=2, capacity=2)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert clock.slept == [pytest.approx(0.5)]
+
+
+def test_reservations_queue_in_order(clock: FakeClock) -> None:
+    bucket = TokenBucket(rate=1, capacity=1)
+    bucket.acquire()
+
+    # 부족분을 미리 차감하므로 나중에 예약한 요청이 더 오래 기다림
+    assert bucket._reserve(1) == pytest.approx(1.0)
+    assert bucket._reserve(1) == pytest.approx(2.0)
+
+
+def test_refill_is_capped_at_capacity(clock: FakeClock) -> None:
+    bucket = TokenBucket(rate=1, capacity=2)
+    bucket.acquire(2)
+    clock.now += 60
+
+    assert bucket.acquire(2) == 0.0
+    assert bucket.acquire() == pytest.approx(1.0)
+
+
+def test_try_acquire_never_waits(clock: FakeClock) -> None:
+    bucket = TokenBucket(rate=1, capacity=1)
+
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert clock.slept == []
+
+    clock.now += 1
+    assert bucket.try_acquire()
+
+
+def test_try_acquire_does_not_take_tokens_reserved_by_acquire(clock: FakeClock) -> None:
+    bucket = TokenBucket(rate=1, capacity=1)
+    bucket.acquire()
+    bucket._reserve(1)
+    clock.now += 1
+
+    # 1초 뒤 채워진 토큰은 먼저 예약한 요청의 몫
+    assert not bucket.try_acquire()
+
+
+async def _acquire_async(bucket: TokenBucket) -> float:
+    return await bucket.acquire_async()
+
+
+def test_acquire_async_waits_without_blocking(clock: FakeClock) -> None:
+    bucket = TokenBucket(rate=10, capacity=1)
+    bucket.acquire()
+
+    assert asyncio.run(_acquire_async(bucket)) == pytest.approx(0.1)
+    assert clock.slept == []
+
+
+def test_get_rate_limiter_is_shared_per_name() -> None:
+    limiter = get_rate_limiter("test-shared", 5)
+
+    assert get_rate_limiter("test-shared", 5) is limiter
+    assert get_rate_limiter("test-other", 5) is not limiter
+
+
+def test_get_rate_limiter_follows_changed_rate() -> None:
+    limiter = get_rate_limiter("test-changed", 1)
+
+    assert get_rate_limiter("test-changed", 10) is limiter
+    assert limiter.rate == 10
+    assert limiter.capacity == 10
+
+
+def test_set_rate_keeps_tokens_earned_at_old_rate(clock: FakeClock) -> None:
+    bucket = TokenBucket(rate=1, capacity=5)
+    bucket.acquire(5)
+    clock.now += 2
+
+    bucket.set_rate(10)
+    # 변경 전 2초 동안은 초당 1개씩만 쌓임
+    assert bucket.try_acquire(2)
+    assert not bucket.try_acquire(1)
+    assert bucket.capacity == 5
@@ -0,0 +1,77 @@
+import pytest
+
+from gonagi_saa.tags import (
+    MAX_TAGS,
+    TagMatcher,
+    extract_tags,
+    find_tags,
+    normalize_tags,
+)
+from tests.conftest import make_qna
+
+
+def test_matcher_finds_overlapping_aliases() -> None:
+    matcher = TagMatcher({"he": "HE", "she": "SHE", "hers": "HERS", "his": "HIS"})
+
+    assert sorted(matcher.finditer("ushers")) == [
+        (1, 4, "SHE"),
+        (2, 4, "HE"),
+        (2, 6, "HERS"),
+    ]
+
+
+def test_matcher_follows_failure_links_across_partial_matches() -> None:
+    matcher = TagMatcher({"abcd": "ABCD", "bcx": "BCX"})
+
+    assert list(matcher.finditer("abcx")) == [(1, 4, "BCX")]
+
+
+def test_matcher_without_aliases_finds_nothing() -> None:
+    assert list(TagMatcher({}).finditer("anything")) == []
+
+
+def test_find_tags_matches_aliases_case_insensitively() -> None:
+    found = find_tags("Simple Queue Service로 디커플링하고 lambda를 씁니다")
+
+    assert [tag for _, tag in found] == ["SQS", "디커플링", "Lambda"]
+
+
+def test_find_tags_requires_ascii_word_boundaries() -> None:
+    assert find_tags("ECS2 or MECS") == []
+    assert [tag for _, tag in find_tags("ECS, EKS")] == ["ECS", "EKS"]
+
+
+def test_find_tags_accepts_korean_particles() -> None:
+    assert [tag for _, tag in find_tags("서브넷을 나누고 람다로 처리")] == ["Subnet", "Lambda"]
+
+
+def test_find_tags_prefers_leftmost_longest_alias() -> None:
+    assert [tag for _, tag in find_tags("S3 Glacier Deep Archive에 보관")] == ["S3 Glacier"]
+
+
+@pytest.mark.parametrize("text", ["Redis 클러스터", "Memcached", "가용성이 높음", "캐시 무효화"])
+def test_find_tags_ignores_ambiguous_words(text: str) -> None:
+    assert find_tags(text) == []
+
+
+def test_extract_tags_ranks_by_count_then_first_position() -> None:
+    qna = make_qna(
+        answer="Lambda와 SQS를 연결합니다. SQS는 재시도하고 VPC 안의 Lambda가 처리합니다.",
+        exam_tips=["SQS FIFO Queue는 순서를 보장합니다."],
+        common_traps=[],
+    )
+
+    assert extract_tags(qna) == ["SQS", "Lambda", "VPC"]
+
+
+def test_extract_tags_respects_limit() -> None:
+    qna = make_qna(answer="EC2 S3 EBS EFS RDS VPC IAM KMS SNS SQS", exam_tips=[], common_traps=[])
+
+    assert len(extract_tags(qna)) == MAX_TAGS
+    assert extract_tags(qna, limit=2) == ["EC2", "S3"]
+
+
+def test_normalize_tags_maps_aliases_and_dedupes() -> None:
+    tags = ["Amazon Simple Queue Service", "sqs", "AWS Lambda", "서브넷", "Custom Tag", " "]
+
+    assert normalize_tags(tags) == ["SQS", "Lambda", "Subnet", "Custom Tag"]
@@ -0,0 +1,55 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from gonagi_saa import services, utils
+from gonagi_saa.settings import get_settings
+from gonagi_saa.warmup import ConnectionWarmer
+
+PRIMARY, HEDGE = "gpt-4o", "claude-3-5-sonnet-latest"
+
+
+class FakeAsyncHttpClient:
+    def __init__(self, name: str, warmed: dict[str, asyncio.AbstractEventLoop]) -> None:
+        self.name = name
+        self.warmed = warmed
+
+    async def head(self, url: str, timeout: float) -> None:
+        self.warmed[self.name] = asyncio.get_running_loop()
+        if self.name == HEDGE:
+            raise httpx.ConnectError("refused")
+
+
+@pytest.fixture
+def warmed(monkeypatch: pytest.MonkeyPatch) -> dict[str, asyncio.AbstractEventLoop]:
+    monkeypatch.setenv("GONAGI_SAA_HEDGE_MODEL", HEDGE)
+    get_settings.cache_clear()
+    warmed: dict[str, asyncio.AbstractEventLoop] = {}
+
+    def factory(name: str) -> SimpleNamespace:
+        sdk_client = SimpleNamespace(
+            _client=FakeAsyncHttpClient(name, warmed), base_url=f"https://{name}"
+        )
+        return SimpleNamespace(root_async_client=sdk_client)
+
+    monkeypatch.setattr(utils, "llm_model_factory", factory)
+    return warmed
+
+
+def test_warms_async_clients_on_the_hedge_loop(
+    warmed: dict[str, asyncio.AbstractEventLoop],
+) -> None:
+    warmer = ConnectionWarmer(PRIMARY, notion=False)
+    warmer._warm(warmer._targets(), warmer._hedge_models())
+
+    # 연결 실패는 무시하고, 두 모델 모두 answer_question이 쓰는 헤지 루프에서 준비됨
+    assert set(warmed) == {PRIMARY, HEDGE}
+    assert all(loop is services.hedge_event_loop() for loop in warmed.values())
+
+
+def test_skips_hedge_loop_without_hedging(warmed: dict[str, asyncio.AbstractEventLoop]) -> None:
+    warmer = ConnectionWarmer(PRIMARY, notion=False, hedge=False)
+
+    assert warmer._hedge_models() == []